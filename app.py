@@ -1,11 +1,34 @@
 import streamlit as st
 import pandas as pd
-import plotly.graph_objs as go
-from plotly.subplots import make_subplots
+import numpy as np
+import functools
 import time
 import os
+import uuid
+import ccxt
+import threading
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
 from datetime import datetime
 from indicators.rsi import rsi
+from indicators.cache import frame_key
+from ui.charts import PLOTLY_CONFIG, SPARKLINE_CONFIG
+from ui.markets import DEFAULT_EXCHANGE_META, EXCHANGE_META, EXCHANGES
+from ui.templates import (
+    ACCOUNT_TAB_HTML, ACCOUNT_VALIDATED_HTML, ANALYSIS_TOOLS_HEADER_HTML,
+    APP_CSS, ARB_DISABLED_HTML, ARB_SCANNER_HEADER_HTML, DASHBOARD_HEADER_HTML,
+    ERROR_LOG_HEADER_HTML, FOOTER_HTML, INDICATORS_HEADER_HTML,
+    INDICATOR_TRENDS_HEADER_HTML, MARKET_DATA_ERROR_TEMPLATE,
+    MARKET_DATA_HEADER_HTML, NO_ARB_OPPORTUNITIES_HTML, NO_ERRORS_HTML,
+    NO_OPEN_ORDERS_HTML, NO_OPEN_POSITION_HTML, NO_ORDERS_HTML,
+    NO_POSITIONS_HTML, NO_REAL_TRADES_HTML, NO_RECENT_TRADES_HTML,
+    NO_SIM_TRADES_HTML, ORDER_MANAGEMENT_HEADER_HTML,
+    ORDER_MANAGEMENT_LOCKED_HTML, ORDER_MANAGEMENT_PAPER_HTML,
+    PAPER_MODE_BANNER_HTML, PRICE_CHART_HEADER_HTML, REAL_MODE_BANNER_HTML,
+    REAL_TRADES_HEADER_HTML, RECENT_TRADES_HEADER_HTML, SIDEBAR_HEADER_HTML,
+    SIM_TRADES_HEADER_HTML, TRADING_STATUS_HEADER_HTML,
+    render_balance, render_orders, render_positions,
+)
 
 def display_account_balance(paper_mode: bool, real_account_data: dict = None):
     """
@@ -19,107 +42,359 @@ def display_account_balance(paper_mode: bool, real_account_data: dict = None):
         real_cash = usdt_balance.get('free', 0)
         real_total = usdt_balance.get('total', 0)
         real_used = usdt_balance.get('used', 0)
-        
-        return f"""
-        <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
-                    border: 1px solid var(--border-color); margin: 1rem 0;">
-            <div style="text-align: center; margin-bottom: 1rem;">
-                <h4 style="margin: 0; color: var(--text-primary); display: flex; align-items: center; 
-                           justify-content: center; gap: 0.5rem;">
-                    💰 Real Account Balance
-                </h4>
-            </div>
-            <div style="text-align: center; margin-bottom: 1rem;">
-                <div style="font-size: 2rem; font-weight: 700; color: var(--accent-green);">
-                    ${real_cash:,.2f}
-                </div>
-                <div style="font-size: 0.9rem; color: var(--text-secondary);">Total Balance</div>
-            </div>
-            <div style="display: grid; gap: 0.5rem;">
-                <div style="display: flex; justify-content: space-between;">
-                    <span style="color: var(--text-secondary);">Available:</span>
-                    <span style="color: var(--accent-green); font-weight: 600;">${real_cash:,.2f}</span>
-                </div>
-                <div style="display: flex; justify-content: space-between;">
-                    <span style="color: var(--text-secondary);">In Orders:</span>
-                    <span style="color: var(--accent-blue); font-weight: 600;">${real_used:,.2f}</span>
-                </div>
-                <div style="display: flex; justify-content: space-between;">
-                    <span style="color: var(--text-secondary);">Total:</span>
-                    <span style="color: var(--text-primary); font-weight: 600;">${real_total:,.2f}</span>
-                </div>
-            </div>
-        </div>
-        """
+        return render_balance('real', round(float(real_cash or 0), 2), round(float(real_used or 0), 2), round(float(real_total or 0), 2))
     elif not paper_mode:
         # Real trading mode but no account data yet
-        return f"""
-        <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
-                    border: 1px solid var(--border-color); margin: 1rem 0;">
-            <div style="text-align: center; margin-bottom: 1rem;">
-                <h4 style="margin: 0; color: var(--text-primary); display: flex; align-items: center; 
-                           justify-content: center; gap: 0.5rem;">
-                    💰 Real Account Balance
-                </h4>
-            </div>
-            <div style="text-align: center; margin-bottom: 1rem;">
-                <div style="font-size: 1.5rem; font-weight: 700; color: var(--text-secondary);">
-                    Loading...
-                </div>
-                <div style="font-size: 0.9rem; color: var(--text-secondary);">Connecting to exchange</div>
-            </div>
-            <div style="text-align: center;">
-                <div style="color: var(--text-secondary); font-size: 0.8rem;">
-                    Balance will appear automatically when connected
-                </div>
-            </div>
-        </div>
-        """
+        return render_balance('loading')
     else:
         # Paper trading mode
         account = st.session_state.get('account', {'cash': 10000, 'equity': [10000]})
         paper_cash = account.get('cash', 10000)
         paper_equity = account.get('equity', [10000])[-1] if account.get('equity') else 10000
-        
-        return f"""
-        <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
-                    border: 1px solid var(--border-color); margin: 1rem 0;">
-            <div style="text-align: center; margin-bottom: 1rem;">
-                <h4 style="margin: 0; color: var(--text-primary); display: flex; align-items: center; 
-                           justify-content: center; gap: 0.5rem;">
-                    📊 Paper Account Balance
-                </h4>
-            </div>
-            <div style="text-align: center; margin-bottom: 1rem;">
-                <div style="font-size: 2rem; font-weight: 700; color: var(--accent-blue);">
-                    ${paper_equity:,.2f}
-                </div>
-                <div style="font-size: 0.9rem; color: var(--text-secondary);">Paper Trading Balance</div>
-            </div>
-            <div style="display: grid; gap: 0.5rem;">
-                <div style="display: flex; justify-content: space-between;">
-                    <span style="color: var(--text-secondary);">Available Cash:</span>
-                    <span style="color: var(--accent-blue); font-weight: 600;">${paper_cash:,.2f}</span>
-                </div>
-                <div style="display: flex; justify-content: space-between;">
-                    <span style="color: var(--text-secondary);">Total Equity:</span>
-                    <span style="color: var(--text-primary); font-weight: 600;">${paper_equity:,.2f}</span>
-                </div>
-            </div>
-        </div>
-        """
-from indicators.wavetrend import wavetrend
-from signals.engine import align_signals
-from backtester.core import run_backtest
-from utils.logger import log_trade, log_pnl
-from utils.error_handler import error_handler, safe_execute, TradingError, APIError
+        return render_balance('paper', round(float(paper_cash), 2), total=round(float(paper_equity), 2))
+from utils.logger import log_trade, log_pnl_buffered
+from utils.error_handler import error_handler, errors_frame, safe_execute, TradingError, APIError
 from executor.ccxt_executor import CCXTExecutor
-from strategies.manager import StrategyManager
-from utils.risk import position_size_from_risk
 from arbitrage.engine import ArbitrageEngine
+from strategies.manager import StrategyManager
+from utils.risk import position_size_from_risk, should_exit_position
+from utils.equity import EquityBuffer
 from utils.configurable_risk import ConfigurableRiskManager, StopLossType
-from backtester.comprehensive_metrics import ComprehensiveMetricsCalculator
-from backtester.multi_timeframe_analyzer import MultiTimeframeAnalyzer
+
+
+# Plotting and optional subsystems are imported on first use so the sidebar
+# can render before plotly and the metrics modules are loaded.
+@functools.cache
+def _plotly():
+    import plotly.graph_objs as go
+    return go
+
+
+@functools.cache
+def _make_subplots():
+    from plotly.subplots import make_subplots
+    return make_subplots
+
+
+Creds = namedtuple('Creds', ['api_key', 'api_secret', 'passphrase'])
+
+@st.cache_resource(show_spinner=False)
+def _get_creds(ex_upper: str) -> Creds:
+    """API credentials from the environment (.env is loaded when the executor module is imported)."""
+    return Creds(
+        os.getenv(f"{ex_upper}_API_KEY"),
+        os.getenv(f"{ex_upper}_API_SECRET"),
+        os.getenv(f"{ex_upper}_PASSPHRASE"),
+    )
+
+@st.cache_resource(show_spinner=False)
+def get_executor(ex_name: str, paper: bool) -> CCXTExecutor:
+    """
+    Build the exchange executor once and reuse it across reruns.
+    Keyed on exchange and mode only; live credentials are resolved from the environment here.
+    """
+    api_key = api_secret = passphrase = None
+    if not paper:
+        api_key, api_secret, passphrase = _get_creds(ex_name.upper())
+        if ex_name.lower() != 'coinbase' or not (api_key and api_secret):
+            passphrase = None
+    exe = CCXTExecutor(ex_name, api_key, api_secret, paper=paper)
+    if passphrase and hasattr(exe.ex, 'options'):
+        # Coinbase requires the passphrase in the exchange options
+        exe.ex.options['passphrase'] = passphrase
+    return exe
+
+@st.cache_resource(show_spinner=False)
+def get_strategy_manager() -> StrategyManager:
+    """Strategy instances are stateless between calls, so one manager serves every rerun and session."""
+    return StrategyManager()
+
+_ARB_MAX_SCANNERS = 4
+
+def _arb_exchanges() -> dict:
+    """Public clients for one arbitrage scanner; they live as long as it does, so HTTP sessions survive reruns."""
+    return {'binance': ccxt.binance(), 'bybit': ccxt.bybit(), 'mexc': ccxt.mexc()}
+
+@st.cache_resource(show_spinner=False)
+def _arb_registry():
+    """Live arbitrage scanners by symbol, least recently used first, and the lock guarding them."""
+    return OrderedDict(), threading.Lock()
+
+def _arb_scanner(symbol: str) -> ArbitrageEngine:
+    """
+    Background arbitrage scanner for symbol; reruns only read its latest result.
+    At most _ARB_MAX_SCANNERS are kept and the least recently used one is stopped.
+    """
+    scanners, lock = _arb_registry()
+    with lock:
+        scanner = scanners.pop(symbol, None)
+        if scanner is None:
+            scanner = ArbitrageEngine(_arb_exchanges(), [symbol], threshold_bps=10.0)
+            scanner.start(interval=10.0)
+        scanners[symbol] = scanner
+        while len(scanners) > _ARB_MAX_SCANNERS:
+            _, evicted = scanners.popitem(last=False)
+            evicted.stop()
+    return scanner
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def list_symbols_cached(_exe: CCXTExecutor, ex_name: str, paper: bool, quote_currency: str) -> list:
+    """
+    Market listings barely change; reuse them for an hour instead of reloading markets every rerun.
+    An empty listing means the fetch failed, so it raises rather than being cached for the hour.
+    """
+    symbols = _exe.list_symbols(quote_currency)
+    if not symbols:
+        raise ValueError(f"No {quote_currency} symbols listed for {ex_name}")
+    return symbols
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def list_timeframes_cached(_exe: CCXTExecutor, ex_name: str, paper: bool) -> list:
+    """Supported timeframes for the exchange, cached alongside the symbol list; empty results are not cached."""
+    timeframes = _exe.list_timeframes()
+    if not timeframes:
+        raise ValueError(f"No timeframes listed for {ex_name}")
+    return timeframes
+
+def wt_cross_up(w1: np.ndarray, w2: np.ndarray) -> np.ndarray:
+    """True on bars where wt1 crosses above wt2, computed on raw arrays without index alignment."""
+    cross = np.zeros(len(w1), dtype=bool)
+    cross[1:] = (w1[:-1] <= w2[:-1]) & (w1[1:] > w2[1:])
+    return cross
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def compute_signals(_df: pd.DataFrame, data_key: tuple, strat_choice: str, return_mode: str,
+                    rsi_length: int, rsi_oversold: float, wt_channel: int, wt_avg: int) -> pd.DataFrame:
+    """
+    RSI, WaveTrend and strategy signal columns for the loaded bars.
+    Keyed on data_key (exchange, symbol, timeframe and a digest of the OHLCV columns) so the frame itself is never hashed.
+    """
+    from indicators.wavetrend import wavetrend
+    df = _df.copy()
+    df['rsi'] = rsi(df['close'], length=rsi_length)
+    
+    # Calculate hlc3 if columns exist
+    if set(['high', 'low', 'close']).issubset(df.columns):
+        df['hlc3'] = (df['high'] + df['low'] + df['close']) / 3.0
+        wt_input = df['hlc3']
+    else:
+        wt_input = df['close']
+    
+    # Compute wavetrend and ensure correct assignment
+    wt = wavetrend(wt_input, channel_length=wt_channel, average_length=wt_avg)
+    if isinstance(wt, pd.DataFrame):
+        df[['wt1', 'wt2']] = wt[['wt1', 'wt2']]
+    elif isinstance(wt, (list, tuple)) and len(wt) == 2:
+        df['wt1'], df['wt2'] = wt
+    else:
+        raise ValueError("wavetrend function returned unexpected output format")
+    
+    sm = get_strategy_manager()
+    
+    # Generate signals based on selected strategy
+    if strat_choice == 'ema_crossover':
+        sig_df = sm.strategies['ema_crossover'].generate_signals(df, return_mode=return_mode)
+        if return_mode == 'long_short':
+            df[['long', 'short']] = sig_df[['long', 'short']]
+        else:
+            df[['signal']] = sig_df[['signal']]
+    elif strat_choice == 'rsi_bbands':
+        df['signal'] = sm.strategies['rsi_bbands'].generate_signals(df, rsi_len=rsi_length)
+    elif strat_choice == 'grid':
+        df['signal'] = sm.strategies['grid'].generate_signals(df)
+    else:
+        # Auto strategy (and fallback): Combine RSI + WaveTrend signals
+        # Buy when RSI is oversold AND WaveTrend crosses up
+        rsi_oversold_condition = df['rsi'].to_numpy() < rsi_oversold
+        df['signal'] = rsi_oversold_condition & wt_cross_up(df['wt1'].to_numpy(), df['wt2'].to_numpy())
+    
+    return df[[c for c in df.columns if c not in _df.columns or c == 'signal']]
+
+CHART_MAX_BARS = 250
+
+def downsample_ohlc(df: pd.DataFrame, max_bars: int) -> pd.DataFrame:
+    """
+    Merge consecutive bars into at most max_bars candles for plotting.
+    Each group keeps its first open, high max, low min, last close and summed volume,
+    so wicks and the closing path survive; WaveTrend takes the group's last value.
+    """
+    step = -(-len(df) // max_bars)
+    if step <= 1:
+        return df
+    groups = np.arange(len(df)) // step
+    agg = {'timestamp': 'first', 'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last'}
+    agg.update({col: 'last' for col in ('wt1', 'wt2') if col in df.columns})
+    if 'volume' in df.columns:
+        agg['volume'] = 'sum'
+    return df.groupby(groups).agg(agg)
+
+_TIMEFRAME_UNIT_SECONDS = {'m': 60, 'h': 3600, 'd': 86400, 'D': 86400, 'w': 604800, 'W': 604800, 'M': 2592000}
+
+def timeframe_seconds(timeframe: str) -> int:
+    """Bar length in seconds for ccxt ('15m', '4h', '1d') and Bybit v5 ('15', '240', 'D') timeframes."""
+    if timeframe.isdigit():
+        return int(timeframe) * 60
+    count = timeframe[:-1]
+    return int(count or 1) * _TIMEFRAME_UNIT_SECONDS.get(timeframe[-1], 60) if (count or '1').isdigit() else 60
+
+@st.cache_data(ttl=300, max_entries=32, show_spinner=False)
+def fetch_ohlcv_cached(_exe: CCXTExecutor, ex_name: str, paper: bool, symbol: str, timeframe: str, limit: int, bucket: int) -> pd.DataFrame:
+    """OHLCV frame shared by every rerun that falls in the same refresh bucket."""
+    return _exe.fetch_ohlcv_df(symbol, timeframe=timeframe, limit=limit)
+
+def load_ohlcv(exe: CCXTExecutor, ex_name: str, paper: bool, symbol: str, timeframe: str, refresh_secs: int, limit: int = 500) -> pd.DataFrame:
+    """
+    Fetch bars through the cache so widget-driven reruns don't hit the exchange again.
+    The window is the shorter of the bar length and the refresh rate, keeping the forming candle current.
+    """
+    window = max(1, min(timeframe_seconds(timeframe), int(refresh_secs)))
+    return fetch_ohlcv_cached(exe, ex_name, paper, symbol, timeframe, limit, int(time.time() // window))
+
+@st.cache_data(ttl=300, max_entries=32, show_spinner=False)
+def fetch_ticker_cached(_exe: CCXTExecutor, ex_name: str, paper: bool, symbol: str, bucket: int) -> dict:
+    """Ticker snapshot shared by every rerun in the same refresh bucket."""
+    return _exe.fetch_ticker(symbol)
+
+@st.cache_data(show_spinner=False)
+def order_symbols(popular_pairs: tuple, popular_set: frozenset, symbols: tuple) -> tuple:
+    """
+    Put the listed popular pairs first (in popularity order), followed by every other symbol.
+    Uppercasing and membership run vectorized through pandas string ops and isin().
+    Returns the ordered list and a symbol -> position dict for O(1) default lookups.
+    """
+    idx = pd.Index(symbols, dtype=object)
+    mask = idx.str.upper().isin(popular_set)
+    listed_popular = frozenset(idx[mask].str.upper())
+    ordered = [pair for pair in popular_pairs if pair in listed_popular] + idx[~mask].tolist()
+    return ordered, {sym: i for i, sym in enumerate(ordered)}
+
+def _trades_key(trades: list, n: int) -> tuple:
+    """Hashable snapshot of the last n trade dicts, used as the trades_html cache key."""
+    return tuple(tuple(t.items()) for t in trades[-n:])
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def trades_html(trades: tuple) -> str:
+    """Trades table markup, rebuilt only when the shown trades change."""
+    return pd.DataFrame([dict(t) for t in trades]).to_html(escape=False, index=False)
+
+_ENTRY_CONDITIONS = {
+    'auto': ('RSI below oversold threshold ({rsi})', 'WaveTrend cross up (WT1 > WT2)'),
+    'ema_crossover': ('EMA Fast crosses above EMA Slow',),
+    'rsi_bbands': ('RSI below oversold threshold ({rsi})', 'Price below Bollinger Lower Band'),
+    'grid': ('Price crosses below grid level',),
+}
+
+@st.cache_data(show_spinner=False)
+def strategy_conditions_html(strategy: str, rsi_threshold, sl_display: str, tp_display: str, max_bars) -> str:
+    """Entry/Exit conditions lists for the Strategy tab, rebuilt only when the settings change."""
+    entry = "".join(f"<li>{c.format(rsi=rsi_threshold)}</li>" for c in _ENTRY_CONDITIONS.get(strategy, ()))
+    cross_down = "<li>WaveTrend cross down</li>" if strategy == 'auto' else ""
+    return f"""
+    <div class="conditions-list">
+        <h4>Entry Conditions</h4>
+        <ul>{entry}</ul>
+    </div>
+    <div class="conditions-list">
+        <h4>Exit Conditions</h4>
+        <ul>
+            <li>Stop Loss: {sl_display}</li>
+            <li>Take Profit: {tp_display}</li>
+            {cross_down}
+            <li>Max bars in trade: {max_bars}</li>
+        </ul>
+    </div>
+    """
+
+def _metrics_key(trades: list) -> tuple:
+    """Cheap fingerprint of the session trades: count plus the last trade, which exits update in place."""
+    return (len(trades), repr(trades[-1]) if trades else None)
+
+@st.cache_resource(show_spinner=False)
+def get_io_pool() -> ThreadPoolExecutor:
+    """Small worker pool for file exports so button handlers don't wait on disk writes."""
+    return ThreadPoolExecutor(max_workers=2)
+
+def _log_export_failure(filename: str, future):
+    """Done-callback for background exports, so a failed write lands in the error log instead of vanishing."""
+    exc = future.exception()
+    if exc is not None:
+        error_handler.log_error(exc, {"function": "export_metrics_to_csv", "filename": filename})
+
+@st.cache_resource(show_spinner=False)
+def get_metrics_calculator():
+    """One metrics calculator per process; it only backs the CSV export."""
+    from backtester.comprehensive_metrics import ComprehensiveMetricsCalculator
+    return ComprehensiveMetricsCalculator()
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def comprehensive_metrics(_trades: list, trades_key: tuple, equity: np.ndarray, initial_capital: float, risk_free_rate: float):
+    """Metrics and text report for the metrics tab, recomputed only when the trades or equity curve change."""
+    calculator = get_metrics_calculator()
+    metrics = calculator.calculate_comprehensive_metrics(
+        equity_curve=equity,
+        trades=list(_trades),
+        initial_capital=initial_capital,
+        risk_free_rate=risk_free_rate
+    )
+    return metrics, calculator.generate_comprehensive_report(metrics)
+
+def session_mtf_analyzer(primary_tf: str, secondary_tfs: list, tf_weights: dict):
+    """The session's multi-timeframe analyzer, rebuilt only when the MTF settings change."""
+    from backtester.multi_timeframe_analyzer import MultiTimeframeAnalyzer
+    ss = st.session_state
+    config = (primary_tf, tuple(secondary_tfs), tuple(sorted(tf_weights.items())))
+    if ss.get('mtf_config') != config:
+        ss['mtf_analyzer'] = MultiTimeframeAnalyzer(primary_tf, list(secondary_tfs), dict(tf_weights))
+        ss['mtf_config'] = config
+    return ss['mtf_analyzer']
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def mtf_summary_table(_analyzer, config: tuple) -> tuple:
+    """Timeframe summary and its configuration table, keyed on the analyzer's settings."""
+    summary = _analyzer.get_timeframe_summary()
+    return summary, pd.DataFrame(summary['timeframes'])
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def error_log_snapshot(version: int, limit: int) -> tuple:
+    """
+    Recent errors and their table, rebuilt only when the shared log's version changes.
+    A resource cache because error contexts may hold objects that can't be pickled.
+    """
+    recent = error_handler.get_recent_errors(limit)
+    return recent, errors_frame(recent)
+
+def _tail_scalars(df: pd.DataFrame, cols) -> dict:
+    """Numpy views of the given columns, so end-of-series reads skip the pandas indexers."""
+    return {c: df[c].to_numpy() for c in cols if c in df.columns}
+
+def compute_market_overview(close: pd.Series) -> dict:
+    """Last price plus bar and 24-bar changes for the market header."""
+    close = close.to_numpy()
+    last_close = float(close[-1]) if len(close) else 0.0
+    prev_close = float(close[-2]) if len(close) > 1 else last_close
+
+    # Calculate 24h change (last 24 bars for hourly data, or adjust based on timeframe)
+    if len(close) >= 24:
+        price_24h_ago = float(close[-24])
+        price_change_24h = last_close - price_24h_ago
+        price_change_24h_pct = (price_change_24h / price_24h_ago * 100) if price_24h_ago else 0
+    else:
+        # Fallback to previous bar if not enough data
+        price_change_24h = last_close - prev_close
+        price_change_24h_pct = (price_change_24h / prev_close * 100) if prev_close else 0
+
+    # Current bar change
+    price_change = last_close - prev_close
+    price_change_pct = (price_change / prev_close * 100) if prev_close else 0
+    return {
+        'last_close': last_close,
+        'prev_close': prev_close,
+        'price_change_24h': price_change_24h,
+        'price_change_24h_pct': price_change_24h_pct,
+        'price_change': price_change,
+        'price_change_pct': price_change_pct,
+        'up': price_change_24h >= 0,
+    }
 
 st.set_page_config(
     page_title="Multi-Exchange Trading Platform", 
@@ -129,266 +404,175 @@ st.set_page_config(
 )
 
 # Enhanced CSS styling
-st.markdown("""
-<style>
-    /* Import Google Fonts */
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-    
-    /* Root Variables */
-    :root {
-        --primary-bg: #0a0e1a;
-        --secondary-bg: #1a1f2e;
-        --card-bg: #252b3d;
-        --border-color: #2d3748;
-        --text-primary: #ffffff;
-        --text-secondary: #a0aec0;
-        --accent-green: #48bb78;
-        --accent-red: #f56565;
-        --accent-blue: #4299e1;
-        --accent-purple: #9f7aea;
-        --shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);
-        --border-radius: 12px;
-        --font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-    }
-    
-    /* Global Styles */
-    .main .block-container {
-        padding-top: 2rem;
-        padding-bottom: 2rem;
-        max-width: 1400px;
-    }
-    
-    /* Sidebar Styling */
-    .css-1d391kg {
-        background-color: var(--primary-bg);
-        border-right: 1px solid var(--border-color);
-    }
-    
-    /* Custom Sidebar Header */
-    .sidebar-header {
-        background: linear-gradient(135deg, var(--accent-blue), var(--accent-purple));
-        padding: 1.5rem;
-        margin: -1rem -1rem 2rem -1rem;
-        border-radius: 0 0 var(--border-radius) var(--border-radius);
-        text-align: center;
-    }
-    
-    .sidebar-header h1 {
-        color: white;
-        font-size: 1.5rem;
-        font-weight: 700;
-        margin: 0;
-        text-shadow: 0 2px 4px rgba(0,0,0,0.3);
-    }
-    
-    .sidebar-header .subtitle {
-        color: rgba(255,255,255,0.8);
-        font-size: 0.875rem;
-        margin-top: 0.25rem;
-    }
-    
-    /* Section Headers */
-    .section-header {
-        background: var(--card-bg);
-        padding: 0.75rem 1rem;
-        margin: 1rem -1rem 1rem -1rem;
-        border-left: 4px solid var(--accent-blue);
-        border-radius: 0 var(--border-radius) var(--border-radius) 0;
-        font-weight: 600;
-        color: var(--text-primary);
-        font-size: 0.95rem;
-    }
-    
-    /* Control Groups */
-    .control-group {
-        background: var(--secondary-bg);
-        padding: 1rem;
-        border-radius: var(--border-radius);
-        margin-bottom: 1rem;
-        border: 1px solid var(--border-color);
-    }
-    
-    /* Status Indicators */
-    .status-indicator {
-        display: inline-flex;
-        align-items: center;
-        gap: 0.5rem;
-        padding: 0.5rem 1rem;
-        border-radius: 20px;
-        font-size: 0.875rem;
-        font-weight: 500;
-    }
-    
-    .status-trading {
-        background: rgba(72, 187, 120, 0.1);
-        color: var(--accent-green);
-        border: 1px solid var(--accent-green);
-    }
-    
-    .status-stopped {
-        background: rgba(245, 101, 101, 0.1);
-        color: var(--accent-red);
-        border: 1px solid var(--accent-red);
-    }
-    
-    .status-dot {
-        width: 8px;
-        height: 8px;
-        border-radius: 50%;
-        background: currentColor;
-    }
-    
-    /* Action Buttons */
-    .action-button {
-        width: 100%;
-        padding: 0.75rem;
-        border-radius: var(--border-radius);
-        font-weight: 600;
-        border: none;
-        cursor: pointer;
-        transition: all 0.2s ease;
-    }
-    
-    .btn-primary {
-        background: linear-gradient(135deg, var(--accent-green), #38a169);
-        color: white;
-    }
-    
-    .btn-primary:hover {
-        transform: translateY(-1px);
-        box-shadow: var(--shadow);
-    }
-    
-    .btn-danger {
-        background: linear-gradient(135deg, var(--accent-red), #e53e3e);
-        color: white;
-    }
-    
-    .btn-danger:hover {
-        transform: translateY(-1px);
-        box-shadow: var(--shadow);
-    }
-    
-    /* Metric Cards */
-    .metric-card {
-        background: var(--card-bg);
-        padding: 1rem;
-        border-radius: var(--border-radius);
-        border: 1px solid var(--border-color);
-        text-align: center;
-    }
-    
-    .metric-value {
-        font-size: 1.5rem;
-        font-weight: 700;
-        color: var(--text-primary);
-        margin-bottom: 0.25rem;
-    }
-    
-    .metric-label {
-        font-size: 0.75rem;
-        color: var(--text-secondary);
-        text-transform: uppercase;
-        letter-spacing: 0.05em;
-    }
-    
-    /* Strategy Tab Styles */
-    .strategy-card {
-        background: var(--secondary-bg);
-        padding: 1.5rem;
-        border-radius: var(--border-radius);
-        border: 1px solid var(--border-color);
-        margin-bottom: 1rem;
-    }
-    
-    .strategy-header {
-        color: var(--text-primary);
-        font-size: 1.2rem;
-        font-weight: 600;
-        margin-bottom: 1rem;
-        display: flex;
-        align-items: center;
-        gap: 0.5rem;
-    }
-    
-    .conditions-list {
-        background: var(--card-bg);
-        padding: 1rem;
-        border-radius: 8px;
-        margin: 1rem 0;
-        border-left: 4px solid var(--accent-blue);
-    }
-    
-    .conditions-list h4 {
-        color: var(--accent-blue);
-        margin: 0 0 0.5rem 0;
-        font-size: 1rem;
-        font-weight: 600;
-    }
-    
-    .conditions-list ul {
-        margin: 0;
-        padding-left: 1.2rem;
-        color: var(--text-secondary);
-        line-height: 1.6;
-    }
-    
-    .conditions-list li {
-        margin-bottom: 0.25rem;
-    }
-    
-    .status-box {
-        background: var(--card-bg);
-        padding: 1rem;
-        border-radius: 8px;
-        text-align: center;
-        border: 1px solid var(--border-color);
-    }
-    
-    .status-text {
-        font-size: 1.1rem;
-        font-weight: 600;
-        margin-bottom: 0.5rem;
+st.markdown(APP_CSS, unsafe_allow_html=True)
+
+DEFAULT_INITIAL_CAPITAL = 10000.0
+STRATEGY_TYPES = ("auto", "ema_crossover", "rsi_bbands", "grid")
+TRADING_MODES = ("📝 Paper Trading (Practice)", "🚀 Real Trading (Live)")
+TAB_LABELS = ("🎯 Strategy", "💼 Account", "📋 Orders", "📈 Market", "🚨 Signals", "🔍 Arbitrage", "⚙️ Order Management", "📊 Comprehensive Metrics", "🚨 Error Log")
+# (primary timeframe, minimum confidence, minimum strength) when multi-timeframe analysis is off
+MTF_DEFAULTS = ("1H", 0.6, "moderate")
+
+def _query_index(options, name: str, default: int = 0) -> int:
+    """Index of the option named by the URL query parameter, so reloads and shared links keep the selection."""
+    value = st.query_params.get(name)
+    return options.index(value) if value in options else default
+
+def _sync_query_param(name: str, value: str):
+    """Mirror a selection into the URL, only writing when it changed."""
+    if st.query_params.get(name) != value:
+        st.query_params[name] = value
+
+def _init_state():
+    """Seed the default session keys, once per browser session."""
+    ss = st.session_state
+    if ss.get('_inited'):
+        return
+    # Every session key the app reads; built only here so reruns don't allocate the equity buffer
+    defaults = {
+        'is_trading': False,
+        'next_refresh': 0.0,
+        'backtest_trigger': False,
+        'signal_test_trigger': False,
+        'initial_capital': DEFAULT_INITIAL_CAPITAL,
+        'account': {'cash': DEFAULT_INITIAL_CAPITAL, 'equity': EquityBuffer([DEFAULT_INITIAL_CAPITAL])},
+        'position': None,
+        'last_processed_ts': None,
+        'trades': [],
+        # Set whenever the trade list changes; the metrics tab recomputes only then
+        '_metrics_dirty': True,
+        'arb_running': False,
+        'real_account_data': None,
+        'account_fetched_at': 0.0,
+        'account_validation': None,
     }
+    for key, value in defaults.items():
+        ss.setdefault(key, value)
+    ss['_inited'] = True
+
+_init_state()
+
+def refresh_account_data(exe: CCXTExecutor, force: bool = False, ttl: float = 0.5) -> dict:
+    """
+    Fetch account info into the session. A fetch made less than `ttl` seconds ago is reused,
+    so rapid repeated clicks cost one round of requests; pass force=True after placing orders.
+    """
+    ss = st.session_state
+    now = time.monotonic()
+    if not force and ss['real_account_data'] is not None and now - ss['account_fetched_at'] < ttl:
+        return ss['real_account_data']
+    ss['real_account_data'] = exe.get_account_info()
+    ss['account_fetched_at'] = now
+    return ss['real_account_data']
+
+@st.fragment
+def account_panel(exe: CCXTExecutor, paper: bool):
+    """
+    Account validation, real balance, positions and orders for live mode.
+    Runs as a fragment so its buttons rerun only this panel instead of the whole dashboard.
+    """
+    st.markdown('<div class="section-header">🔐 Account Validation</div>', unsafe_allow_html=True)
     
-    .status-details {
-        font-size: 0.85rem;
-        color: var(--text-secondary);
-    }
+    # Validate account access
+    if st.button("🔍 Validate Account Access", key="validate_account"):
+        with st.spinner("Validating account access..."):
+            try:
+                validation_result = exe.validate_account()
+                st.session_state['account_validation'] = validation_result
+                
+                if validation_result['valid']:
+                    st.success("✅ Account validation successful!")
+                    st.info(f"Balance access: {'✅' if validation_result['balance_available'] else '❌'} | Market data: {'✅' if validation_result['market_data_available'] else '❌'}")
+                else:
+                    error_msg = error_handler.get_user_friendly_message(Exception(validation_result['message']))
+                    st.error(error_msg)
+                    
+                    # Show suggestions if available
+                    suggestions = error_handler.get_error_suggestions(Exception(validation_result['message']))
+                    if suggestions:
+                        st.markdown("**💡 Suggestions:**")
+                        for suggestion in suggestions:
+                            st.markdown(f"• {suggestion}")
+            except Exception as e:
+                error_msg = error_handler.get_user_friendly_message(e)
+                st.error(error_msg)
+                
+                # Show suggestions
+                suggestions = error_handler.get_error_suggestions(e)
+                if suggestions:
+                    st.markdown("**💡 Suggestions:**")
+                    for suggestion in suggestions:
+                        st.markdown(f"• {suggestion}")
+    
+    # Display validation results
+    if st.session_state['account_validation']:
+        validation = st.session_state['account_validation']
+        if validation['valid']:
+            st.markdown(ACCOUNT_VALIDATED_HTML, unsafe_allow_html=True)
+        else:
+            st.markdown(f"""
+            <div style="background: var(--accent-red); color: white; padding: 1rem; border-radius: 8px; margin: 1rem 0; text-align: center; font-weight: 600;">
+                ❌ ACCOUNT VALIDATION FAILED - {validation['message']}
+            </div>
+            """, unsafe_allow_html=True)
     
-    /* Responsive Design */
-    @media (max-width: 768px) {
-        .main .block-container {
-            padding: 1rem;
-        }
-    }
-</style>
-""", unsafe_allow_html=True)
+    # Fetch real account data
+    if st.button("📊 Fetch Real Account Data", key="fetch_account_data"):
+        with st.spinner("Fetching real account data..."):
+            try:
+                refresh_account_data(exe)
+                st.success("✅ Real account data fetched successfully!")
+            except Exception as e:
+                error_msg = error_handler.get_user_friendly_message(e)
+                st.error(error_msg)
+                
+                # Show suggestions
+                suggestions = error_handler.get_error_suggestions(e)
+                if suggestions:
+                    st.markdown("**💡 Suggestions:**")
+                    for suggestion in suggestions:
+                        st.markdown(f"• {suggestion}")
+    
+    # Always show balance - automatic display
+    st.markdown(display_account_balance(paper, st.session_state['real_account_data']), unsafe_allow_html=True)
+    
+    # Display real account data
+    if st.session_state['real_account_data']:
+        real_data = st.session_state['real_account_data']
+        
+        # Real Positions Display
+        if real_data.get('positions'):
+            positions = real_data['positions']
+            if positions:
+                shown = positions[:5]
+                pnls = np.asarray([pos.get('unrealizedPnl', 0) for pos in shown], dtype=float)
+                pnl_colors = np.where(pnls >= 0, "var(--accent-green)", "var(--accent-red)")
+                st.markdown(render_positions(positions, pnls, pnl_colors), unsafe_allow_html=True)
+            else:
+                st.markdown(NO_POSITIONS_HTML, unsafe_allow_html=True)
+        
+        # Real Orders Display
+        if real_data.get('orders'):
+            orders = real_data['orders']
+            if orders:
+                st.markdown(render_orders(orders), unsafe_allow_html=True)
+            else:
+                st.markdown(NO_ORDERS_HTML, unsafe_allow_html=True)
 
 # Enhanced Sidebar
 with st.sidebar:
-    # Header Section
-    st.markdown("""
-    <div class="sidebar-header">
-        <h1>🚀 Trading Platform</h1>
-        <div class="subtitle">Multi-Exchange Trading Dashboard</div>
-    </div>
-    """, unsafe_allow_html=True)
-    
     # Trading Status
-    if 'is_trading' not in st.session_state:
-        st.session_state['is_trading'] = False
-    
     status_class = "status-trading" if st.session_state['is_trading'] else "status-stopped"
     if st.session_state['is_trading']:
-        # Get paper mode from session state or default to True
-        paper_mode = st.session_state.get('paper_mode', True)
+        # The mode radio renders further down; its keyed state holds the current choice
+        paper_mode = st.session_state.get('trading_mode', TRADING_MODES[0]) == TRADING_MODES[0]
         status_text = "📝 PAPER TRADING" if paper_mode else "🚀 LIVE TRADING"
     else:
         status_text = "STOPPED"
     status_dot = "status-dot"
     
-    st.markdown(f"""
+    # Header and status share one markdown element
+    st.markdown(SIDEBAR_HEADER_HTML + f"""
     <div class="status-indicator {status_class}">
         <div class="{status_dot}"></div>
         {status_text}
@@ -401,150 +585,111 @@ with st.sidebar:
     with st.container():
         ex_name = st.selectbox(
             "Select Exchange", 
-            ["binance", "bybit", "mexc", "alpaca", "coinbase", "kraken"], 
-            index=0,
+            EXCHANGES, 
+            index=_query_index(EXCHANGES, "ex"),
             help="Choose your preferred exchange (crypto or stocks)"
         )
+        _sync_query_param("ex", ex_name)
         
         # Backtest Controls
         st.markdown('<div class="section-header">🧪 Backtest</div>', unsafe_allow_html=True)
         run_bt = st.button("▶️ Run Backtest", key="run_backtest_btn")
-        st.session_state.setdefault('backtest_trigger', False)
         if run_bt:
             st.session_state['backtest_trigger'] = True
+            # The backtest runs and reports in the metrics section; switch to it so the click is never lost
+            st.session_state['active_tab'] = TAB_LABELS[7]
 
         # Signal Test
         st.markdown('<div class="section-header">🔎 Signal Test</div>', unsafe_allow_html=True)
         test_sig = st.button("🧪 Test Signals (Buy/Sell)", key="test_signals_btn")
-        st.session_state.setdefault('signal_test_trigger', False)
         if test_sig:
             st.session_state['signal_test_trigger'] = True
         
         # Trading Mode Selection
         trading_mode = st.radio(
             "🎯 Trading Mode",
-            ["📝 Paper Trading (Practice)", "🚀 Real Trading (Live)"],
+            TRADING_MODES,
             index=0,
+            key="trading_mode",
             help="Choose between paper trading for practice or real trading with live orders"
         )
         
-        paper = "Paper" in trading_mode
-        st.session_state['paper_mode'] = paper
+        paper = trading_mode == TRADING_MODES[0]
         
         # Mode-specific warnings
         if paper:
-            st.markdown("""
-            <div style="background: var(--accent-blue); color: white; padding: 1rem; border-radius: 8px; margin: 1rem 0; text-align: center; font-weight: 600;">
-                📝 PAPER TRADING MODE - Safe Practice Environment
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(PAPER_MODE_BANNER_HTML, unsafe_allow_html=True)
         else:
-            st.markdown("""
-            <div style="background: var(--accent-green); color: white; padding: 1rem; border-radius: 8px; margin: 1rem 0; text-align: center; font-weight: 600;">
-                🚀 REAL TRADING MODE - Live Trading Enabled
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(REAL_MODE_BANNER_HTML, unsafe_allow_html=True)
         
         dark_theme = st.checkbox(
             "🌙 Dark Theme", 
             value=True,
             help="Toggle between light and dark themes"
         )
+        high_fidelity_chart = st.checkbox(
+            "🔬 High-fidelity chart",
+            value=False,
+            help="Plot every bar instead of merging them down to ~250 candles"
+        )
+        show_table = st.checkbox(
+            "📋 Show recent data table",
+            value=False,
+            key="show_table",
+            help="Build the last-20-bars table under the indicators"
+        )
     
     # Market Configuration
     st.markdown('<div class="section-header">📊 Market Settings</div>', unsafe_allow_html=True)
     
     with st.container():
         # Load API from .env when live trading
-        ex_upper = ex_name.upper()
-        api_key = os.getenv(f"{ex_upper}_API_KEY") if not paper else None
-        api_secret = os.getenv(f"{ex_upper}_API_SECRET") if not paper else None
-        
-        # Special handling for Coinbase (requires passphrase)
-        if ex_name.lower() == 'coinbase' and not paper:
-            passphrase = os.getenv(f"{ex_upper}_PASSPHRASE")
-            if api_key and api_secret and passphrase:
-                # For Coinbase, we need to pass the passphrase as well
-                _exec = CCXTExecutor(ex_name, api_key, api_secret, paper=paper)
-                # Set the passphrase in the exchange options
-                if hasattr(_exec.ex, 'options'):
-                    _exec.ex.options['passphrase'] = passphrase
-            else:
-                _exec = CCXTExecutor(ex_name, api_key, api_secret, paper=paper)
+        if paper:
+            api_key = api_secret = None
         else:
-            _exec = CCXTExecutor(ex_name, api_key, api_secret, paper=paper)
+            api_key, api_secret, _ = _get_creds(ex_name.upper())
+        _exec = get_executor(ex_name, paper)
         
-        # Set appropriate quote currency based on exchange
-        if ex_name.lower() in ['alpaca']:
-            # US stock exchanges use USD
-            quote_currency = "USD"
-            popular_pairs = [
-                "BTCUSD", "ETHUSD", "AAPL", "MSFT", "GOOGL", "AMZN", "TSLA",
-                "NVDA", "META", "NFLX", "AMD", "INTC", "CRM", "ADBE", "PYPL"
-            ]
-        elif ex_name.lower() in ['coinbase', 'kraken']:
-            # US crypto exchanges use USD
-            quote_currency = "USD"
-            popular_pairs = [
-                "BTC-USD", "ETH-USD", "LTC-USD", "BCH-USD", "ETC-USD",
-                "XRP-USD", "ADA-USD", "DOT-USD", "LINK-USD", "UNI-USD"
-            ]
-        else:
-            # International crypto exchanges use USDT
-            quote_currency = "USDT"
-            popular_pairs = [
-                "BTCUSDT", "ETHUSDT", "BNBUSDT", "ADAUSDT", "SOLUSDT", 
-                "XRPUSDT", "DOTUSDT", "DOGEUSDT", "AVAXUSDT", "MATICUSDT",
-                "LINKUSDT", "UNIUSDT", "LTCUSDT", "ATOMUSDT", "FTMUSDT"
-            ]
+        # Quote currency, popular pairs and default symbol candidates for the exchange
+        market_meta = EXCHANGE_META.get(ex_name.lower(), DEFAULT_EXCHANGE_META)
+        quote_currency = market_meta.quote_currency
         
-        symbols = _exec.list_symbols(quote_currency)
-        timeframes = _exec.list_timeframes()
+        # A failed listing raises (so it isn't cached) and is retried on the next rerun
+        try:
+            symbols = list_symbols_cached(_exec, ex_name, paper, quote_currency)
+        except ValueError:
+            symbols = []
+        try:
+            timeframes = list_timeframes_cached(_exec, ex_name, paper)
+        except ValueError:
+            timeframes = []
         
         # Filter available symbols and prioritize popular pairs
         if symbols:
-            # Convert symbols to uppercase for comparison
-            symbols_upper = [s.upper() for s in symbols]
-            available_popular = [pair for pair in popular_pairs if pair in symbols_upper]
-            other_symbols = [s for s in symbols if s.upper() not in popular_pairs]
-            ordered_symbols = available_popular + other_symbols
+            ordered_symbols, sym_idx = order_symbols(market_meta.popular_pairs, market_meta.popular_set, tuple(symbols))
         else:
-            ordered_symbols = popular_pairs
+            ordered_symbols = market_meta.popular_pairs
+            sym_idx = {sym: i for i, sym in enumerate(ordered_symbols)}
         
         # Find index of default symbol based on exchange
-        default_index = 0
-        if ex_name.lower() in ['alpaca']:
-            # Default to BTCUSD for US stock exchanges
-            if "BTCUSD" in ordered_symbols:
-                default_index = ordered_symbols.index("BTCUSD")
-            elif "BTC/USD" in ordered_symbols:
-                default_index = ordered_symbols.index("BTC/USD")
-        elif ex_name.lower() in ['coinbase', 'kraken']:
-            # Default to BTC-USD for US crypto exchanges
-            if "BTC-USD" in ordered_symbols:
-                default_index = ordered_symbols.index("BTC-USD")
-            elif "BTC/USD" in ordered_symbols:
-                default_index = ordered_symbols.index("BTC/USD")
-        else:
-            # Default to BTCUSDT for international crypto exchanges
-            if "BTCUSDT" in ordered_symbols:
-                default_index = ordered_symbols.index("BTCUSDT")
-            elif "BTC/USDT" in ordered_symbols:
-                default_index = ordered_symbols.index("BTC/USDT")
+        primary, fallback = market_meta.default_candidates
+        default_index = sym_idx.get(primary, sym_idx.get(fallback, 0))
         
         symbol = st.selectbox(
             "Trading Pair", 
             options=ordered_symbols, 
-            index=default_index,
+            index=sym_idx.get(st.query_params.get("sym"), default_index),
             help="Select the cryptocurrency pair to trade (popular pairs shown first)"
         )
+        _sync_query_param("sym", symbol)
         
         timeframe = st.selectbox(
             "Timeframe", 
             options=timeframes, 
-            index=timeframes.index("1h") if "1h" in timeframes else 0,
+            index=_query_index(timeframes, "tf", timeframes.index("1h") if "1h" in timeframes else 0),
             help="Choose the chart timeframe for analysis"
         )
+        _sync_query_param("tf", timeframe)
         
         refresh_secs = st.slider(
             "🔄 Refresh Rate (seconds)", 
@@ -555,443 +700,282 @@ with st.sidebar:
             help="How often to refresh market data"
         )
         
-        # Automatic periodic refresh using session timestamp
-        # Rerun the app when the chosen refresh interval has elapsed
-        now_ts = time.time()
-        last_ts = st.session_state.get('last_auto_refresh_ts', 0.0)
-        last_interval = st.session_state.get('last_auto_refresh_interval', refresh_secs)
-        # If the interval changed, force a new schedule
-        if last_interval != refresh_secs:
-            st.session_state['last_auto_refresh_interval'] = refresh_secs
-            st.session_state['last_auto_refresh_ts'] = now_ts
-        elif now_ts - last_ts >= float(refresh_secs):
-            st.session_state['last_auto_refresh_ts'] = now_ts
-            st.rerun()
     
-    # Strategy Configuration
-    st.markdown('<div class="section-header">🎯 Strategy Configuration</div>', unsafe_allow_html=True)
+    # Strategy and risk settings are batched in one form so tweaking several
+    # inputs costs a single rerun when Apply is pressed
+    with st.form("cfg", border=False):
+        # Strategy Configuration
+        st.markdown('<div class="section-header">🎯 Strategy Configuration</div>', unsafe_allow_html=True)
     
-    with st.container():
-        strat_choice = st.selectbox(
-            "Strategy Type", 
-            ["auto", "ema_crossover", "rsi_bbands", "grid"], 
-            index=0,
-            help="Select your trading strategy"
-        )
-        position_mode = st.radio(
-            "Position Mode",
-            options=["Long only", "Long + Short"],
-            index=0,
-            horizontal=True,
-            help="Choose whether to allow short (sell) entries"
-        )
-        
-        # Strategy-specific parameters
-        if strat_choice in ["auto", "rsi_bbands"]:
-            rsi_length = st.number_input(
-                "RSI Length", 
-                min_value=5, 
-                max_value=50, 
-                value=14,
-                help="Period for RSI calculation"
+        with st.container():
+            strat_choice = st.selectbox(
+                "Strategy Type", 
+                STRATEGY_TYPES, 
+                index=_query_index(STRATEGY_TYPES, "strat"),
+                help="Select your trading strategy"
             )
-            rsi_oversold = st.number_input(
-                "RSI Oversold Level", 
-                min_value=10, 
-                max_value=50, 
-                value=30,
-                help="RSI level considered oversold"
+            position_mode = st.radio(
+                "Position Mode",
+                options=["Long only", "Long + Short"],
+                index=0,
+                horizontal=True,
+                help="Choose whether to allow short (sell) entries"
             )
-        else:
-            # Set default values for other strategies
-            rsi_length = 14
-            rsi_oversold = 30
         
-        if strat_choice in ["auto"]:
-            wt_channel = st.number_input(
-                "WaveTrend Channel", 
-                min_value=5, 
-                max_value=50, 
-                value=10,
-                help="Channel length for WaveTrend indicator"
-            )
-            wt_avg = st.number_input(
-                "WaveTrend Average", 
-                min_value=5, 
-                max_value=50, 
-                value=21,
-                help="Average length for WaveTrend indicator"
+            # Strategy-specific parameters
+            if strat_choice in ["auto", "rsi_bbands"]:
+                rsi_length = st.number_input(
+                    "RSI Length", 
+                    min_value=5, 
+                    max_value=50, 
+                    value=14,
+                    help="Period for RSI calculation"
+                )
+                rsi_oversold = st.number_input(
+                    "RSI Oversold Level", 
+                    min_value=10, 
+                    max_value=50, 
+                    value=30,
+                    help="RSI level considered oversold"
+                )
+            else:
+                # Set default values for other strategies
+                rsi_length = 14
+                rsi_oversold = 30
+        
+            if strat_choice in ["auto"]:
+                wt_channel = st.number_input(
+                    "WaveTrend Channel", 
+                    min_value=5, 
+                    max_value=50, 
+                    value=10,
+                    help="Channel length for WaveTrend indicator"
+                )
+                wt_avg = st.number_input(
+                    "WaveTrend Average", 
+                    min_value=5, 
+                    max_value=50, 
+                    value=21,
+                    help="Average length for WaveTrend indicator"
+                )
+            else:
+                # Set default values for other strategies
+                wt_channel = 10
+                wt_avg = 21
+    
+        # Multi-Timeframe Analysis Configuration
+        st.markdown('<div class="section-header">📊 Multi-Timeframe Analysis</div>', unsafe_allow_html=True)
+    
+        with st.expander("🔄 Multi-Timeframe Settings", expanded=False):
+            enable_mtf = st.checkbox(
+                "Enable Multi-Timeframe Analysis",
+                value=False,
+                help="Analyze multiple timeframes for stronger signals"
             )
-        else:
-            # Set default values for other strategies
-            wt_channel = 10
-            wt_avg = 21
-    
-    # Multi-Timeframe Analysis Configuration
-    st.markdown('<div class="section-header">📊 Multi-Timeframe Analysis</div>', unsafe_allow_html=True)
-    
-    with st.expander("🔄 Multi-Timeframe Settings", expanded=False):
-        enable_mtf = st.checkbox(
-            "Enable Multi-Timeframe Analysis",
-            value=False,
-            help="Analyze multiple timeframes for stronger signals"
-        )
         
-        if enable_mtf:
-            primary_tf = st.selectbox(
-                "Primary Timeframe",
-                ["15m", "30m", "1H", "4H", "1D"],
-                index=2,
-                help="Primary timeframe for analysis"
-            )
-            
-            secondary_tfs = st.multiselect(
-                "Secondary Timeframes",
-                ["15m", "30m", "1H", "4H", "1D", "1W"],
-                default=["15m", "4H", "1D"],
-                help="Additional timeframes to analyze"
-            )
-            
-            mtf_min_confidence = st.slider(
-                "Minimum Confidence",
-                min_value=0.3,
-                max_value=1.0,
-                value=0.6,
-                step=0.1,
-                help="Minimum confidence threshold for signals"
-            )
+            if enable_mtf:
+                primary_tf = st.selectbox(
+                    "Primary Timeframe",
+                    ["15m", "30m", "1H", "4H", "1D"],
+                    index=2,
+                    help="Primary timeframe for analysis"
+                )
             
-            mtf_min_strength = st.selectbox(
-                "Minimum Strength",
-                ["weak", "moderate", "strong"],
-                index=1,
-                help="Minimum signal strength required"
-            )
+                secondary_tfs = st.multiselect(
+                    "Secondary Timeframes",
+                    ["15m", "30m", "1H", "4H", "1D", "1W"],
+                    default=["15m", "4H", "1D"],
+                    help="Additional timeframes to analyze"
+                )
             
-            # Timeframe weights
-            st.markdown("**Timeframe Weights**")
-            tf_weights = {}
-            for tf in secondary_tfs:
-                tf_weights[tf] = st.slider(
-                    f"Weight for {tf}",
-                    min_value=0.1,
+                mtf_min_confidence = st.slider(
+                    "Minimum Confidence",
+                    min_value=0.3,
                     max_value=1.0,
-                    value=0.5 if tf in ["1H", "4H"] else 0.3,
+                    value=0.6,
                     step=0.1,
-                    help=f"Weight for {tf} timeframe"
+                    help="Minimum confidence threshold for signals"
                 )
-        else:
-            primary_tf = "1H"
-            secondary_tfs = []
-            mtf_min_confidence = 0.6
-            mtf_min_strength = "moderate"
-            tf_weights = {}
-    
-    # Risk Management
-    st.markdown('<div class="section-header">⚠️ Risk Management</div>', unsafe_allow_html=True)
-    
-    with st.container():
-        initial_cap = st.number_input(
-            "💰 Initial Capital ($)", 
-            min_value=100.0, 
-            max_value=1000000.0, 
-            value=10000.0,
-            help="Starting capital for trading"
-        )
-        
-        if 'initial_capital' not in st.session_state:
-            st.session_state['initial_capital'] = initial_cap
+            
+                mtf_min_strength = st.selectbox(
+                    "Minimum Strength",
+                    ["weak", "moderate", "strong"],
+                    index=1,
+                    help="Minimum signal strength required"
+                )
+            
+                # Timeframe weights
+                st.markdown("**Timeframe Weights**")
+                tf_weights = {
+                    tf: st.slider(
+                        f"Weight for {tf}",
+                        min_value=0.1,
+                        max_value=1.0,
+                        value=0.5 if tf in ("1H", "4H") else 0.3,
+                        step=0.1,
+                        key=f"w_{tf}",
+                        help=f"Weight for {tf} timeframe"
+                    )
+                    for tf in secondary_tfs
+                }
+                session_mtf_analyzer(primary_tf, secondary_tfs, tf_weights)
+            else:
+                # Nothing rendered while disabled; fall back to the shared defaults
+                primary_tf, mtf_min_confidence, mtf_min_strength = MTF_DEFAULTS
+                secondary_tfs = ()
+                tf_weights = {}
+    
+        # Risk Management
+        st.markdown('<div class="section-header">⚠️ Risk Management</div>', unsafe_allow_html=True)
+    
+        with st.container():
+            initial_cap = st.number_input(
+                "💰 Initial Capital ($)", 
+                min_value=100.0, 
+                max_value=1000000.0, 
+                value=DEFAULT_INITIAL_CAPITAL,
+                help="Starting capital for trading"
+            )
         
-        risk_per_trade = st.slider(
-            "Risk per Trade (%)", 
-            min_value=0.005, 
-            max_value=0.10, 
-            value=0.02, 
-            step=0.005,
-            help="Percentage of capital to risk per trade"
-        )
+            risk_per_trade = st.slider(
+                "Risk per Trade (%)", 
+                min_value=0.005, 
+                max_value=0.10, 
+                value=0.02, 
+                step=0.005,
+                help="Percentage of capital to risk per trade"
+            )
     
-    # Advanced Risk Management Configuration
-    st.markdown('<div class="section-header">⚙️ Advanced Risk Management</div>', unsafe_allow_html=True)
+        # Advanced Risk Management Configuration
+        st.markdown('<div class="section-header">⚙️ Advanced Risk Management</div>', unsafe_allow_html=True)
     
-    with st.expander("🔧 Configurable Stop-Loss Settings", expanded=False):
-        stop_loss_type = st.selectbox(
-            "Stop Loss Type",
-            ["percentage", "atr", "support_resistance", "volatility"],
-            index=0,
-            help="Choose stop loss calculation method"
-        )
+        with st.expander("🔧 Configurable Stop-Loss Settings", expanded=False):
+            stop_loss_type = st.selectbox(
+                "Stop Loss Type",
+                ["percentage", "atr", "support_resistance", "volatility"],
+                index=0,
+                help="Choose stop loss calculation method"
+            )
         
-        if stop_loss_type == "percentage":
-            stop_loss_value = st.slider(
-                "Stop Loss Percentage",
-                min_value=0.5,
-                max_value=10.0,
-                value=2.0,
-                step=0.1,
-                format="%.1f%%",
-                help="Stop loss as percentage of entry price"
-            ) / 100
-        elif stop_loss_type == "atr":
-            stop_loss_value = st.slider(
-                "ATR Multiplier",
-                min_value=0.5,
-                max_value=5.0,
-                value=2.0,
+            if stop_loss_type == "percentage":
+                stop_loss_value = st.slider(
+                    "Stop Loss Percentage",
+                    min_value=0.5,
+                    max_value=10.0,
+                    value=2.0,
+                    step=0.1,
+                    format="%.1f%%",
+                    help="Stop loss as percentage of entry price"
+                ) / 100
+            elif stop_loss_type == "atr":
+                stop_loss_value = st.slider(
+                    "ATR Multiplier",
+                    min_value=0.5,
+                    max_value=5.0,
+                    value=2.0,
+                    step=0.1,
+                    help="ATR multiplier for stop loss distance"
+                )
+            elif stop_loss_type == "support_resistance":
+                stop_loss_value = st.slider(
+                    "Support/Resistance Distance",
+                    min_value=1.0,
+                    max_value=5.0,
+                    value=2.0,
+                    step=0.1,
+                    format="%.1f%%",
+                    help="Distance from support/resistance levels"
+                ) / 100
+            else:  # volatility
+                stop_loss_value = st.slider(
+                    "Volatility Multiplier",
+                    min_value=1.0,
+                    max_value=3.0,
+                    value=2.0,
+                    step=0.1,
+                    help="Volatility multiplier for stop loss"
+                )
+        
+            # TP1/TP2/Runner Configuration
+            st.markdown("**Take Profit Configuration**")
+            tp1_multiplier = st.slider(
+                "TP1 Multiplier",
+                min_value=1.0,
+                max_value=3.0,
+                value=1.5,
                 step=0.1,
-                help="ATR multiplier for stop loss distance"
+                help="TP1 as multiple of risk"
             )
-        elif stop_loss_type == "support_resistance":
-            stop_loss_value = st.slider(
-                "Support/Resistance Distance",
-                min_value=1.0,
+        
+            tp2_multiplier = st.slider(
+                "TP2 Multiplier", 
+                min_value=2.0,
                 max_value=5.0,
                 value=2.0,
                 step=0.1,
-                format="%.1f%%",
-                help="Distance from support/resistance levels"
-            ) / 100
-        else:  # volatility
-            stop_loss_value = st.slider(
-                "Volatility Multiplier",
-                min_value=1.0,
-                max_value=3.0,
-                value=2.0,
-                step=0.1,
-                help="Volatility multiplier for stop loss"
+                help="TP2 as multiple of risk"
             )
         
-        # TP1/TP2/Runner Configuration
-        st.markdown("**Take Profit Configuration**")
-        tp1_multiplier = st.slider(
-            "TP1 Multiplier",
-            min_value=1.0,
-            max_value=3.0,
-            value=1.5,
-            step=0.1,
-            help="TP1 as multiple of risk"
-        )
-        
-        tp2_multiplier = st.slider(
-            "TP2 Multiplier", 
-            min_value=2.0,
-            max_value=5.0,
-            value=2.0,
-            step=0.1,
-            help="TP2 as multiple of risk"
-        )
-        
-        runner_multiplier = st.slider(
-            "Runner Multiplier",
-            min_value=3.0,
-            max_value=10.0,
-            value=3.0,
-            step=0.1,
-            help="Runner activation as multiple of risk"
-        )
-        
-        # Daily Breaker
-        daily_breaker_active = st.checkbox(
-            "Enable Daily Breaker",
-            value=False,
-            help="Stop trading after daily loss limit"
-        )
-        
-        if daily_breaker_active:
-            daily_loss_limit = st.slider(
-                "Daily Loss Limit",
-                min_value=1.0,
+            runner_multiplier = st.slider(
+                "Runner Multiplier",
+                min_value=3.0,
                 max_value=10.0,
-                value=5.0,
-                step=0.5,
-                format="%.1f%%",
-                help="Maximum daily loss as percentage of capital"
-            ) / 100
-        else:
-            daily_loss_limit = 0.05
-        
-        # Additional Risk Parameters
-        st.markdown("**Additional Risk Parameters**")
-        max_bars_in_trade = st.number_input(
-            "Max Bars in Trade", 
-            min_value=1, 
-            max_value=10000, 
-            value=100,
-            help="Maximum number of bars to hold a position"
-        )
-        
-        # Legacy parameters for backward compatibility
-        stop_loss_pct = stop_loss_value if stop_loss_type == "percentage" else 0.03
-        take_profit_pct = tp1_multiplier * stop_loss_pct if stop_loss_type == "percentage" else 0.06
-    
-    # Initialize session state
-    if 'account' not in st.session_state:
-        st.session_state['account'] = {'cash': float(initial_cap), 'equity': [float(initial_cap)]}
-    if 'position' not in st.session_state:
-        st.session_state['position'] = None
-    if 'trades' not in st.session_state:
-        st.session_state['trades'] = []
-    if 'arb_running' not in st.session_state:
-        st.session_state['arb_running'] = False
-    if 'real_account_data' not in st.session_state:
-        st.session_state['real_account_data'] = None
-    if 'account_validation' not in st.session_state:
-        st.session_state['account_validation'] = None
-    
-    # Real Account Data Fetching and Validation
-    if not paper and api_key and api_secret:
-        st.markdown('<div class="section-header">🔐 Account Validation</div>', unsafe_allow_html=True)
-        
-        # Validate account access
-        if st.button("🔍 Validate Account Access", key="validate_account"):
-            with st.spinner("Validating account access..."):
-                try:
-                    validation_result = _exec.validate_account()
-                    st.session_state['account_validation'] = validation_result
-                    
-                    if validation_result['valid']:
-                        st.success("✅ Account validation successful!")
-                        st.info(f"Balance access: {'✅' if validation_result['balance_available'] else '❌'} | Market data: {'✅' if validation_result['market_data_available'] else '❌'}")
-                    else:
-                        error_msg = error_handler.get_user_friendly_message(Exception(validation_result['message']))
-                        st.error(error_msg)
-                        
-                        # Show suggestions if available
-                        suggestions = error_handler.get_error_suggestions(Exception(validation_result['message']))
-                        if suggestions:
-                            st.markdown("**💡 Suggestions:**")
-                            for suggestion in suggestions:
-                                st.markdown(f"• {suggestion}")
-                except Exception as e:
-                    error_msg = error_handler.get_user_friendly_message(e)
-                    st.error(error_msg)
-                    
-                    # Show suggestions
-                    suggestions = error_handler.get_error_suggestions(e)
-                    if suggestions:
-                        st.markdown("**💡 Suggestions:**")
-                        for suggestion in suggestions:
-                            st.markdown(f"• {suggestion}")
+                value=3.0,
+                step=0.1,
+                help="Runner activation as multiple of risk"
+            )
         
-        # Display validation results
-        if st.session_state['account_validation']:
-            validation = st.session_state['account_validation']
-            if validation['valid']:
-                st.markdown("""
-                <div style="background: var(--accent-green); color: white; padding: 1rem; border-radius: 8px; margin: 1rem 0; text-align: center; font-weight: 600;">
-                    ✅ ACCOUNT VALIDATED - Ready for Real Trading
-                </div>
-                """, unsafe_allow_html=True)
-            else:
-                st.markdown(f"""
-                <div style="background: var(--accent-red); color: white; padding: 1rem; border-radius: 8px; margin: 1rem 0; text-align: center; font-weight: 600;">
-                    ❌ ACCOUNT VALIDATION FAILED - {validation['message']}
-                </div>
-                """, unsafe_allow_html=True)
+            # Daily Breaker
+            daily_breaker_active = st.checkbox(
+                "Enable Daily Breaker",
+                value=False,
+                help="Stop trading after daily loss limit"
+            )
         
-        # Fetch real account data
-        if st.button("📊 Fetch Real Account Data", key="fetch_account_data"):
-            with st.spinner("Fetching real account data..."):
-                try:
-                    account_data = _exec.get_account_info()
-                    st.session_state['real_account_data'] = account_data
-                    st.success("✅ Real account data fetched successfully!")
-                except Exception as e:
-                    error_msg = error_handler.get_user_friendly_message(e)
-                    st.error(error_msg)
-                    
-                    # Show suggestions
-                    suggestions = error_handler.get_error_suggestions(e)
-                    if suggestions:
-                        st.markdown("**💡 Suggestions:**")
-                        for suggestion in suggestions:
-                            st.markdown(f"• {suggestion}")
+            if daily_breaker_active:
+                daily_loss_limit = st.slider(
+                    "Daily Loss Limit",
+                    min_value=1.0,
+                    max_value=10.0,
+                    value=5.0,
+                    step=0.5,
+                    format="%.1f%%",
+                    help="Maximum daily loss as percentage of capital"
+                ) / 100
+            else:
+                daily_loss_limit = 0.05
+        
+            # Additional Risk Parameters
+            st.markdown("**Additional Risk Parameters**")
+            max_bars_in_trade = st.number_input(
+                "Max Bars in Trade", 
+                min_value=1, 
+                max_value=10000, 
+                value=100,
+                help="Maximum number of bars to hold a position"
+            )
         
-        # Always show balance - automatic display
-        st.markdown(display_account_balance(paper, st.session_state.get('real_account_data')), unsafe_allow_html=True)
+            # Legacy parameters for backward compatibility
+            stop_loss_pct = stop_loss_value if stop_loss_type == "percentage" else 0.03
+            take_profit_pct = tp1_multiplier * stop_loss_pct if stop_loss_type == "percentage" else 0.06
         
-        # Display real account data
-        if st.session_state['real_account_data']:
-            real_data = st.session_state['real_account_data']
-            
-            # Real Positions Display
-            if real_data.get('positions'):
-                positions = real_data['positions']
-                if positions:
-                    st.markdown(f"""
-                    <div style="background: var(--card-bg); padding: 1rem; border-radius: 8px; border: 1px solid var(--border-color); margin: 1rem 0;">
-                        <h4 style="margin: 0 0 1rem 0; color: var(--text-primary);">📈 Real Positions ({len(positions)})</h4>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    for pos in positions[:5]:  # Show first 5 positions
-                        symbol = pos.get('symbol', 'Unknown')
-                        size = pos.get('size', 0)
-                        side = pos.get('side', 'Unknown')
-                        unrealized_pnl = pos.get('unrealizedPnl', 0)
-                        pnl_color = "var(--accent-green)" if float(unrealized_pnl) >= 0 else "var(--accent-red)"
-                        
-                        st.markdown(f"""
-                        <div style="background: var(--secondary-bg); padding: 0.75rem; border-radius: 6px; margin: 0.5rem 0; border-left: 4px solid {pnl_color};">
-                            <div style="display: flex; justify-content: space-between; align-items: center;">
-                                <span style="color: var(--text-primary); font-weight: 600;">{symbol}</span>
-                                <span style="color: {pnl_color}; font-weight: 600;">${float(unrealized_pnl):,.2f}</span>
-                            </div>
-                            <div style="color: var(--text-secondary); font-size: 0.9rem;">
-                                {side} • Size: {size}
-                            </div>
-                        </div>
-                        """, unsafe_allow_html=True)
-                else:
-                    st.markdown("""
-                    <div style="background: var(--card-bg); padding: 1rem; border-radius: 8px; border: 1px solid var(--border-color); margin: 1rem 0; text-align: center;">
-                        <h4 style="margin: 0 0 0.5rem 0; color: var(--text-primary);">📈 Real Positions</h4>
-                        <p style="color: var(--text-secondary); margin: 0;">No open positions</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-            
-            # Real Orders Display
-            if real_data.get('orders'):
-                orders = real_data['orders']
-                if orders:
-                    st.markdown(f"""
-                    <div style="background: var(--card-bg); padding: 1rem; border-radius: 8px; border: 1px solid var(--border-color); margin: 1rem 0;">
-                        <h4 style="margin: 0 0 1rem 0; color: var(--text-primary);">📋 Real Orders ({len(orders)})</h4>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    for order in orders[:5]:  # Show first 5 orders
-                        order_id = order.get('orderId', 'Unknown')
-                        symbol = order.get('symbol', 'Unknown')
-                        side = order.get('side', 'Unknown')
-                        qty = order.get('qty', 0)
-                        status = order.get('orderStatus', 'Unknown')
-                        
-                        st.markdown(f"""
-                        <div style="background: var(--secondary-bg); padding: 0.75rem; border-radius: 6px; margin: 0.5rem 0;">
-                            <div style="display: flex; justify-content: space-between; align-items: center;">
-                                <span style="color: var(--text-primary); font-weight: 600;">{symbol}</span>
-                                <span style="color: var(--text-secondary); font-size: 0.9rem;">{status}</span>
-                            </div>
-                            <div style="color: var(--text-secondary); font-size: 0.9rem;">
-                                {side} • Qty: {qty} • ID: {order_id[:8]}...
-                            </div>
-                        </div>
-                        """, unsafe_allow_html=True)
-                else:
-                    st.markdown("""
-                    <div style="background: var(--card-bg); padding: 1rem; border-radius: 8px; border: 1px solid var(--border-color); margin: 1rem 0; text-align: center;">
-                        <h4 style="margin: 0 0 0.5rem 0; color: var(--text-primary);">📋 Real Orders</h4>
-                        <p style="color: var(--text-secondary); margin: 0;">No open orders</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-
-    # Trading Controls
-    st.markdown('<div class="section-header">🎮 Trading Controls</div>', unsafe_allow_html=True)
+        st.form_submit_button("✅ Apply Settings", use_container_width=True)
+    
+    # Plain Python numbers for the trading math, coerced once per run
+    stop_loss_pct = float(stop_loss_pct)
+    take_profit_pct = float(take_profit_pct)
+    risk_per_trade = float(risk_per_trade)
+    max_bars_in_trade = int(max_bars_in_trade)
+    _sync_query_param("strat", strat_choice)
     
-    # Mode-specific warnings and controls
+    # Real Account Data Fetching and Validation
+    if not paper and api_key and api_secret:
+        account_panel(_exec, paper)
+
+    # Trading Controls header and mode-specific warning share one markdown element
+    trading_controls_header = '<div class="section-header">🎮 Trading Controls</div>'
     if paper:
-        st.markdown("""
+        st.markdown(trading_controls_header + """
         <div style="background: var(--card-bg); padding: 1rem; border-radius: 8px; border: 2px solid var(--accent-blue); margin: 1rem 0;">
             <h4 style="color: var(--accent-blue); margin: 0 0 0.5rem 0;">📝 PAPER TRADING MODE</h4>
             <p style="color: var(--text-secondary); margin: 0; font-size: 0.9rem;">
@@ -1003,7 +987,7 @@ with st.sidebar:
         </div>
         """, unsafe_allow_html=True)
     else:
-        st.markdown("""
+        st.markdown(trading_controls_header + """
         <div style="background: var(--card-bg); padding: 1rem; border-radius: 8px; border: 2px solid var(--accent-green); margin: 1rem 0;">
             <h4 style="color: var(--accent-green); margin: 0 0 0.5rem 0;">🚀 REAL TRADING MODE</h4>
             <p style="color: var(--text-secondary); margin: 0; font-size: 0.9rem;">
@@ -1107,24 +1091,14 @@ with st.sidebar:
         """, unsafe_allow_html=True)
 
 # Main Dashboard Header
-st.markdown("""
-<div style="background: linear-gradient(135deg, var(--accent-blue), var(--accent-purple)); 
-            padding: 2rem; border-radius: var(--border-radius); margin-bottom: 2rem; 
-            text-align: center; color: white;">
-    <h1 style="margin: 0; font-size: 2.5rem; font-weight: 700; text-shadow: 0 2px 4px rgba(0,0,0,0.3);">
-        📊 Live Trading Dashboard
-    </h1>
-    <p style="margin: 0.5rem 0 0 0; font-size: 1.1rem; opacity: 0.9;">
-        Real-time market analysis and automated trading
-    </p>
-</div>
-""", unsafe_allow_html=True)
+st.markdown(DASHBOARD_HEADER_HTML, unsafe_allow_html=True)
 
 # Data Processing Section
 with st.spinner("🔄 Loading market data..."):
     try:
         # Fetch OHLCV
-        df = _exec.fetch_ohlcv_df(symbol, timeframe=timeframe, limit=500)
+        df = load_ohlcv(_exec, ex_name, paper, symbol, timeframe, refresh_secs)
+        st.session_state['next_refresh'] = time.monotonic() + refresh_secs
         
         # Validate required columns
         required_columns = ['timestamp', 'open', 'high', 'low', 'close']
@@ -1139,7 +1113,7 @@ with st.spinner("🔄 Loading market data..."):
         df = df.sort_values('timestamp').reset_index(drop=True)
         
         # If user requested signal test, compute and show quick summary
-        if st.session_state.get('signal_test_trigger'):
+        if st.session_state['signal_test_trigger']:
             st.session_state['signal_test_trigger'] = False
             with st.spinner("Testing signals..."):
                 try:
@@ -1153,90 +1127,35 @@ with st.spinner("🔄 Loading market data..."):
                 except Exception as e:
                     st.error(f"Signal test failed: {e}")
 
-        # Indicators & signals
-        df['rsi'] = rsi(df['close'], length=int(rsi_length))
-        
-        # Calculate hlc3 if columns exist
-        if set(['high', 'low', 'close']).issubset(df.columns):
-            df['hlc3'] = (df['high'] + df['low'] + df['close']) / 3.0
-            wt_input = df['hlc3']
-        else:
-            wt_input = df['close']
-        
-        # Compute wavetrend and ensure correct assignment
-        wt = wavetrend(wt_input, channel_length=int(wt_channel), average_length=int(wt_avg))
-        if isinstance(wt, pd.DataFrame):
-            df[['wt1', 'wt2']] = wt[['wt1', 'wt2']]
-        elif isinstance(wt, (list, tuple)) and len(wt) == 2:
-            df['wt1'], df['wt2'] = wt
+        # Indicators & signals, reused until the bars or parameters change
+        return_mode = 'long_short' if position_mode == 'Long + Short' else 'long_only'
+        data_key = (ex_name, symbol, timeframe, frame_key(df))
+        ind_key = (data_key, strat_choice, return_mode, int(rsi_length), float(rsi_oversold), int(wt_channel), int(wt_avg))
+        if st.session_state.get('_ind_key') == ind_key and st.session_state.get('_ind_df') is not None:
+            # UI-only rerun (theme, toggles, start/stop): reuse this session's columns without a cache round-trip
+            indicators = st.session_state['_ind_df']
         else:
-            raise ValueError("wavetrend function returned unexpected output format")
-        
+            indicators = compute_signals(df, *ind_key)
+            st.session_state['_ind_key'] = ind_key
+            st.session_state['_ind_df'] = indicators
+        df[indicators.columns] = indicators
         df['webhook'] = False
-        sm = StrategyManager()
-        
-        # Generate signals based on selected strategy
-        if strat_choice == 'auto':
-            # Auto strategy: Combine RSI + WaveTrend signals
-            # Buy when RSI is oversold AND WaveTrend crosses up
-            rsi_oversold_condition = df['rsi'] < rsi_oversold
-            wt_cross_up = (df['wt1'].shift(1) <= df['wt2'].shift(1)) & (df['wt1'] > df['wt2'])
-            df['signal'] = rsi_oversold_condition & wt_cross_up
-        elif strat_choice == 'ema_crossover':
-            return_mode = 'long_short' if position_mode == 'Long + Short' else 'long_only'
-            sig_df = sm.strategies['ema_crossover'].generate_signals(df, return_mode=return_mode)
-            if return_mode == 'long_short':
-                df[['long', 'short']] = sig_df[['long', 'short']]
-            else:
-                df[['signal']] = sig_df[['signal']]
-        elif strat_choice == 'rsi_bbands':
-            df['signal'] = sm.strategies['rsi_bbands'].generate_signals(df, rsi_len=int(rsi_length))
-        elif strat_choice == 'grid':
-            df['signal'] = sm.strategies['grid'].generate_signals(df)
-        else:
-            # Fallback to auto strategy
-            rsi_oversold_condition = df['rsi'] < rsi_oversold
-            wt_cross_up = (df['wt1'].shift(1) <= df['wt2'].shift(1)) & (df['wt1'] > df['wt2'])
-            df['signal'] = rsi_oversold_condition & wt_cross_up
         
         # Market Overview Section
-        last_close = float(df['close'].iat[-1]) if len(df) else 0.0
-        prev_close = float(df['close'].iat[-2]) if len(df) > 1 else last_close
-
-        # Calculate 24h change (last 24 bars for hourly data, or adjust based on timeframe)
-        if len(df) >= 24:
-            price_24h_ago = float(df['close'].iat[-24])
-            price_change_24h = last_close - price_24h_ago
-            price_change_24h_pct = (price_change_24h / price_24h_ago * 100) if price_24h_ago else 0
-        else:
-            # Fallback to previous bar if not enough data
-            price_change_24h = last_close - prev_close
-            price_change_24h_pct = (price_change_24h / prev_close * 100) if prev_close else 0
-
-        # Current bar change
-        price_change = last_close - prev_close
-        price_change_pct = (price_change / prev_close * 100) if prev_close else 0
-        up = price_change_24h >= 0
+        market_overview = compute_market_overview(df['close'])
+        last_close = market_overview['last_close']
+        prev_close = market_overview['prev_close']
+        price_change_24h = market_overview['price_change_24h']
+        price_change_24h_pct = market_overview['price_change_24h_pct']
+        price_change = market_overview['price_change']
+        price_change_pct = market_overview['price_change_pct']
+        up = market_overview['up']
 
         st.success("✅ Market data loaded successfully!")
 
     except Exception as e:
         st.error(f"❌ Data Processing Error: {e}")
-        st.markdown("""
-        <div style="background: var(--card-bg); padding: 1.5rem; border-radius: var(--border-radius); 
-                    border: 1px solid var(--border-color); margin: 1rem 0;">
-            <h3 style="color: var(--accent-red); margin-top: 0;">⚠️ Unable to Load Market Data</h3>
-            <p style="color: var(--text-secondary); margin-bottom: 1rem;">
-                Please check your internet connection and exchange settings. 
-                Make sure the selected trading pair is available on the chosen exchange.
-            </p>
-            <div style="background: var(--secondary-bg); padding: 1rem; border-radius: 8px; 
-                        border-left: 4px solid var(--accent-red);">
-                <strong>Error Details:</strong><br>
-                <code style="color: var(--text-primary);">{}</code>
-            </div>
-        </div>
-        """.format(str(e)), unsafe_allow_html=True)
+        st.markdown(MARKET_DATA_ERROR_TEMPLATE.format(str(e)), unsafe_allow_html=True)
         st.stop()
 
 # Check if data was loaded successfully
@@ -1244,120 +1163,145 @@ if 'df' not in locals() or df is None or len(df) == 0:
     st.error("❌ No market data available. Please check your exchange settings and try again.")
     st.stop()
 
-# Market Overview Section
-last_close = float(df['close'].iat[-1]) if len(df) else 0.0
-prev_close = float(df['close'].iat[-2]) if len(df) > 1 else last_close
-
-# Calculate 24h change (last 24 bars for hourly data, or adjust based on timeframe)
-if len(df) >= 24:
-    price_24h_ago = float(df['close'].iat[-24])
-    price_change_24h = last_close - price_24h_ago
-    price_change_24h_pct = (price_change_24h / price_24h_ago * 100) if price_24h_ago else 0
-else:
-    # Fallback to previous bar if not enough data
-    price_change_24h = last_close - prev_close
-    price_change_24h_pct = (price_change_24h / prev_close * 100) if prev_close else 0
+tail = _tail_scalars(df, ('timestamp', 'close', 'rsi', 'wt1', 'wt2', 'signal'))
 
-# Current bar change
-price_change = last_close - prev_close
-price_change_pct = (price_change / prev_close * 100) if prev_close else 0
-up = price_change_24h >= 0
+# Latest-bar values, bound once for the position panel and the trading logic
+latest_idx = len(df) - 1
+# Bar timestamp rather than index: the fetch window slides, so the index of the last bar barely changes
+latest_bar_ts = tail['timestamp'][latest_idx]
+new_bar = st.session_state['last_processed_ts'] != latest_bar_ts
+latest_price = float(tail['close'][latest_idx])
+if np.isnan(latest_price):
+    latest_price = 0.0
+signal_now = bool(tail['signal'][latest_idx])
+wt_cross_down_now = False
+if latest_idx > 0:  # Prevent index out of bounds
+    w1, w2 = tail['wt1'], tail['wt2']
+    wt_cross_down_now = bool((w1[latest_idx-1] >= w2[latest_idx-1]) and (w1[latest_idx] < w2[latest_idx]))
 
 # Market Header with Key Metrics
-st.markdown(f"""
-<div style="background: var(--card-bg); padding: 1.5rem; border-radius: var(--border-radius); 
-            border: 1px solid var(--border-color); margin-bottom: 1.5rem;">
-    <div style="display: flex; justify-content: space-between; align-items: center; flex-wrap: wrap; gap: 1rem;">
-        <div>
-            <h2 style="margin: 0; color: var(--text-primary); font-size: 1.8rem;">
-                📈 {symbol} • {ex_name.upper()}
-            </h2>
-            <p style="margin: 0.25rem 0 0 0; color: var(--text-secondary); font-size: 0.95rem;">
-                {timeframe} • Last updated: {pd.Timestamp.now().strftime('%H:%M:%S')}
-            </p>
-        </div>
-        <div style="text-align: right;">
-            <div style="font-size: 2rem; font-weight: 700; color: var(--text-primary);">
-                ${last_close:,.6f}
-            </div>
-            <div style="font-size: 1rem; color: {'var(--accent-green)' if up else 'var(--accent-red)'}; 
-                        font-weight: 600;">
-                24h: {price_change_24h:+.6f} ({price_change_24h_pct:+.2f}%)
+# Refreshed on its own timer: idle dashboards update only the header, while an active
+# trading session uses the same tick to rerun the whole script instead of sleeping on it
+@st.fragment(run_every=refresh_secs)
+def live_market_header(exe: CCXTExecutor, df: pd.DataFrame):
+    now = time.monotonic()
+    if now >= st.session_state['next_refresh']:
+        if st.session_state['is_trading']:
+            # Signals and entries/exits live in the main script; turn the tick into a full rerun
+            st.rerun()
+        # Timed fragment rerun: the bars from the last full run are stale
+        try:
+            fresh = load_ohlcv(exe, ex_name, paper, symbol, timeframe, refresh_secs)
+            if len(fresh):
+                df = fresh.sort_values('timestamp').reset_index(drop=True)
+                st.session_state['next_refresh'] = now + refresh_secs
+        except Exception:
+            pass
+    ov = compute_market_overview(df['close'])
+    last_close = ov['last_close']
+    price_change_24h = ov['price_change_24h']
+    price_change_24h_pct = ov['price_change_24h_pct']
+    price_change = ov['price_change']
+    price_change_pct = ov['price_change_pct']
+    up = ov['up']
+    st.markdown(f"""
+    <div class="card">
+        <div style="display: flex; justify-content: space-between; align-items: center; flex-wrap: wrap; gap: 1rem;">
+            <div>
+                <h2 style="margin: 0; color: var(--text-primary); font-size: 1.8rem;">
+                    📈 {symbol} • {ex_name.upper()}
+                </h2>
+                <p style="margin: 0.25rem 0 0 0; color: var(--text-secondary); font-size: 0.95rem;">
+                    {timeframe} • Last updated: {time.strftime('%H:%M:%S')}
+                </p>
             </div>
-            <div style="font-size: 0.8rem; color: var(--text-secondary); margin-top: 0.25rem;">
-                1h: {price_change:+.6f} ({price_change_pct:+.2f}%)
+            <div style="text-align: right;">
+                <div style="font-size: 2rem; font-weight: 700; color: var(--text-primary);">
+                    ${last_close:,.6f}
+                </div>
+                <div style="font-size: 1rem; color: {'var(--accent-green)' if up else 'var(--accent-red)'}; 
+                            font-weight: 600;">
+                    24h: {price_change_24h:+.6f} ({price_change_24h_pct:+.2f}%)
+                </div>
+                <div style="font-size: 0.8rem; color: var(--text-secondary); margin-top: 0.25rem;">
+                    1h: {price_change:+.6f} ({price_change_pct:+.2f}%)
+                </div>
             </div>
         </div>
     </div>
-</div>
-""", unsafe_allow_html=True)
+    """, unsafe_allow_html=True)
+
+live_market_header(_exec, df)
 
 # Main Chart Section
-st.markdown("""
-<div style="background: var(--card-bg); padding: 1.5rem; border-radius: var(--border-radius); 
-            border: 1px solid var(--border-color); margin-bottom: 1.5rem;">
-    <h3 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; gap: 0.5rem;">
-        📊 Price Chart & Technical Analysis
-    </h3>
-""", unsafe_allow_html=True)
-
-show_volume = 'volume' in df.columns
-rows = 3 if show_volume else 2
-fig = make_subplots(
-    rows=rows, cols=1, 
-    shared_xaxes=True, 
-    vertical_spacing=0.02,
-    row_heights=[0.6, 0.25] + ([0.15] if show_volume else []),
-    subplot_titles=['Price Action', 'WaveTrend Oscillator'] + (['Volume'] if show_volume else [])
-)
+st.markdown(PRICE_CHART_HEADER_HTML, unsafe_allow_html=True)
 
-# Main candlestick chart
-fig.add_trace(
-    go.Candlestick(
-        x=df['timestamp'], 
-        open=df['open'], 
-        high=df['high'], 
-        low=df['low'], 
-        close=df['close'], 
-        name='OHLC',
-        increasing_line_color='#48bb78',
-        decreasing_line_color='#f56565',
-        increasing_fillcolor='rgba(72, 187, 120, 0.1)',
-        decreasing_fillcolor='rgba(245, 101, 101, 0.1)'
-    ),
-    row=1, col=1
-)
+@st.cache_data(max_entries=16, show_spinner=False)
+def build_main_chart(_df: pd.DataFrame, chart_key: tuple, sig_ts, sig_px, dark_theme: bool, high_fidelity: bool):
+    """
+    Candlestick, WaveTrend, signal and volume figure for the loaded bars.
+    Keyed on chart_key (data_key, whose digest covers every OHLCV column including volume, and indicator
+    params) so unrelated reruns reuse the built figure.
+    """
+    go = _plotly()
+    make_subplots = _make_subplots()
+    # Signals are taken from the full frame; only the plotted bars are merged
+    plot_df = _df if high_fidelity else downsample_ohlc(_df, CHART_MAX_BARS)
+    show_volume = 'volume' in plot_df.columns
+    rows = 3 if show_volume else 2
+    fig = make_subplots(
+        rows=rows, cols=1, 
+        shared_xaxes=True, 
+        vertical_spacing=0.02,
+        row_heights=[0.6, 0.25] + ([0.15] if show_volume else []),
+        subplot_titles=['Price Action', 'WaveTrend Oscillator'] + (['Volume'] if show_volume else [])
+    )
 
-# WaveTrend indicators
-fig.add_trace(
-    go.Scatter(
-        x=df['timestamp'], 
-        y=df['wt1'], 
-        name='WT1', 
-        line=dict(color='#48bb78', width=2),
-        hovertemplate='WT1: %{y:.2f}<extra></extra>'
-    ), 
-    row=2, col=1
-)
-fig.add_trace(
-    go.Scatter(
-        x=df['timestamp'], 
-        y=df['wt2'], 
-        name='WT2', 
-        line=dict(color='#a0aec0', width=2),
-        hovertemplate='WT2: %{y:.2f}<extra></extra>'
-    ), 
-    row=2, col=1
-)
+    # Main candlestick chart
+    fig.add_trace(
+        go.Candlestick(
+            x=plot_df['timestamp'], 
+            open=plot_df['open'], 
+            high=plot_df['high'], 
+            low=plot_df['low'], 
+            close=plot_df['close'], 
+            name='OHLC',
+            increasing_line_color='#48bb78',
+            decreasing_line_color='#f56565',
+            increasing_fillcolor='rgba(72, 187, 120, 0.1)',
+            decreasing_fillcolor='rgba(245, 101, 101, 0.1)'
+        ),
+        row=1, col=1
+    )
+
+    # WaveTrend indicators
+    fig.add_trace(
+        go.Scatter(
+            x=plot_df['timestamp'], 
+            y=plot_df['wt1'], 
+            name='WT1', 
+            line=dict(color='#48bb78', width=2),
+            hovertemplate='WT1: %{y:.2f}<extra></extra>'
+        ), 
+        row=2, col=1
+    )
+    fig.add_trace(
+        go.Scatter(
+            x=plot_df['timestamp'], 
+            y=plot_df['wt2'], 
+            name='WT2', 
+            line=dict(color='#a0aec0', width=2),
+            hovertemplate='WT2: %{y:.2f}<extra></extra>'
+        ), 
+        row=2, col=1
+    )
 
-# Trading signals
-try:
-    sig_idx = df.index[df['signal'] == True]
-    if len(sig_idx) > 0:
+    # Trading signals
+    if sig_ts is not None and len(sig_ts) > 0:
         fig.add_trace(
             go.Scatter(
-                x=df.loc[sig_idx, 'timestamp'],
-                y=df.loc[sig_idx, 'close'],
+                x=sig_ts,
+                y=sig_px,
                 mode='markers+text',
                 name='Buy Signals',
                 marker=dict(
@@ -1366,73 +1310,68 @@ try:
                     color='#48bb78', 
                     line=dict(width=2, color='#2d7d32')
                 ),
-                text=['BUY'] * len(sig_idx),
+                text='BUY',
                 textposition='top center',
                 textfont=dict(color='white', size=10),
                 hovertemplate='<b>BUY Signal</b><br>Time: %{x}<br>Price: $%{y:.6f}<extra></extra>'
             ),
             row=1, col=1
         )
-except Exception:
-    pass
 
-# Volume chart
-if show_volume:
-    fig.add_trace(
-        go.Bar(
-            x=df['timestamp'], 
-            y=df['volume'], 
-            name='Volume', 
-            marker_color='#4299e1',
-            opacity=0.7,
-            hovertemplate='Volume: %{y:,.0f}<extra></extra>'
-        ), 
-        row=3, col=1
-    )
+    # Volume chart
+    if show_volume:
+        fig.add_trace(
+            go.Bar(
+                x=plot_df['timestamp'], 
+                y=plot_df['volume'], 
+                name='Volume', 
+                marker_color='#4299e1',
+                opacity=0.7,
+                hovertemplate='Volume: %{y:,.0f}<extra></extra>'
+            ), 
+            row=3, col=1
+        )
 
-# Chart styling
-fig.update_layout(
-    template='plotly_dark' if dark_theme else 'plotly_white',
-    height=600,
-    margin=dict(l=20, r=20, t=40, b=20),
-    showlegend=True,
-    legend=dict(
-        orientation="h",
-        yanchor="bottom",
-        y=1.02,
-        xanchor="right",
-        x=1
-    ),
-    xaxis_rangeslider_visible=False,
-    plot_bgcolor='rgba(0,0,0,0)',
-    paper_bgcolor='rgba(0,0,0,0)'
-)
+    # Chart styling
+    fig.update_layout(
+        template='plotly_dark' if dark_theme else 'plotly_white',
+        height=600,
+        margin=dict(l=20, r=20, t=40, b=20),
+        showlegend=True,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        ),
+        xaxis_rangeslider_visible=False,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
 
-fig.update_xaxes(showgrid=True, gridcolor='rgba(160, 174, 192, 0.1)')
-fig.update_yaxes(showgrid=True, gridcolor='rgba(160, 174, 192, 0.1)')
+    fig.update_xaxes(showgrid=True, gridcolor='rgba(160, 174, 192, 0.1)')
+    fig.update_yaxes(showgrid=True, gridcolor='rgba(160, 174, 192, 0.1)')
+    return fig
 
-st.plotly_chart(fig, use_container_width=True, config={
-    'displaylogo': False,
-    'responsive': True,
-    'modeBarButtonsToRemove': ['select2d', 'lasso2d', 'pan2d', 'zoom2d', 'autoScale2d'],
-    'displayModeBar': True
-})
+go = _plotly()
+if 'signal' in df.columns:
+    sig_pos = np.flatnonzero(df['signal'].to_numpy(dtype=bool))
+    sig_ts = df['timestamp'].to_numpy()[sig_pos]
+    sig_px = df['close'].to_numpy()[sig_pos]
+else:
+    sig_ts = sig_px = None
+fig = build_main_chart(df, (data_key, int(wt_channel), int(wt_avg)), sig_ts, sig_px, dark_theme, high_fidelity_chart)
 
-st.markdown("</div>", unsafe_allow_html=True)
+st.plotly_chart(fig, use_container_width=True, key="main_chart", config=PLOTLY_CONFIG)
 
 # Technical Indicators Section
-st.markdown("""
-<div style="background: var(--card-bg); padding: 1.5rem; border-radius: var(--border-radius); 
-            border: 1px solid var(--border-color); margin-bottom: 1.5rem;">
-    <h3 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; gap: 0.5rem;">
-        📊 Technical Indicators
-    </h3>
-""", unsafe_allow_html=True)
+st.markdown(INDICATORS_HEADER_HTML, unsafe_allow_html=True)
 
 # KPI Cards
 k1, k2, k3, k4 = st.columns(4)
 with k1:
-    rsi_val = float(df['rsi'].iat[-1])
+    rsi_val = float(tail['rsi'][-1])
     rsi_color = "#f56565" if rsi_val > 70 else "#48bb78" if rsi_val < 30 else "#a0aec0"
     st.markdown(f"""
     <div class="metric-card">
@@ -1442,7 +1381,7 @@ with k1:
     """, unsafe_allow_html=True)
 
 with k2:
-    wt1_val = float(df['wt1'].iat[-1])
+    wt1_val = float(tail['wt1'][-1])
     st.markdown(f"""
     <div class="metric-card">
         <div class="metric-value">{wt1_val:.2f}</div>
@@ -1451,7 +1390,7 @@ with k2:
     """, unsafe_allow_html=True)
 
 with k3:
-    wt2_val = float(df['wt2'].iat[-1])
+    wt2_val = float(tail['wt2'][-1])
     st.markdown(f"""
     <div class="metric-card">
         <div class="metric-value">{wt2_val:.2f}</div>
@@ -1468,34 +1407,22 @@ with k4:
     </div>
     """, unsafe_allow_html=True)
 
-st.markdown("</div>", unsafe_allow_html=True)
-
-# Recent Data Table
-st.markdown("""
-<div style="background: var(--card-bg); padding: 1.5rem; border-radius: var(--border-radius); 
-            border: 1px solid var(--border-color); margin-bottom: 1.5rem;">
-    <h3 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; gap: 0.5rem;">
-        📋 Recent Market Data
-    </h3>
-""", unsafe_allow_html=True)
-
-# Style the dataframe
-styled_df = df.tail(20).copy()
-styled_df['timestamp'] = pd.to_datetime(styled_df['timestamp']).dt.strftime('%H:%M:%S')
-styled_df = styled_df.round(6)
-
-st.markdown(styled_df.to_html(escape=False, index=False), unsafe_allow_html=True)
-
-st.markdown("</div>", unsafe_allow_html=True)
+# Recent Data Table, only built when switched on in the sidebar
+with st.expander("📋 Recent Market Data", expanded=show_table):
+    if show_table:
+        # Ship the rows as an Arrow table instead of a rendered HTML string
+        styled_df = df.tail(20).round(6)
+        st.dataframe(
+            styled_df,
+            use_container_width=True,
+            hide_index=True,
+            column_config={'timestamp': st.column_config.DatetimeColumn("timestamp", format="HH:mm:ss")}
+        )
+    else:
+        st.caption("Enable '📋 Show recent data table' in the sidebar to load the latest bars.")
 
 # Trading Status Section
-st.markdown("""
-<div style="background: var(--card-bg); padding: 1.5rem; border-radius: var(--border-radius); 
-            border: 1px solid var(--border-color); margin-bottom: 1.5rem;">
-    <h3 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; gap: 0.5rem;">
-        💼 Trading Status & Positions
-    </h3>
-""", unsafe_allow_html=True)
+st.markdown(TRADING_STATUS_HEADER_HTML, unsafe_allow_html=True)
 
 cpos, cords = st.columns([1, 2])
 with cpos:
@@ -1504,6 +1431,8 @@ with cpos:
         pnl = (last_close - p['entry_price']) * p['qty']
         pnl_color = "#48bb78" if pnl >= 0 else "#f56565"
         bars_in_trade = len(df) - p['entry_idx'] if 'entry_idx' in p else 0
+        stop_price = p.get('stop_price', p['entry_price'] * (1 - stop_loss_pct))
+        tp_price = p.get('tp_price', p['entry_price'] * (1 + take_profit_pct))
         
         st.markdown(f"""
         <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
@@ -1531,140 +1460,77 @@ with cpos:
                 <hr style="border-color: var(--border-color); margin: 0.5rem 0;">
                 <div style="display: flex; justify-content: space-between;">
                     <span style="color: var(--text-secondary);">Stop Loss:</span>
-                    <span style="color: var(--accent-red); font-weight: 600;">${(p['entry_price']*(1-float(stop_loss_pct))):.6f}</span>
+                    <span style="color: var(--accent-red); font-weight: 600;">${stop_price:.6f}</span>
                 </div>
                 <div style="display: flex; justify-content: space-between;">
                     <span style="color: var(--text-secondary);">Take Profit:</span>
-                    <span style="color: var(--accent-green); font-weight: 600;">${(p['entry_price']*(1+float(take_profit_pct))):.6f}</span>
+                    <span style="color: var(--accent-green); font-weight: 600;">${tp_price:.6f}</span>
                 </div>
             </div>
         </div>
         """, unsafe_allow_html=True)
     else:
-        st.markdown("""
-        <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
-                    border: 1px solid var(--border-color); text-align: center;">
-            <h4 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; justify-content: center; gap: 0.5rem;">
-                ⏳ No Open Position
-            </h4>
-            <p style="color: var(--text-secondary); margin: 0;">
-                Waiting for next trading signal...
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(NO_OPEN_POSITION_HTML, unsafe_allow_html=True)
 
 with cords:
     if st.session_state['trades']:
-        st.markdown("""
-        <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
-                    border: 1px solid var(--border-color);">
-            <h4 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; gap: 0.5rem;">
-                📋 Recent Trades
-            </h4>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(RECENT_TRADES_HEADER_HTML, unsafe_allow_html=True)
         
-        trades_df = pd.DataFrame(st.session_state['trades'])
-        if not trades_df.empty:
-            trades_df = trades_df.tail(10)  # Show only last 10 trades
-            st.markdown(trades_df.to_html(escape=False, index=False), unsafe_allow_html=True)
+        # Show only last 10 trades
+        st.markdown(trades_html(_trades_key(st.session_state['trades'], 10)), unsafe_allow_html=True)
     else:
-        st.markdown("""
-        <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
-                    border: 1px solid var(--border-color); text-align: center;">
-            <h4 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; justify-content: center; gap: 0.5rem;">
-                📊 No Trades Yet
-            </h4>
-            <p style="color: var(--text-secondary); margin: 0;">
-                Start trading to see your trade history here.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-
-st.markdown("</div>", unsafe_allow_html=True)
+        st.markdown(NO_RECENT_TRADES_HTML, unsafe_allow_html=True)
 
 # Indicator Sparklines Section
-st.markdown("""
-<div style="background: var(--card-bg); padding: 1.5rem; border-radius: var(--border-radius); 
-            border: 1px solid var(--border-color); margin-bottom: 1.5rem;">
-    <h3 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; gap: 0.5rem;">
-        📈 Indicator Trends
-    </h3>
-""", unsafe_allow_html=True)
+st.markdown(INDICATOR_TRENDS_HEADER_HTML, unsafe_allow_html=True)
 
-spr1, spr2, spr3 = st.columns(3)
-with spr1:
-    rsi_fig = go.Figure()
-    rsi_fig.add_trace(go.Scatter(
-        x=df['timestamp'].tail(100), 
-        y=df['rsi'].tail(100), 
+@st.cache_data(max_entries=32, show_spinner=False)
+def build_sparkline(name: str, x_bytes: bytes, y_bytes: bytes, color: str, dark_theme: bool, y_range: tuple = None):
+    """
+    Small line chart for one indicator over the last 100 bars.
+    Keyed on the raw bytes of the plotted arrays, which hash in microseconds.
+    """
+    go = _plotly()
+    fig = go.Figure()
+    # WebGL trace: the browser uploads one vertex buffer instead of rebuilding SVG paths
+    fig.add_trace(go.Scattergl(
+        x=np.frombuffer(x_bytes, dtype='datetime64[ns]'), 
+        y=np.frombuffer(y_bytes, dtype=np.float64), 
         mode='lines', 
-        line=dict(color="#4299e1", width=2),
-        name="RSI"
+        line=dict(color=color, width=2),
+        name=name
     ))
-    rsi_fig.update_layout(
+    fig.update_layout(
         height=150, 
         margin=dict(l=10, r=10, t=20, b=10), 
         xaxis_visible=False, 
-        yaxis_title="RSI",
+        yaxis_title=name,
         template='plotly_dark' if dark_theme else 'plotly_white',
         plot_bgcolor='rgba(0,0,0,0)',
         paper_bgcolor='rgba(0,0,0,0)',
         showlegend=False
     )
-    rsi_fig.update_yaxes(range=[0, 100])
-    st.plotly_chart(rsi_fig, use_container_width=True, config={'displaylogo': False, 'modeBarButtonsToRemove': ['select2d','lasso2d']})
+    if y_range is not None:
+        fig.update_yaxes(range=list(y_range))
+    return fig
 
-with spr2:
-    wt1_fig = go.Figure()
-    wt1_fig.add_trace(go.Scatter(
-        x=df['timestamp'].tail(100), 
-        y=df['wt1'].tail(100), 
-        mode='lines', 
-        line=dict(color="#48bb78", width=2),
-        name="WT1"
-    ))
-    wt1_fig.update_layout(
-        height=150, 
-        margin=dict(l=10, r=10, t=20, b=10), 
-        xaxis_visible=False, 
-        yaxis_title="WT1",
-        template='plotly_dark' if dark_theme else 'plotly_white',
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        showlegend=False
-    )
-    st.plotly_chart(wt1_fig, use_container_width=True, config={'displaylogo': False, 'modeBarButtonsToRemove': ['select2d','lasso2d']})
+spark_x = df['timestamp'].to_numpy(dtype='datetime64[ns]')[-100:].tobytes()
 
-with spr3:
-    wt2_fig = go.Figure()
-    wt2_fig.add_trace(go.Scatter(
-        x=df['timestamp'].tail(100), 
-        y=df['wt2'].tail(100), 
-        mode='lines', 
-        line=dict(color="#a0aec0", width=2),
-        name="WT2"
-    ))
-    wt2_fig.update_layout(
-        height=150, 
-        margin=dict(l=10, r=10, t=20, b=10), 
-        xaxis_visible=False, 
-        yaxis_title="WT2",
-        template='plotly_dark' if dark_theme else 'plotly_white',
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        showlegend=False
-    )
-    st.plotly_chart(wt2_fig, use_container_width=True, config={'displaylogo': False, 'modeBarButtonsToRemove': ['select2d','lasso2d']})
+def _spark_y(col: str) -> bytes:
+    return df[col].to_numpy(dtype=np.float64)[-100:].tobytes()
 
-st.markdown("</div>", unsafe_allow_html=True)
+spr1, spr2, spr3 = st.columns(3)
+with spr1:
+    rsi_fig = build_sparkline("RSI", spark_x, _spark_y('rsi'), "#4299e1", dark_theme, (0, 100))
+    st.plotly_chart(rsi_fig, use_container_width=True, key="spark_rsi", config=SPARKLINE_CONFIG)
 
-latest_idx = len(df) - 1
-latest_price = float(df['close'].iat[latest_idx]) if not pd.isna(df['close'].iat[latest_idx]) else 0.0
-signal_now = bool(df['signal'].iat[latest_idx])
-wt_cross_down_now = False
-if latest_idx > 0:  # Prevent index out of bounds
-    wt_cross_down_now = (df['wt1'].iat[latest_idx-1] >= df['wt2'].iat[latest_idx-1]) and (df['wt1'].iat[latest_idx] < df['wt2'].iat[latest_idx])
+with spr2:
+    wt1_fig = build_sparkline("WT1", spark_x, _spark_y('wt1'), "#48bb78", dark_theme)
+    st.plotly_chart(wt1_fig, use_container_width=True, key="spark_wt1", config=SPARKLINE_CONFIG)
+
+with spr3:
+    wt2_fig = build_sparkline("WT2", spark_x, _spark_y('wt2'), "#a0aec0", dark_theme)
+    st.plotly_chart(wt2_fig, use_container_width=True, key="spark_wt2", config=SPARKLINE_CONFIG)
 
 # Show latest signal badge
 sig_badge = "No signal"
@@ -1676,8 +1542,7 @@ if signal_now:
     if st.session_state['is_trading']:
         try:
             # Mode-specific trading logic
-            paper_mode = st.session_state.get('paper_mode', True)
-            if paper_mode:
+            if paper:
                 print(f"PAPER_TRADING: Processing simulated trades for {symbol}")
             else:
                 print(f"REAL_TRADING: Processing trades for {symbol}")
@@ -1687,17 +1552,11 @@ if signal_now:
                 pos = st.session_state['position']
                 entry_price = pos['entry_price']
                 qty = pos['qty']
-                stop_price = entry_price * (1 - float(stop_loss_pct))
-                tp_price = entry_price * (1 + float(take_profit_pct))
+                stop_price = pos.get('stop_price', entry_price * (1 - stop_loss_pct))
+                tp_price = pos.get('tp_price', entry_price * (1 + take_profit_pct))
                 bars_in_trade = latest_idx - pos['entry_idx']
-                should_exit = False
-                if latest_price <= stop_price or latest_price >= tp_price:
-                    should_exit = True
-                if not should_exit and wt_cross_down_now:
-                    should_exit = True
-                if not should_exit and bars_in_trade >= int(max_bars_in_trade):
-                    should_exit = True
-                if should_exit:
+                if should_exit_position(latest_price, stop_price, tp_price, bars_in_trade,
+                                        max_bars_in_trade, wt_cross_down_now):
                     side = 'sell' if qty > 0 else 'buy'
                     order = _exec.place_market_order(symbol, side, abs(qty))
                     pnl = (latest_price - entry_price) * qty
@@ -1708,6 +1567,7 @@ if signal_now:
                             'exit_price': latest_price,
                             'pnl': pnl
                         })
+                        st.session_state['_metrics_dirty'] = True
                     try:
                         log_trade('logs/trades.csv', {
                             'symbol': symbol,
@@ -1721,26 +1581,28 @@ if signal_now:
                         pass
                     st.session_state['position'] = None
 
-            # Entry logic - Only trade when strategy generates signal
-            if st.session_state['position'] is None and signal_now and not pd.isna(latest_price) and latest_price > 0:
+            # Entry logic - Only trade when strategy generates signal, at most once per bar
+            if new_bar and st.session_state['position'] is None and signal_now and not pd.isna(latest_price) and latest_price > 0:
+                st.session_state['last_processed_ts'] = latest_bar_ts
                 # Validate signal is from current strategy
-                current_rsi = float(df['rsi'].iat[latest_idx])
-                current_wt1 = float(df['wt1'].iat[latest_idx])
-                current_wt2 = float(df['wt2'].iat[latest_idx])
+                current_rsi = float(tail['rsi'][latest_idx])
+                current_wt1 = float(tail['wt1'][latest_idx])
+                current_wt2 = float(tail['wt2'][latest_idx])
                 
                 # Additional validation for auto strategy
                 if strat_choice == 'auto':
                     rsi_valid = current_rsi < rsi_oversold
                     wt_valid = current_wt1 > current_wt2
                     if rsi_valid and wt_valid:
-                        risk_usd = st.session_state['account']['cash'] * float(risk_per_trade)
-                        qty = position_size_from_risk(st.session_state['account']['cash'], float(risk_per_trade), latest_price)
+                        qty = position_size_from_risk(st.session_state['account']['cash'], risk_per_trade, latest_price)
                         if qty > 0:
                             order = _exec.place_market_order(symbol, 'buy', qty)
                             st.session_state['position'] = {
                                 'entry_price': latest_price, 
                                 'qty': qty, 
                                 'entry_idx': latest_idx,
+                                'stop_price': latest_price * (1 - stop_loss_pct),
+                                'tp_price': latest_price * (1 + take_profit_pct),
                                 'strategy': strat_choice,
                                 'entry_rsi': current_rsi,
                                 'entry_wt1': current_wt1,
@@ -1753,6 +1615,7 @@ if signal_now:
                                 'strategy': strat_choice,
                                 'entry_rsi': current_rsi
                             })
+                            st.session_state['_metrics_dirty'] = True
                             try:
                                 log_trade('logs/trades.csv', {
                                     'symbol': symbol,
@@ -1767,14 +1630,15 @@ if signal_now:
                                 pass
                 else:
                     # For other strategies, use the signal as is
-                    risk_usd = st.session_state['account']['cash'] * float(risk_per_trade)
-                    qty = position_size_from_risk(st.session_state['account']['cash'], float(risk_per_trade), latest_price)
+                    qty = position_size_from_risk(st.session_state['account']['cash'], risk_per_trade, latest_price)
                     if qty > 0:
                         order = _exec.place_market_order(symbol, 'buy', qty)
                         st.session_state['position'] = {
                             'entry_price': latest_price, 
                             'qty': qty, 
                             'entry_idx': latest_idx,
+                            'stop_price': latest_price * (1 - stop_loss_pct),
+                            'tp_price': latest_price * (1 + take_profit_pct),
                             'strategy': strat_choice
                         }
                         st.session_state['trades'].append({
@@ -1783,6 +1647,7 @@ if signal_now:
                             'qty': qty,
                             'strategy': strat_choice
                         })
+                        st.session_state['_metrics_dirty'] = True
                         try:
                             log_trade('logs/trades.csv', {
                                 'symbol': symbol,
@@ -1804,7 +1669,7 @@ if signal_now:
                 equity_val = st.session_state['account']['cash']
             st.session_state['account']['equity'].append(float(equity_val))
             try:
-                log_pnl('logs/equity.csv', float(equity_val))
+                log_pnl_buffered('logs/equity.csv', float(equity_val))
             except Exception:
                 pass
 
@@ -1813,17 +1678,13 @@ if signal_now:
             st.session_state['is_trading'] = False  # Stop trading on error
 
 # Right Sidebar - Enhanced Tabs
-st.markdown("""
-<div style="background: var(--card-bg); padding: 1.5rem; border-radius: var(--border-radius); 
-            border: 1px solid var(--border-color); margin-bottom: 1.5rem;">
-    <h3 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; gap: 0.5rem;">
-        📊 Market Analysis & Tools
-    </h3>
-""", unsafe_allow_html=True)
+st.markdown(ANALYSIS_TOOLS_HEADER_HTML, unsafe_allow_html=True)
 
-tabs = st.tabs(["🎯 Strategy", "💼 Account", "📋 Orders", "📈 Market", "🚨 Signals", "🔍 Arbitrage", "⚙️ Order Management", "📊 Comprehensive Metrics", "🚨 Error Log"]) 
+# st.tabs runs every tab body on each rerun; a keyed selector lets only the visible section execute
+active_tab = st.radio("Section", TAB_LABELS, horizontal=True, key="active_tab", label_visibility="collapsed")
+active_tab_idx = TAB_LABELS.index(active_tab)
 
-with tabs[0]:
+if active_tab_idx == 0:
     # Get current strategy name
     current_strategy = strat_choice if 'strat_choice' in locals() else 'auto'
     strategy_name = {
@@ -1840,7 +1701,7 @@ with tabs[0]:
     rsi_threshold = rsi_oversold
     refresh_display = refresh_secs
     is_trading = 'is_trading' in st.session_state and st.session_state['is_trading']
-    last_signal = 'BUY' if 'df' in locals() and len(df) > 0 and 'signal' in df.columns and bool(df['signal'].iat[-1]) else 'No Signal'
+    last_signal = 'BUY' if 'signal' in tail and len(tail['signal']) > 0 and bool(tail['signal'][-1]) else 'No Signal'
     
     st.markdown(f"""
     <div class="strategy-card">
@@ -1850,41 +1711,8 @@ with tabs[0]:
     </div>
     """, unsafe_allow_html=True)
     
-    # Entry Conditions
-    with st.container():
-        st.markdown("""
-        <div class="conditions-list">
-            <h4>Entry Conditions</h4>
-            <ul>
-        """, unsafe_allow_html=True)
-        
-        if current_strategy in ['auto', 'rsi_bbands']:
-            st.markdown(f'<li>RSI below oversold threshold ({rsi_threshold})</li>', unsafe_allow_html=True)
-        if current_strategy == 'auto':
-            st.markdown('<li>WaveTrend cross up (WT1 > WT2)</li>', unsafe_allow_html=True)
-        if current_strategy == 'ema_crossover':
-            st.markdown('<li>EMA Fast crosses above EMA Slow</li>', unsafe_allow_html=True)
-        if current_strategy == 'rsi_bbands':
-            st.markdown('<li>Price below Bollinger Lower Band</li>', unsafe_allow_html=True)
-        if current_strategy == 'grid':
-            st.markdown('<li>Price crosses below grid level</li>', unsafe_allow_html=True)
-        
-        st.markdown("</ul></div>", unsafe_allow_html=True)
-    
-    # Exit Conditions
-    with st.container():
-        st.markdown(f"""
-        <div class="conditions-list">
-            <h4>Exit Conditions</h4>
-            <ul>
-                <li>Stop Loss: {sl_display}</li>
-                <li>Take Profit: {tp_display}</li>
-        """, unsafe_allow_html=True)
-        
-        if current_strategy == 'auto':
-            st.markdown('<li>WaveTrend cross down</li>', unsafe_allow_html=True)
-        
-        st.markdown(f'<li>Max bars in trade: {max_bars_display}</li></ul></div>', unsafe_allow_html=True)
+    # Entry and exit conditions go out as one markdown element
+    st.markdown(strategy_conditions_html(current_strategy, rsi_threshold, sl_display, tp_display, max_bars_display), unsafe_allow_html=True)
     
     # Strategy Status
     status_color = "var(--accent-green)" if is_trading else "var(--accent-red)"
@@ -1899,107 +1727,47 @@ with tabs[0]:
     </div>
     """, unsafe_allow_html=True)
 
-with tabs[1]:
+if active_tab_idx == 1:
     # Account tab - Balance removed, now only shows in sidebar
-    st.markdown("""
-    <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
-                border: 1px solid var(--border-color); text-align: center;">
-        <h4 style="margin: 0 0 1rem 0; color: var(--text-primary);">
-            📊 Account Information
-        </h4>
-        <p style="color: var(--text-secondary); margin: 0;">
-            Balance information is now displayed in the sidebar for easy access.
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(ACCOUNT_TAB_HTML, unsafe_allow_html=True)
 
-with tabs[2]:
+if active_tab_idx == 2:
     # Show real trading data if available, otherwise show simulated data
     if not paper and st.session_state['real_account_data'] and st.session_state['real_account_data'].get('trades'):
         # Real trading history
         real_trades = st.session_state['real_account_data']['trades']
         if real_trades:
-            st.markdown("""
-            <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
-                        border: 1px solid var(--border-color);">
-                <h4 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; gap: 0.5rem;">
-                    📋 Real Trading History
-                </h4>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(REAL_TRADES_HEADER_HTML, unsafe_allow_html=True)
             
-            # Display real trades
-            for trade in real_trades[:10]:  # Show last 10 real trades
-                symbol = trade.get('symbol', 'Unknown')
-                side = trade.get('side', 'Unknown')
-                qty = trade.get('qty', 0)
-                price = trade.get('price', 0)
-                timestamp = trade.get('timestamp', 0)
-                
-                # Format timestamp
-                try:
-                    if timestamp:
-                        trade_time = pd.to_datetime(timestamp, unit='ms').strftime('%H:%M:%S')
-                    else:
-                        trade_time = 'Unknown'
-                except:
-                    trade_time = 'Unknown'
-                
-                st.markdown(f"""
-                <div style="background: var(--card-bg); padding: 0.75rem; border-radius: 6px; margin: 0.5rem 0; border-left: 4px solid var(--accent-blue);">
-                    <div style="display: flex; justify-content: space-between; align-items: center;">
-                        <span style="color: var(--text-primary); font-weight: 600;">{symbol}</span>
-                        <span style="color: var(--text-secondary); font-size: 0.9rem;">{trade_time}</span>
-                    </div>
-                    <div style="color: var(--text-secondary); font-size: 0.9rem;">
-                        {side} • Qty: {qty} • Price: ${float(price):,.4f}
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+            # Last 10 real trades as one Arrow-backed table; missing or invalid timestamps stay blank
+            trades_df = pd.DataFrame(real_trades[:10]).reindex(columns=['symbol', 'side', 'qty', 'price', 'timestamp'])
+            ts_ms = pd.to_numeric(trades_df['timestamp'], errors='coerce')
+            trades_df['timestamp'] = pd.to_datetime(ts_ms.where(ts_ms > 0), unit='ms', utc=True)
+            trades_df['price'] = pd.to_numeric(trades_df['price'], errors='coerce')
+            st.dataframe(
+                trades_df,
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    'timestamp': st.column_config.DatetimeColumn("time", format="HH:mm:ss"),
+                    'price': st.column_config.NumberColumn("price", format="$%.4f"),
+                }
+            )
         else:
-            st.markdown("""
-            <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
-                        border: 1px solid var(--border-color); text-align: center;">
-                <h4 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; justify-content: center; gap: 0.5rem;">
-                    📊 No Real Trades Yet
-                </h4>
-                <p style="color: var(--text-secondary); margin: 0;">
-                    Start real trading to see your trade history here.
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(NO_REAL_TRADES_HTML, unsafe_allow_html=True)
     else:
         # Simulated trading history
         if st.session_state['trades']:
-            st.markdown("""
-            <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
-                        border: 1px solid var(--border-color);">
-                <h4 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; gap: 0.5rem;">
-                    📋 Simulated Trade History
-                </h4>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(SIM_TRADES_HEADER_HTML, unsafe_allow_html=True)
             
-            trades_df = pd.DataFrame(st.session_state['trades'])
-            if not trades_df.empty:
-                trades_df = trades_df.tail(20)  # Show last 20 trades
-                st.markdown(trades_df.to_html(escape=False, index=False), unsafe_allow_html=True)
+            # Show last 20 trades
+            st.markdown(trades_html(_trades_key(st.session_state['trades'], 20)), unsafe_allow_html=True)
         else:
-            st.markdown("""
-            <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
-                        border: 1px solid var(--border-color); text-align: center;">
-                <h4 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; justify-content: center; gap: 0.5rem;">
-                    📊 No Trades Yet
-                </h4>
-                <p style="color: var(--text-secondary); margin: 0;">
-                    Start trading to see your trade history here.
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(NO_SIM_TRADES_HTML, unsafe_allow_html=True)
 
-with tabs[3]:
+if active_tab_idx == 3:
     try:
-        tk = _exec.fetch_ticker(symbol)
+        tk = fetch_ticker_cached(_exec, ex_name, paper, symbol, int(time.time() // max(2, int(refresh_secs))))
         last = tk.get('last') or tk.get('close') or 0.0
         high24 = tk.get('high') or 0.0
         low24 = tk.get('low') or 0.0
@@ -2014,14 +1782,7 @@ with tabs[3]:
             except Exception:
                 return "N/A"
         
-        st.markdown("""
-        <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
-                    border: 1px solid var(--border-color);">
-            <h4 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; gap: 0.5rem;">
-                📈 Market Data
-            </h4>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(MARKET_DATA_HEADER_HTML, unsafe_allow_html=True)
         
         colm1, colm2 = st.columns(2)
         with colm1:
@@ -2036,8 +1797,8 @@ with tabs[3]:
     except Exception as e:
         st.error(f"Unable to fetch market data: {e}")
 
-with tabs[4]:
-    signal_now = bool(df['signal'].iat[-1]) if len(df) > 0 else False
+if active_tab_idx == 4:
+    signal_now = bool(tail['signal'][-1]) if len(tail['signal']) > 0 else False
     sig_badge = "BUY Signal Active" if signal_now else "No Signal"
     sig_color = "#48bb78" if signal_now else "#a0aec0"
     
@@ -2052,35 +1813,22 @@ with tabs[4]:
                 {sig_badge}
             </div>
             <div style="color: var(--text-secondary); font-size: 0.9rem;">
-                Last signal: {pd.Timestamp.now().strftime('%H:%M:%S')}
+                Last signal: {time.strftime('%H:%M:%S')}
             </div>
         </div>
     </div>
     """, unsafe_allow_html=True)
 
-with tabs[5]:
+if active_tab_idx == 5:
     if st.session_state['arb_running']:
-        st.markdown("""
-        <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
-                    border: 1px solid var(--border-color);">
-            <h4 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; gap: 0.5rem;">
-                🔍 Arbitrage Scanner
-            </h4>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(ARB_SCANNER_HEADER_HTML, unsafe_allow_html=True)
         
         try:
-            # Build simple exchanges map for scanner
-            import ccxt
-            ex_map = {}
-            ex_map['binance'] = ccxt.binance()
-            ex_map['bybit'] = ccxt.bybit()
-            ex_map['mexc'] = ccxt.mexc()
+            opps, _ = _arb_scanner(symbol).latest()
             
-            scanner = ArbitrageEngine(ex_map, [symbol], threshold_bps=10.0)
-            opps = scanner.run_once()
-            
-            if opps:
+            if opps is None:
+                st.info("🔍 Scanning exchanges... results will appear on the next refresh.")
+            elif opps:
                 for o in opps:
                     st.markdown(f"""
                     <div style="background: var(--card-bg); padding: 1rem; border-radius: 8px; 
@@ -2097,39 +1845,15 @@ with tabs[5]:
                     </div>
                     """, unsafe_allow_html=True)
             else:
-                st.markdown("""
-                <div style="background: var(--card-bg); padding: 1rem; border-radius: 8px; 
-                            border: 1px solid var(--border-color); text-align: center;">
-                    <div style="color: var(--text-secondary);">
-                        🔍 No arbitrage opportunities found
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(NO_ARB_OPPORTUNITIES_HTML, unsafe_allow_html=True)
         except Exception as e:
             st.error(f"Arbitrage scanner error: {e}")
     else:
-        st.markdown("""
-        <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
-                    border: 1px solid var(--border-color); text-align: center;">
-            <h4 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; justify-content: center; gap: 0.5rem;">
-                🔍 Arbitrage Scanner
-            </h4>
-            <p style="color: var(--text-secondary); margin: 0;">
-                Scanner is currently disabled. Enable it in the sidebar to start scanning for arbitrage opportunities.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(ARB_DISABLED_HTML, unsafe_allow_html=True)
 
-with tabs[6]:
+if active_tab_idx == 6:
     # Order Management Tab
-    st.markdown("""
-    <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
-                border: 1px solid var(--border-color);">
-        <h4 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; gap: 0.5rem;">
-            ⚙️ Order Management
-        </h4>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(ORDER_MANAGEMENT_HEADER_HTML, unsafe_allow_html=True)
     
     if not paper and st.session_state['real_account_data'] and st.session_state['real_account_data'].get('orders'):
         # Real order management
@@ -2137,86 +1861,64 @@ with tabs[6]:
         if real_orders:
             st.markdown(f"**Open Orders ({len(real_orders)}):**")
             
-            for order in real_orders:
-                order_id = order.get('orderId', 'Unknown')
-                symbol = order.get('symbol', 'Unknown')
-                side = order.get('side', 'Unknown')
-                qty = order.get('qty', 0)
-                price = order.get('price', 0)
-                status = order.get('orderStatus', 'Unknown')
-                
-                col1, col2, col3 = st.columns([3, 1, 1])
-                
-                with col1:
-                    st.markdown(f"""
-                    <div style="background: var(--card-bg); padding: 0.75rem; border-radius: 6px; margin: 0.5rem 0;">
-                        <div style="color: var(--text-primary); font-weight: 600;">{symbol} • {side}</div>
-                        <div style="color: var(--text-secondary); font-size: 0.9rem;">
-                            Qty: {qty} • Price: ${float(price):,.4f} • Status: {status}
-                        </div>
-                        <div style="color: var(--text-secondary); font-size: 0.8rem;">
-                            ID: {order_id}
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                with col2:
-                    if st.button("❌ Cancel", key=f"cancel_{order_id}"):
-                        with st.spinner("Canceling order..."):
-                            try:
-                                result = _exec.cancel_order(order_id, symbol)
-                                if result.get('status') != 'error':
-                                    st.success(f"Order {order_id} canceled!")
-                                    # Refresh account data
-                                    account_data = _exec.get_account_info()
-                                    st.session_state['real_account_data'] = account_data
-                                    st.rerun()
-                                else:
-                                    st.error(f"Failed to cancel order: {result.get('error', 'Unknown error')}")
-                            except Exception as e:
-                                st.error(f"Error canceling order: {e}")
-                
-                with col3:
-                    if st.button("🔄 Refresh", key=f"refresh_{order_id}"):
-                        with st.spinner("Refreshing order data..."):
-                            try:
-                                account_data = _exec.get_account_info()
-                                st.session_state['real_account_data'] = account_data
-                                st.success("Order data refreshed!")
-                                st.rerun()
-                            except Exception as e:
-                                st.error(f"Error refreshing data: {e}")
+            # One editable grid instead of a card and two buttons per order; tick rows to cancel them
+            orders_df = pd.DataFrame(real_orders).reindex(columns=['orderId', 'symbol', 'side', 'qty', 'price', 'orderStatus'])
+            orders_df.insert(0, 'cancel', False)
+            edited = st.data_editor(
+                orders_df,
+                use_container_width=True,
+                hide_index=True,
+                disabled=list(orders_df.columns[1:]),
+                column_config={
+                    'cancel': st.column_config.CheckboxColumn("Cancel", default=False),
+                    'orderId': st.column_config.TextColumn("ID"),
+                    'orderStatus': st.column_config.TextColumn("Status"),
+                },
+                # Keyed on the order ids so ticks never carry over to a different order list
+                key=f"orders_grid_{hash(tuple(orders_df['orderId']))}"
+            )
+            selected = [order for order, tick in zip(real_orders, edited['cancel'].to_numpy()) if tick]
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                cancel_selected = st.button(f"❌ Cancel Selected ({len(selected)})", key="cancel_selected_orders", disabled=not selected)
+            with col2:
+                cancel_all = st.button("❌ Cancel All", key="cancel_all_orders")
+            with col3:
+                if st.button("🔄 Refresh", key="refresh_orders"):
+                    with st.spinner("Refreshing order data..."):
+                        try:
+                            refresh_account_data(_exec)
+                            st.rerun()
+                        except Exception as e:
+                            st.error(f"Error refreshing data: {e}")
+            
+            to_cancel = real_orders if cancel_all else selected if cancel_selected else []
+            if to_cancel:
+                with st.spinner(f"Canceling {len(to_cancel)} orders..."):
+                    try:
+                        results = _exec.cancel_orders(to_cancel)
+                        canceled = {o.get('orderId') for o, r in zip(to_cancel, results) if r.get('status') != 'error'}
+                        # Drop canceled orders locally; Refresh reconciles with the exchange
+                        st.session_state['real_account_data']['orders'] = [o for o in real_orders if o.get('orderId') not in canceled]
+                        if len(canceled) < len(to_cancel):
+                            st.error(f"Failed to cancel {len(to_cancel) - len(canceled)} of {len(to_cancel)} orders")
+                        else:
+                            st.rerun()
+                    except Exception as e:
+                        st.error(f"Error canceling orders: {e}")
         else:
-            st.markdown("""
-            <div style="background: var(--card-bg); padding: 1rem; border-radius: 8px; 
-                        border: 1px solid var(--border-color); text-align: center;">
-                <h4 style="margin: 0 0 1rem 0; color: var(--text-primary);">📋 No Open Orders</h4>
-                <p style="color: var(--text-secondary); margin: 0;">No orders to manage</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(NO_OPEN_ORDERS_HTML, unsafe_allow_html=True)
     else:
         # Paper trading or no real data
         if paper:
-            st.markdown("""
-            <div style="background: var(--card-bg); padding: 1rem; border-radius: 8px; 
-                        border: 1px solid var(--border-color); text-align: center;">
-                <h4 style="margin: 0 0 1rem 0; color: var(--text-primary);">📝 Paper Trading Mode</h4>
-                <p style="color: var(--text-secondary); margin: 0;">Order management not available in paper trading mode</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(ORDER_MANAGEMENT_PAPER_HTML, unsafe_allow_html=True)
         else:
-            st.markdown("""
-            <div style="background: var(--card-bg); padding: 1rem; border-radius: 8px; 
-                        border: 1px solid var(--border-color); text-align: center;">
-                <h4 style="margin: 0 0 1rem 0; color: var(--text-primary);">🔐 Real Trading Required</h4>
-                <p style="color: var(--text-secondary); margin: 0;">Enable real trading and fetch account data to manage orders</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(ORDER_MANAGEMENT_LOCKED_HTML, unsafe_allow_html=True)
     
     # Manual order placement (for advanced users)
     if not paper and st.session_state['account_validation'] and st.session_state['account_validation']['valid']:
-        st.markdown("---")
-        st.markdown("**Manual Order Placement:**")
+        st.markdown("---\n\n**Manual Order Placement:**")
         
         col1, col2 = st.columns(2)
         with col1:
@@ -2233,9 +1935,8 @@ with tabs[6]:
                         result = _exec.place_market_order(manual_symbol, manual_side, manual_qty, int(manual_leverage))
                         if result.get('status') != 'error':
                             st.success(f"Order placed successfully! ID: {result.get('id', 'Unknown')}")
-                            # Refresh account data
-                            account_data = _exec.get_account_info()
-                            st.session_state['real_account_data'] = account_data
+                            # A fill changes balance, positions and trades; always refetch
+                            refresh_account_data(_exec, force=True)
                             st.rerun()
                         else:
                             st.error(f"Failed to place order: {result.get('error', 'Unknown error')}")
@@ -2244,14 +1945,13 @@ with tabs[6]:
             else:
                 st.error("Please fill in all required fields")
 
-with tabs[7]:
+if active_tab_idx == 7:
     st.markdown('<div class="section-header">📊 Comprehensive Backtesting Metrics</div>', unsafe_allow_html=True)
     
-    # Initialize metrics calculator
-    metrics_calculator = ComprehensiveMetricsCalculator()
+    metrics_calculator = get_metrics_calculator()
 
     # Optional: run backtest on demand when triggered from sidebar
-    if st.session_state.get('backtest_trigger'):
+    if st.session_state['backtest_trigger']:
         st.session_state['backtest_trigger'] = False
         with st.spinner("Running backtest with current settings..."):
             try:
@@ -2266,30 +1966,29 @@ with tabs[7]:
                             df_bt['signal'] = generate_weighted_signals(df_bt).astype(bool)
                         except Exception:
                             df_bt['signal'] = False
-                    # Run enhanced backtest if available, else core
-                    try:
-                        from backtester.enhanced_backtester import run_enhanced_backtest
-                        bt_res = run_enhanced_backtest(
-                            df=df_bt,
-                            entry_col='signal',
-                            initial_cap=float(st.session_state.get('initial_capital', 10000.0)),
-                            risk_per_trade=float(st.session_state.get('risk_per_trade', 0.01)),
-                            stop_loss_pct=float(st.session_state.get('stop_loss_pct', 0.03)),
-                            take_profit_pct1=float(st.session_state.get('take_profit_pct1', 0.03)),
-                            take_profit_pct2=float(st.session_state.get('take_profit_pct2', 0.06)),
-                            max_bars_in_trade=int(st.session_state.get('max_bars_in_trade', 100)),
-                            fee_rate=0.0004,
-                            daily_breaker_active=bool(st.session_state.get('daily_breaker_active', False)),
-                            daily_pnl_limit=float(st.session_state.get('daily_loss_limit', -0.05)),
-                        )
-                    except Exception:
-                        from backtester.core import run_backtest as run_basic_backtest
-                        bt_res = run_basic_backtest(df_bt, entry_col='signal')
+                    # Stream the backtest so the equity curve draws while bars are processed
+                    from backtester.core import run_backtest_iter
+                    progress_chart = st.empty()
+                    for bars_done, equity_so_far, bt_res in run_backtest_iter(
+                        df_bt,
+                        entry_col='signal',
+                        initial_cap=float(initial_cap),
+                        risk_per_trade=risk_per_trade,
+                        stop_loss_pct=stop_loss_pct,
+                        take_profit_pct=take_profit_pct,
+                        max_bars_in_trade=max_bars_in_trade,
+                        progress_every=100,
+                    ):
+                        progress_chart.line_chart(np.asarray(equity_so_far), height=200)
 
                     # Persist into session for metrics tab
                     st.session_state['trades'] = bt_res.get('trades', [])
-                    st.session_state.setdefault('account', {'equity': []})
-                    st.session_state['account']['equity'] = bt_res.get('df', {}).get('equity', []) if isinstance(bt_res.get('df'), dict) else (bt_res.get('df')['equity'].tolist() if bt_res.get('df') is not None and 'equity' in bt_res.get('df').columns else st.session_state['account'].get('equity', []))
+                    bt_df = bt_res.get('df')
+                    if isinstance(bt_df, pd.DataFrame) and 'equity' in bt_df.columns:
+                        st.session_state['account']['equity'] = EquityBuffer(bt_df['equity'].to_numpy())
+                    elif isinstance(bt_df, dict) and 'equity' in bt_df:
+                        st.session_state['account']['equity'] = EquityBuffer(bt_df['equity'])
+                    st.session_state['_metrics_dirty'] = True
                     st.success("Backtest completed. Open '📊 Comprehensive Backtesting Metrics' tab.")
                 else:
                     st.warning("No market data available to backtest. Load data first.")
@@ -2297,20 +1996,22 @@ with tabs[7]:
                 st.error(f"Backtest error: {e}")
     
     # Check if we have trading data
-    if 'trades' in st.session_state and st.session_state['trades']:
-        trades = st.session_state['trades']
-        account = st.session_state.get('account', {'equity': [10000]})
-        equity_curve = pd.Series(account['equity'])
+    if st.session_state['trades']:
+        ss = st.session_state
         
-        # Calculate comprehensive metrics
+        # Recompute after a trade or backtest, or when the inputs change; other reruns render the stored result
         with st.spinner("Calculating comprehensive metrics..."):
             try:
-                metrics = metrics_calculator.calculate_comprehensive_metrics(
-                    equity_curve=equity_curve,
-                    trades=trades,
-                    initial_capital=initial_cap,
-                    risk_free_rate=0.02
-                )
+                trades = ss['trades']
+                metrics_inputs = (_metrics_key(trades), float(initial_cap))
+                if ss['_metrics_dirty'] or ss.get('metrics_inputs') != metrics_inputs or 'metrics_cached' not in ss:
+                    ss['metrics_cached'] = comprehensive_metrics(
+                        trades, metrics_inputs[0], ss['account']['equity'].view(),
+                        metrics_inputs[1], 0.02
+                    )
+                    ss['metrics_inputs'] = metrics_inputs
+                    ss['_metrics_dirty'] = False
+                metrics, report = ss['metrics_cached']
                 
                 # Display metrics report
                 st.markdown("### 📈 Performance Summary")
@@ -2336,16 +2037,29 @@ with tabs[7]:
                 # Detailed metrics
                 st.markdown("### 📋 Detailed Metrics")
                 
-                # Generate and display comprehensive report
-                report = metrics_calculator.generate_comprehensive_report(metrics)
+                # Display comprehensive report
                 st.text(report)
                 
                 # Export functionality
                 st.markdown("### 💾 Export Metrics")
                 if st.button("📥 Export Metrics to CSV"):
-                    filename = f"backtest_metrics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-                    metrics_calculator.export_metrics_to_csv(metrics, filename)
-                    st.success(f"Metrics exported to {filename}")
+                    # Suffix keeps exports started in the same second from overwriting each other
+                    filename = f"backtest_metrics_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}.csv"
+                    future = get_io_pool().submit(metrics_calculator.export_metrics_to_csv, metrics, filename)
+                    future.add_done_callback(functools.partial(_log_export_failure, filename))
+                    st.session_state['metrics_export'] = (filename, future)
+                    # A small CSV is normally written well within this; slower disks report on a later rerun
+                    wait_futures([future], timeout=2.0)
+
+                export = st.session_state.get('metrics_export')
+                if export:
+                    filename, future = export
+                    if not future.done():
+                        st.info(f"Exporting metrics to {filename}...")
+                    elif future.exception() is not None:
+                        st.error(f"Error exporting metrics: {future.exception()}")
+                    else:
+                        st.success(f"Metrics exported to {filename}")
                 
             except Exception as e:
                 st.error(f"Error calculating metrics: {str(e)}")
@@ -2353,30 +2067,25 @@ with tabs[7]:
         st.info("No trading data available. Run some trades to see comprehensive metrics.")
     
     # Multi-timeframe analysis results
-    if enable_mtf and 'mtf_analyzer' in locals():
+    mtf = st.session_state.get('mtf_analyzer') if enable_mtf and secondary_tfs else None
+    if mtf:
         st.markdown("### 🔄 Multi-Timeframe Analysis Results")
         
-        mtf_summary = mtf_analyzer.get_timeframe_summary()
+        mtf_summary, tf_df = mtf_summary_table(mtf, st.session_state['mtf_config'])
         
-        st.markdown(f"**Primary Timeframe:** {mtf_summary['primary_timeframe']}")
-        st.markdown(f"**Total Timeframes:** {mtf_summary['total_timeframes']}")
-        st.markdown(f"**Enabled Timeframes:** {mtf_summary['enabled_timeframes']}")
+        st.markdown(
+            f"**Primary Timeframe:** {mtf_summary['primary_timeframe']}  \n"
+            f"**Total Timeframes:** {mtf_summary['total_timeframes']}  \n"
+            f"**Enabled Timeframes:** {mtf_summary['enabled_timeframes']}"
+        )
         
         # Display timeframe configurations
-        tf_df = pd.DataFrame(mtf_summary['timeframes'])
         st.markdown("**Timeframe Configuration:**")
-        st.markdown(tf_df.to_html(escape=False, index=False), unsafe_allow_html=True)
+        st.dataframe(tf_df, hide_index=True, use_container_width=True)
 
-with tabs[8]:
+if active_tab_idx == 8:
     # Error Log Tab
-    st.markdown("""
-    <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
-                border: 1px solid var(--border-color);">
-        <h4 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; gap: 0.5rem;">
-            🚨 Error Log & Diagnostics
-        </h4>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(ERROR_LOG_HEADER_HTML, unsafe_allow_html=True)
     
     # Error log controls
     col1, col2, col3 = st.columns([2, 1, 1])
@@ -2395,67 +2104,39 @@ with tabs[8]:
             st.rerun()
     
     # Display recent errors
-    recent_errors = error_handler.get_recent_errors(20)
+    recent_errors, err_df = error_log_snapshot(error_handler.version, 20)
     
     if recent_errors:
         st.markdown(f"**Showing {len(recent_errors)} recent errors:**")
         
-        for error in reversed(recent_errors):  # Show newest first
-            error_time = error['timestamp']
-            error_type = error['type']
-            error_message = error['message']
-            error_id = error['id']
-            
-            # Color code by error type
-            if "API" in error_type:
-                color = "var(--accent-red)"
-                icon = "🔌"
-            elif "Validation" in error_type:
-                color = "var(--accent-blue)"
-                icon = "⚠️"
-            elif "Trading" in error_type:
-                color = "var(--accent-green)"
-                icon = "📈"
-            else:
-                color = "var(--text-secondary)"
-                icon = "❓"
-            
-            with st.expander(f"{icon} {error_type} - {error_time[:19]}", expanded=False):
-                st.markdown(f"**Error ID:** `{error_id}`")
-                st.markdown(f"**Message:** {error_message}")
-                
-                if error.get('context'):
-                    st.markdown("**Context:**")
-                    for key, value in error['context'].items():
-                        st.markdown(f"• {key}: {value}")
-                
-                # Show traceback for debugging
-                if st.checkbox("Show technical details", key=f"show_trace_{error_id}"):
-                    st.code(error.get('traceback', 'No traceback available'), language='python')
+        # One table for the list, newest first, plus a single detail view for the chosen error
+        st.dataframe(err_df, use_container_width=True, hide_index=True)
+        
+        errors_by_id = {error['id']: error for error in recent_errors}
+        selected_id = st.selectbox("Show technical details for", err_df['id'].tolist(), key="error_detail_id")
+        if selected_id in errors_by_id:
+            error = errors_by_id[selected_id]
+            if error.get('context'):
+                st.markdown("**Context:**")
+                st.json(error['context'], expanded=False)
+            st.code(error.get('traceback', 'No traceback available'), language='python')
     else:
-        st.markdown("""
-        <div style="background: var(--card-bg); padding: 1rem; border-radius: 8px; 
-                    border: 1px solid var(--border-color); text-align: center;">
-            <h4 style="margin: 0 0 1rem 0; color: var(--text-primary);">✅ No Errors</h4>
-            <p style="color: var(--text-secondary); margin: 0;">No errors have been logged recently</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(NO_ERRORS_HTML, unsafe_allow_html=True)
     
     # System diagnostics
-    st.markdown("---")
-    st.markdown("**System Diagnostics:**")
+    st.markdown("---\n\n**System Diagnostics:**")
     
     # Check system status
     col1, col2, col3 = st.columns(3)
     
     with col1:
         # Check if trading is active
-        trading_status = "🟢 Active" if st.session_state.get('is_trading', False) else "🔴 Inactive"
+        trading_status = "🟢 Active" if st.session_state['is_trading'] else "🔴 Inactive"
         st.metric("Trading Status", trading_status)
     
     with col2:
         # Check account validation
-        validation = st.session_state.get('account_validation')
+        validation = st.session_state['account_validation']
         if validation and validation.get('valid'):
             validation_status = "🟢 Validated"
         elif validation:
@@ -2466,7 +2147,7 @@ with tabs[8]:
     
     with col3:
         # Check real account data
-        real_data = st.session_state.get('real_account_data')
+        real_data = st.session_state['real_account_data']
         if real_data and real_data.get('account_type') == 'real':
             data_status = "🟢 Real Data"
         elif real_data and real_data.get('account_type') == 'paper':
@@ -2475,22 +2156,5 @@ with tabs[8]:
             data_status = "⚪ No Data"
         st.metric("Account Data", data_status)
 
-st.markdown("</div>", unsafe_allow_html=True)
-
 # Footer Section
-st.markdown("""
-<div style="background: var(--card-bg); padding: 1.5rem; border-radius: var(--border-radius); 
-            border: 1px solid var(--border-color); margin-top: 2rem; text-align: center;">
-    <div style="color: var(--text-secondary); font-size: 0.9rem;">
-        <p style="margin: 0; font-size: 0.8rem;">
-            Developed by <strong style="color: var(--accent-blue);">Mushfiqur Rahaman</strong> • 
-            Multi-Exchange Trading Platform v2.0
-        </p>
-    </div>
-</div>
-""", unsafe_allow_html=True)
-
-# Auto-refresh logic
-if st.session_state['is_trading']:
-    time.sleep(int(refresh_secs))
-    st.rerun()
+st.markdown(FOOTER_HTML, unsafe_allow_html=True)
@@ -1,4 +1,5 @@
 import time
+import threading
 from typing import Dict, List
 import ccxt
 
@@ -9,6 +10,13 @@ class ArbitrageEngine:
         self.symbols = symbols
         self.threshold = float(threshold_bps) / 10000.0
         self.running = False
+        self._lock = threading.Lock()
+        self._latest = None
+        self._last_scan = 0.0
+        self._last_read = time.monotonic()
+        self._thread = None
+        self._stop = threading.Event()
+        self._schedule = None  # (interval, idle_after) once started
 
     def fetch_prices(self) -> Dict[str, Dict[str, float]]:
         out: Dict[str, Dict[str, float]] = {}
@@ -45,4 +53,52 @@ class ArbitrageEngine:
         prices = self.fetch_prices()
         return self.find_opportunities(prices)
 
+    def start(self, interval: float = 10.0, idle_after: float = 120.0):
+        """
+        Scan on a daemon thread every `interval` seconds. The thread exits once nobody has
+        called latest() for `idle_after` seconds; the next read starts it again.
+        """
+        with self._lock:
+            self._schedule = (interval, idle_after)
+            self._last_read = time.monotonic()
+            self._stop.clear()
+            self._spawn()
 
+    def stop(self):
+        """Stop scanning for good; the thread exits without waiting out its sleep."""
+        with self._lock:
+            self._schedule = None
+            self.running = False
+            self._stop.set()
+
+    def latest(self):
+        """Most recent opportunities (None before the first scan completes) and when they were found."""
+        with self._lock:
+            self._last_read = time.monotonic()
+            if self._schedule is not None:
+                self._spawn()  # Resume after an idle exit
+            return self._latest, self._last_scan
+
+    def _spawn(self):
+        # Caller holds self._lock
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self.running = True
+        self._thread = threading.Thread(target=self._loop, args=self._schedule, daemon=True)
+        self._thread.start()
+
+    def _loop(self, interval: float, idle_after: float):
+        while not self._stop.is_set():
+            with self._lock:
+                if time.monotonic() - self._last_read > idle_after:
+                    self.running = False
+                    return
+            try:
+                opps = self.run_once()
+            except Exception:
+                opps = []
+            with self._lock:
+                self._latest = opps
+                self._last_scan = time.time()
+            self._stop.wait(interval)
+        self.running = False
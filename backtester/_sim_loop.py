@@ -0,0 +1,52 @@
+import numpy as np
+
+from indicators.jit import njit
+
+
+@njit(cache=True)
+def next_trigger_bar(close: np.ndarray, start: int, stop: int, lower: float, upper: float) -> int:
+    """
+    First bar in [start, stop) whose close is at or below ``lower`` or at or above ``upper``;
+    ``stop`` when none is. NaN closes never trigger, matching the scalar comparisons they replace.
+    """
+    for i in range(start, stop):
+        price = close[i]
+        if price <= lower or price >= upper:
+            return i
+    return stop
+
+
+def next_visit_index(needs_visit: np.ndarray) -> np.ndarray:
+    """For each bar, the index of the next later bar flagged in ``needs_visit`` (len when none)."""
+    n = len(needs_visit)
+    flagged = np.where(needs_visit, np.arange(n), n)
+    out = np.full(n, n, dtype=np.int64)
+    if n > 1:
+        out[:-1] = np.minimum.accumulate(flagged[::-1])[::-1][1:]
+    return out
+
+
+def trigger_band(positions: list) -> tuple:
+    """
+    Price band inside which AdvancedRiskManager.update_position leaves every open position untouched:
+    a bar closing at or beyond either edge may stop out, take profit or arm the runner.
+    """
+    lower, upper = -np.inf, np.inf
+    for position in positions:
+        if not position['tp1_hit']:
+            target = position['tp1_price']
+        elif not position['tp2_hit']:
+            target = position['tp2_price']
+        elif not position['runner_active']:
+            target = position['runner_price']
+        else:
+            target = None
+        if position['side'] == 'buy':
+            lower = max(lower, position['stop_loss_price'])
+            if target is not None:
+                upper = min(upper, target)
+        else:
+            upper = min(upper, position['stop_loss_price'])
+            if target is not None:
+                lower = max(lower, target)
+    return float(lower), float(upper)
@@ -1,6 +1,6 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Union
 from datetime import datetime, timedelta
 import matplotlib.pyplot as plt
 import seaborn as sns
@@ -66,7 +66,7 @@ class ComprehensiveMetricsCalculator:
         self.metrics_history = []
     
     def calculate_comprehensive_metrics(self, 
-                                      equity_curve: pd.Series,
+                                      equity_curve: Union[pd.Series, np.ndarray],
                                       trades: List[Dict],
                                       initial_capital: float,
                                       risk_free_rate: float = 0.02) -> BacktestMetrics:
@@ -74,7 +74,7 @@ class ComprehensiveMetricsCalculator:
         Calculate comprehensive backtesting metrics
         
         Args:
-            equity_curve: Equity curve over time
+            equity_curve: Equity curve over time (Series or float array)
             trades: List of trade dictionaries
             initial_capital: Initial capital
             risk_free_rate: Risk-free rate for Sharpe ratio
@@ -82,6 +82,10 @@ class ComprehensiveMetricsCalculator:
         Returns:
             BacktestMetrics: Comprehensive metrics object
         """
+        if not isinstance(equity_curve, pd.Series):
+            # Wrap arrays without copying or per-element dtype inference
+            equity_curve = pd.Series(np.asarray(equity_curve, dtype=np.float64), copy=False)
+        
         # Basic trade metrics
         closed_trades = [t for t in trades if 'pnl' in t and t.get('status') == 'closed']
         
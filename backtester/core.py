@@ -3,7 +3,7 @@ import numpy as np
 from typing import Dict, List, Optional
 from utils.metrics import compute_metrics
 
-def run_backtest(
+def run_backtest_iter(
     df: pd.DataFrame,
     entry_col: str = 'signal',
     initial_cap: float = 1000.0,
@@ -15,7 +15,13 @@ def run_backtest(
     wt1_col: str = 'wt1',
     wt2_col: str = 'wt2',
     fee_rate: float = 0.0004,
+    progress_every: int = 500,
 ):
+    """
+    Same simulation as run_backtest, as a generator for progressive display.
+    Yields (bars_done, equity_so_far, None) every `progress_every` bars, then a
+    final (len(df), equity, result) where result is what run_backtest returns.
+    """
     cash = initial_cap
     position: Optional[Dict] = None
     equity: List[float] = []
@@ -75,7 +81,33 @@ def run_backtest(
                 trades[-1].update({'exit_idx': idx, 'exit_price': price, 'fee': float(fee)})
                 position = None
 
+        if progress_every and len(equity) % progress_every == 0 and len(equity) < len(df):
+            yield len(equity), equity, None
+
     df = df.copy()
     df['equity'] = equity
     metrics = compute_metrics(df['equity'], trades)
-    return {'df': df, 'trades': trades, 'metrics': metrics}
+    yield len(df), equity, {'df': df, 'trades': trades, 'metrics': metrics}
+
+
+def run_backtest(
+    df: pd.DataFrame,
+    entry_col: str = 'signal',
+    initial_cap: float = 1000.0,
+    risk_per_trade: float = 0.01,
+    exit_on_wt_cross_down: bool = True,
+    stop_loss_pct: float = 0.03,
+    take_profit_pct: float = 0.06,
+    max_bars_in_trade: int = 100,
+    wt1_col: str = 'wt1',
+    wt2_col: str = 'wt2',
+    fee_rate: float = 0.0004,
+):
+    result = None
+    for _, _, result in run_backtest_iter(
+        df, entry_col, initial_cap, risk_per_trade, exit_on_wt_cross_down,
+        stop_loss_pct, take_profit_pct, max_bars_in_trade, wt1_col, wt2_col,
+        fee_rate, progress_every=0,
+    ):
+        pass
+    return result
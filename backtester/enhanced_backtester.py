@@ -1,3 +1,7 @@
+import os
+import hashlib
+import pathlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple, Union
@@ -6,6 +10,18 @@ import requests
 import yfinance as yf
 from indicators.weighted_signals import WeightedSignalGenerator
 from utils.advanced_risk import AdvancedRiskManager
+from backtester._sim_loop import next_trigger_bar, next_visit_index, trigger_band
+
+# Backtester timeframe -> yfinance interval; anything unlisted falls back to daily bars
+_YF_TIMEFRAME_MAP: Dict[str, str] = {
+    '1m': '1m', '2m': '2m', '5m': '5m', '15m': '15m', '30m': '30m',
+    '1h': '1h', '2h': '2h', '4h': '4h', '6h': '6h', '12h': '12h',
+    '1d': '1d', '5d': '5d', '1w': '1wk', '1M': '1mo', '3M': '3mo',
+    '6M': '6mo', '1y': '1y', '2y': '2y', '5y': '5y'
+}
+
+# update_position outcomes that produce a trade record
+_CLOSED_STATUSES = frozenset(('fully_closed', 'partially_closed'))
 
 class EnhancedBacktester:
     """
@@ -16,25 +32,30 @@ class EnhancedBacktester:
     - Multi-timeframe analysis
     """
     
+    # Ordered for display; membership checks go through the frozenset
+    SUPPORTED_TIMEFRAMES: Tuple[str, ...] = (
+        # Intraday timeframes
+        '1m', '2m', '3m', '5m', '10m', '15m', '20m', '30m',
+        # Hourly timeframes
+        '1h', '2h', '3h', '4h', '6h', '8h', '12h',
+        # Daily timeframes
+        '1d', '2d', '3d', '5d',
+        # Weekly timeframes
+        '1w', '2w', '3w',
+        # Monthly timeframes
+        '1M', '2M', '3M', '6M',
+        # Yearly timeframes
+        '1y', '2y', '5y'
+    )
+    _TIMEFRAMES_SET = frozenset(SUPPORTED_TIMEFRAMES)
+    
     def __init__(self):
-        self.supported_timeframes = [
-            # Intraday timeframes
-            '1m', '2m', '3m', '5m', '10m', '15m', '20m', '30m',
-            # Hourly timeframes
-            '1h', '2h', '3h', '4h', '6h', '8h', '12h',
-            # Daily timeframes
-            '1d', '2d', '3d', '5d',
-            # Weekly timeframes
-            '1w', '2w', '3w',
-            # Monthly timeframes
-            '1M', '2M', '3M', '6M',
-            # Yearly timeframes
-            '1y', '2y', '5y'
-        ]
-        
         self.crypto_exchanges = ['binance', 'bybit', 'mexc', 'coinbase']
         self.stock_sources = ['alpaca', 'yfinance']
         
+        # Downloaded bars, reused across backtests over the same symbol/interval/range
+        self._cache_dir = pathlib.Path(os.getenv("BT_CACHE_DIR", ".bt_cache"))
+        
     def fetch_historical_data(self, 
                             symbol: str,
                             timeframe: str,
@@ -66,6 +87,30 @@ class EnhancedBacktester:
         else:
             raise ValueError(f"Unsupported data source: {source}")
     
+    def fetch_historical_data_many(self,
+                                   symbols: List[str],
+                                   timeframe: str,
+                                   start_date: Union[str, datetime],
+                                   end_date: Union[str, datetime],
+                                   max_workers: int = 16) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch yfinance history for several symbols in one batched download
+        
+        Args:
+            symbols: Trading symbols
+            timeframe: Timeframe string
+            start_date: Start date
+            end_date: End date
+            max_workers: Maximum concurrent downloads
+            
+        Returns:
+            Dict: OHLCV DataFrame per symbol, in input order; empty when a download fails
+        """
+        symbols = list(dict.fromkeys(symbols))
+        if not symbols:
+            return {}
+        return self._fetch_yfinance_batch(symbols, timeframe, start_date, end_date, max_workers)
+    
     def _detect_data_source(self, symbol: str) -> str:
         """
         Auto-detect data source based on symbol
@@ -105,6 +150,11 @@ class EnhancedBacktester:
         # Convert timeframe to yfinance format
         yf_interval = self._convert_timeframe_to_yfinance(timeframe)
         
+        cache_path = self._cache_path(symbol, yf_interval, start_date, end_date)
+        cached = self._read_cache(cache_path)
+        if cached is not None:
+            return cached
+        
         try:
             ticker = yf.Ticker(symbol)
             df = ticker.history(
@@ -118,30 +168,152 @@ class EnhancedBacktester:
             if df.empty:
                 raise ValueError(f"No data found for {symbol}")
             
-            # Standardize column names
-            df.columns = df.columns.str.lower()
-            df = df.rename(columns={
-                'adj close': 'close',
-                'adj_close': 'close'
-            })
-            
-            # Add timestamp column
-            df['timestamp'] = df.index
-            df = df.reset_index(drop=True)
-            
-            # Ensure required columns exist
-            required_columns = ['open', 'high', 'low', 'close', 'volume']
-            for col in required_columns:
-                if col not in df.columns:
-                    if col == 'volume':
-                        df[col] = 0
-                    else:
-                        df[col] = df['close']
-            
-            return df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
+            df = self._standardize_yfinance_frame(df)
             
         except Exception as e:
             raise ValueError(f"Failed to fetch yfinance data for {symbol}: {str(e)}")
+        
+        self._write_cache(cache_path, df)
+        return df
+    
+    def _fetch_yfinance_batch(self, symbols: List[str], timeframe: str,
+                              start_date: Union[str, datetime],
+                              end_date: Union[str, datetime],
+                              max_workers: int = 16) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch several symbols with one yf.download call, serving cached symbols from disk
+        
+        Args:
+            symbols: Trading symbols (unique)
+            timeframe: Timeframe string
+            start_date: Start date
+            end_date: End date
+            max_workers: Download threads used by yfinance
+            
+        Returns:
+            Dict: OHLCV DataFrame per symbol; empty when the symbol returned no data
+        """
+        yf_interval = self._convert_timeframe_to_yfinance(timeframe)
+        paths = {symbol: self._cache_path(symbol, yf_interval, start_date, end_date) for symbol in symbols}
+        frames = {symbol: self._read_cache(path) for symbol, path in paths.items()}
+        missing = [symbol for symbol, df in frames.items() if df is None]
+        
+        if missing:
+            try:
+                raw = yf.download(
+                    missing,
+                    start=start_date,
+                    end=end_date,
+                    interval=yf_interval,
+                    auto_adjust=True,
+                    prepost=True,
+                    group_by='ticker',
+                    ignore_tz=False,
+                    threads=min(max_workers, len(missing)),
+                    progress=False
+                )
+            except Exception:
+                raw = pd.DataFrame()
+            
+            for symbol in missing:
+                if raw.empty:
+                    part = raw
+                elif isinstance(raw.columns, pd.MultiIndex):
+                    if symbol not in raw.columns.get_level_values(0):
+                        part = pd.DataFrame()
+                    else:
+                        # The batch shares one index; drop the bars this symbol has no data for
+                        part = raw.xs(symbol, axis=1, level=0).dropna(how='all')
+                else:
+                    part = raw
+                
+                if part.empty:
+                    frames[symbol] = pd.DataFrame(columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
+                    continue
+                
+                # A mixed-exchange batch comes back in one shared timezone; restore the symbol's own,
+                # as Ticker.history returns it, when yfinance's tz cache knows it. Otherwise the batch
+                # timezone is kept, which only shifts the wall-clock labels of the same instants.
+                part = part.copy()
+                tz = self._exchange_timezone(symbol)
+                if tz is not None and part.index.tz is not None:
+                    part.index = part.index.tz_convert(tz)
+                frames[symbol] = self._standardize_yfinance_frame(part)
+                self._write_cache(paths[symbol], frames[symbol])
+        
+        return frames
+    
+    @staticmethod
+    def _exchange_timezone(symbol: str) -> Optional[str]:
+        """Exchange timezone yfinance stored in its tz cache while downloading symbol, or None; never requests it."""
+        try:
+            try:
+                from yfinance.cache import get_tz_cache
+            except ImportError:  # yfinance < 0.2.22 kept the tz cache in utils
+                from yfinance.utils import get_tz_cache
+            return get_tz_cache().lookup(symbol.upper())
+        except Exception:
+            return None
+    
+    @staticmethod
+    def _standardize_yfinance_frame(df: pd.DataFrame) -> pd.DataFrame:
+        """Lower-case OHLCV columns plus a timestamp column taken from the index."""
+        # Standardize column names
+        df.columns = df.columns.str.lower()
+        df = df.rename(columns={
+            'adj close': 'close',
+            'adj_close': 'close'
+        })
+        
+        # Add timestamp column
+        df['timestamp'] = df.index
+        df = df.reset_index(drop=True)
+        
+        # Ensure required columns exist
+        required_columns = ['open', 'high', 'low', 'close', 'volume']
+        for col in required_columns:
+            if col not in df.columns:
+                if col == 'volume':
+                    df[col] = 0
+                else:
+                    df[col] = df['close']
+        
+        return df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
+    
+    @staticmethod
+    def _read_cache(path: pathlib.Path) -> Optional[pd.DataFrame]:
+        """Cached bars at path, or None when missing or unreadable."""
+        if not path.exists():
+            return None
+        try:
+            return pd.read_pickle(path)
+        except Exception:
+            return None  # Unreadable entry; download again and overwrite it
+    
+    def _write_cache(self, path: pathlib.Path, df: pd.DataFrame):
+        """Store bars at path; caching is best effort."""
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            df.to_pickle(tmp_path)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+    
+    def _cache_path(self, symbol: str, yf_interval: str,
+                    start_date: Union[str, datetime],
+                    end_date: Union[str, datetime]) -> pathlib.Path:
+        """
+        Cache file for a download. Dates are floored to the bar interval (at most one day),
+        so requests ending "now" a few seconds apart share the same entry.
+        """
+        try:
+            bucket = min(pd.Timedelta(yf_interval), pd.Timedelta('1d'))
+        except ValueError:
+            bucket = pd.Timedelta('1d')  # '1wk', '1mo', ... are not fixed durations
+        start, end = (pd.Timestamp(d).floor(bucket) for d in (start_date, end_date))
+        key = hashlib.sha1(f"{symbol}|{yf_interval}|{start}|{end}".encode()).hexdigest()
+        return self._cache_dir / f"{key}.pkl"
     
     def _convert_timeframe_to_yfinance(self, timeframe: str) -> str:
         """
@@ -153,14 +325,7 @@ class EnhancedBacktester:
         Returns:
             str: yfinance interval
         """
-        timeframe_map = {
-            '1m': '1m', '2m': '2m', '5m': '5m', '15m': '15m', '30m': '30m',
-            '1h': '1h', '2h': '2h', '4h': '4h', '6h': '6h', '12h': '12h',
-            '1d': '1d', '5d': '5d', '1w': '1wk', '1M': '1mo', '3M': '3mo',
-            '6M': '6mo', '1y': '1y', '2y': '2y', '5y': '5y'
-        }
-        
-        return timeframe_map.get(timeframe, '1d')
+        return _YF_TIMEFRAME_MAP.get(timeframe, '1d')
     
     def _fetch_alpaca_data(self, symbol: str, timeframe: str,
                           start_date: Union[str, datetime],
@@ -246,8 +411,8 @@ class EnhancedBacktester:
             Dict: Backtest results
         """
         # Validate timeframe
-        if timeframe not in self.supported_timeframes:
-            raise ValueError(f"Unsupported timeframe: {timeframe}. Supported: {self.supported_timeframes}")
+        if timeframe not in self._TIMEFRAMES_SET:
+            raise ValueError(f"Unsupported timeframe: {timeframe}. Supported: {list(self.SUPPORTED_TIMEFRAMES)}")
         
         # Fetch historical data
         df = self.fetch_historical_data(symbol, timeframe, start_date, end_date, data_source)
@@ -274,9 +439,8 @@ class EnhancedBacktester:
             momentum_lookback=momentum_lookback
         )
         
-        # Add signals to dataframe
-        for signal_name, signal_data in signals.items():
-            df[signal_name] = signal_data
+        # Add signals to dataframe in one block insertion
+        df = df.assign(**signals)
         
         # Run backtest simulation (long+short)
         results = self._simulate_trading(
@@ -300,12 +464,50 @@ class EnhancedBacktester:
             'risk_summary': results['risk_summary']
         }
     
+    def run_batch_backtest(self, symbols: List[str], max_workers: Optional[int] = None,
+                           **kwargs) -> Dict[str, Dict]:
+        """
+        Run run_enhanced_backtest for several symbols in parallel worker processes
+        
+        Args:
+            symbols: Trading symbols
+            max_workers: Worker processes (default: one per CPU, at most one per symbol)
+            **kwargs: Arguments for run_enhanced_backtest other than the symbol
+            
+        Returns:
+            Dict: Backtest results per symbol; a failed symbol maps to {'error': message}
+        """
+        symbols = list(dict.fromkeys(symbols))
+        if not symbols:
+            return {}
+        
+        workers = max_workers or min(os.cpu_count() or 1, len(symbols))
+        results = {}
+        # Workers build their own backtester, so only the symbol and plain kwargs are pickled;
+        # they share the on-disk bar cache through BT_CACHE_DIR
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(_run_backtest_worker, str(self._cache_dir), symbol, kwargs): symbol
+                for symbol in symbols
+            }
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    results[symbol] = future.result()
+                except Exception as e:
+                    results[symbol] = {'error': str(e)}
+        
+        return {symbol: results[symbol] for symbol in symbols}
+    
     def _simulate_trading(self, df: pd.DataFrame, risk_manager: AdvancedRiskManager,
                          tp1_multiplier: float, tp2_multiplier: float, 
                          runner_multiplier: float) -> Dict[str, any]:
         """
         Simulate trading with advanced risk management
         
+        Event-driven: only bars with an entry signal, a new day, or (with positions open) a close
+        reaching a stop/target level are visited; every other bar would leave the state unchanged.
+        
         Args:
             df: DataFrame with price data and signals
             risk_manager: Risk manager instance
@@ -320,12 +522,31 @@ class EnhancedBacktester:
         daily_summaries = []
         current_date = None
         
-        for idx, row in df.iterrows():
-            current_price = row['close']
-            current_timestamp = row['timestamp']
+        # Pull the columns out once; the loop below only indexes plain arrays
+        n = len(df)
+        close = df['close'].to_numpy(dtype=np.float64)
+        timestamps = df['timestamp'].array
+        # Integer day number of each bar's wall-clock date; date objects are only built at day starts
+        wall_clock = df['timestamp'].dt.tz_localize(None) if df['timestamp'].dt.tz is not None else df['timestamp']
+        day_id = wall_clock.to_numpy(dtype='datetime64[ns]').view(np.int64) // 86_400_000_000_000
+        has_long = 'final_long' in df.columns
+        has_short = 'final_short' in df.columns
+        no_signal = np.zeros(n, dtype=np.bool_)
+        long_arr = df['final_long'].to_numpy(dtype=np.bool_) if has_long else no_signal
+        short_arr = df['final_short'].to_numpy(dtype=np.bool_) if has_short else no_signal
+        entry_arr = long_arr | short_arr
+        
+        # Bars that need work even when flat: a signal fires or a new day starts
+        day_start = np.ones(n, dtype=np.bool_)
+        day_start[1:] = day_id[1:] != day_id[:-1]
+        next_visit = next_visit_index(entry_arr | day_start)
+        
+        i = 0
+        while i < n:
+            current_price = close[i]
             
             # Check if new day
-            if current_date != current_timestamp.date():
+            if day_start[i]:
                 if current_date is not None:
                     # Save daily summary
                     daily_summary = risk_manager.get_portfolio_summary()
@@ -335,19 +556,22 @@ class EnhancedBacktester:
                     # Reset daily tracking
                     risk_manager.reset_daily_tracking()
                 
-                current_date = current_timestamp.date()
+                current_date = timestamps[i].date()
             
-            # Update existing positions
-            for position in risk_manager.positions[:]:  # Copy to avoid modification during iteration
-                update_result = risk_manager.update_position(position['id'], current_price)
-                
-                if update_result['status'] in ['fully_closed', 'partially_closed']:
-                    trades.append(update_result['trade'])
+            # Update existing positions; the snapshot is only taken when there is something to update
+            if risk_manager.positions:
+                for position in tuple(risk_manager.positions):  # Closes remove entries while we iterate
+                    update_result = risk_manager.update_position(position['id'], current_price)
+                    
+                    if update_result['status'] in _CLOSED_STATUSES:
+                        trades.append(update_result['trade'])
             
             # Check for new entry signals (long + short)
-            if not risk_manager.is_daily_breaker_triggered():
+            if entry_arr[i] and not risk_manager.is_daily_breaker_triggered():
+                # Boxed into a Timestamp only here, where an entry may record it
+                current_timestamp = timestamps[i]
                 # Long entry
-                if 'final_long' in df.columns and bool(row.get('final_long', False)):
+                if has_long and long_arr[i]:
                     stop_loss_price = current_price * 0.98
                     position = risk_manager.open_position(
                         symbol='SYMBOL',
@@ -369,7 +593,7 @@ class EnhancedBacktester:
                             'action': 'open'
                         })
                 # Short entry
-                if 'final_short' in df.columns and bool(row.get('final_short', False)):
+                if has_short and short_arr[i]:
                     stop_loss_price = current_price * 1.02  # SL above entry for shorts
                     position = risk_manager.open_position(
                         symbol='SYMBOL',
@@ -390,6 +614,14 @@ class EnhancedBacktester:
                             'timestamp': current_timestamp,
                             'action': 'open'
                         })
+            
+            # Jump to the next bar with a signal, a new day, or a close that reaches a stop/target level.
+            # Bars in between would leave every open position untouched.
+            next_i = next_visit[i]
+            if risk_manager.positions:
+                lower, upper = trigger_band(risk_manager.positions)
+                next_i = next_trigger_bar(close, i + 1, next_i, lower, upper)
+            i = next_i
         
         # Final daily summary
         if current_date is not None:
@@ -447,16 +679,18 @@ class EnhancedBacktester:
         
         # Calculate returns
         if daily_summaries:
-            equity_curve = [ds['current_capital'] for ds in daily_summaries]
-            returns = np.diff(equity_curve) / equity_curve[:-1]
+            equity_curve = np.fromiter((ds['current_capital'] for ds in daily_summaries),
+                                       dtype=np.float64, count=len(daily_summaries))
+            returns = equity_curve[1:] / equity_curve[:-1] - 1.0
             
             # Sharpe ratio
-            sharpe_ratio = np.mean(returns) / np.std(returns) * np.sqrt(252) if np.std(returns) > 0 else 0
+            returns_std = returns.std() if len(returns) > 0 else 0.0
+            sharpe_ratio = returns.mean() / returns_std * np.sqrt(252) if returns_std > 0 else 0
             
             # Max drawdown
             peak = np.maximum.accumulate(equity_curve)
-            drawdown = (np.array(equity_curve) - peak) / peak
-            max_drawdown = np.min(drawdown) if len(drawdown) > 0 else 0
+            drawdown = equity_curve / peak - 1.0
+            max_drawdown = np.min(drawdown)
             
             # Total return
             total_return = (equity_curve[-1] - equity_curve[0]) / equity_curve[0] if len(equity_curve) > 1 else 0
@@ -492,7 +726,7 @@ class EnhancedBacktester:
         Returns:
             List[str]: Supported timeframes
         """
-        return self.supported_timeframes.copy()
+        return list(self.SUPPORTED_TIMEFRAMES)
     
     def validate_timeframe(self, timeframe: str) -> bool:
         """
@@ -504,4 +738,11 @@ class EnhancedBacktester:
         Returns:
             bool: True if supported
         """
-        return timeframe in self.supported_timeframes
+        return timeframe in self._TIMEFRAMES_SET
+
+
+def _run_backtest_worker(cache_dir: str, symbol: str, kwargs: Dict) -> Dict[str, any]:
+    """Process-pool entry point for EnhancedBacktester.run_batch_backtest."""
+    backtester = EnhancedBacktester()
+    backtester._cache_dir = pathlib.Path(cache_dir)
+    return backtester.run_enhanced_backtest(symbol, **kwargs)
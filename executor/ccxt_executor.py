@@ -1,5 +1,6 @@
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any
 import pandas as pd
 import ccxt
@@ -417,6 +418,16 @@ class CCXTExecutor:
             print(f"Error canceling order {order_id} on {self.exchange_name}: {e}")
             return {'status': 'error', 'error': str(e)}
 
+    def cancel_orders(self, orders: List[dict]) -> List[dict]:
+        """Cancel several orders concurrently; results are returned in the same order as `orders`"""
+        if not orders:
+            return []
+        with ThreadPoolExecutor(max_workers=min(8, len(orders))) as pool:
+            return list(pool.map(
+                lambda order: self.cancel_order(order.get('orderId'), order.get('symbol')),
+                orders
+            ))
+
     def get_account_info(self) -> dict:
         """Get comprehensive account information"""
         if self.paper:
@@ -429,11 +440,17 @@ class CCXTExecutor:
             }
         
         try:
+            # The four requests are independent; run them concurrently so the wait is the slowest one, not the sum
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                balance, positions, orders, trades = pool.map(
+                    lambda fetch: fetch(),
+                    [self.fetch_balance, self.fetch_positions, self.fetch_orders, self.fetch_trades]
+                )
             return {
-                'balance': self.fetch_balance(),
-                'positions': self.fetch_positions(),
-                'orders': self.fetch_orders(),
-                'trades': self.fetch_trades(),
+                'balance': balance,
+                'positions': positions,
+                'orders': orders,
+                'trades': trades,
                 'account_type': 'real'
             }
         except Exception as e:
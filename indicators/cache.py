@@ -0,0 +1,43 @@
+import functools
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+try:
+    import streamlit as st
+except ImportError:  # indicators are also used by the CLI backtester
+    st = None
+
+
+def _series_key(s: pd.Series):
+    """Digest of an indicator input's values plus its index endpoints; one pass over the raw bytes."""
+    if len(s) == 0:
+        return (0,)
+    values = s.to_numpy()
+    if values.dtype == object:
+        data = pd.util.hash_pandas_object(s, index=False).to_numpy().tobytes()
+    else:
+        data = np.ascontiguousarray(values).tobytes()
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    return (len(s), str(values.dtype), s.index[0], s.index[-1], digest)
+
+
+def frame_key(df: pd.DataFrame, columns=('timestamp', 'open', 'high', 'low', 'close', 'volume')):
+    """Cache key for an OHLCV frame: _series_key of each column present, so any revised bar changes it."""
+    return tuple((c, _series_key(df[c])) for c in columns if c in df.columns)
+
+
+def cached_indicator(func):
+    """Memoize an indicator with st.cache_data when running inside a Streamlit app."""
+    if st is None:
+        return func
+    cached = st.cache_data(max_entries=64, show_spinner=False, hash_funcs={pd.Series: _series_key})(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if st.runtime.exists():
+            return cached(*args, **kwargs)
+        return func(*args, **kwargs)
+
+    return wrapper
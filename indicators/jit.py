@@ -0,0 +1,81 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to the plain Python kernels
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def ewm_mean(values: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Exponentially weighted mean matching pandas ``ewm(alpha=..., adjust=False).mean()``.
+    NaNs are handled the same way (ignore_na=False): leading NaNs stay NaN and gaps decay the old weight.
+    """
+    n = len(values)
+    out = np.empty(n)
+    if n == 0:
+        return out
+    old_wt_factor = 1.0 - alpha
+    weighted = values[0]
+    old_wt = 1.0
+    out[0] = weighted
+    for i in range(1, n):
+        cur = values[i]
+        is_obs = cur == cur
+        if weighted == weighted:
+            old_wt *= old_wt_factor
+            if is_obs:
+                if weighted != cur:
+                    weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+                old_wt = 1.0
+        elif is_obs:
+            weighted = cur
+        out[i] = weighted
+    return out
+
+
+@njit(cache=True)
+def momentum_signal(price: np.ndarray, short_window: int, long_window: int) -> np.ndarray:
+    """
+    Price distance from its short and long rolling means (``min_periods=1``), averaged, scaled by 10
+    and clipped to [-1, 1] in one pass. NaN prices are skipped by the means, as pandas rolling does.
+    """
+    n = len(price)
+    out = np.empty(n)
+    sum_short = 0.0
+    sum_long = 0.0
+    count_short = 0
+    count_long = 0
+    for i in range(n):
+        cur = price[i]
+        if cur == cur:
+            sum_short += cur
+            sum_long += cur
+            count_short += 1
+            count_long += 1
+        if i >= short_window:
+            old = price[i - short_window]
+            if old == old:
+                sum_short -= old
+                count_short -= 1
+        if i >= long_window:
+            old = price[i - long_window]
+            if old == old:
+                sum_long -= old
+                count_long -= 1
+        if count_short == 0 or count_long == 0:
+            out[i] = np.nan
+            continue
+        sma_short = sum_short / count_short
+        sma_long = sum_long / count_long
+        value = ((cur - sma_short) / sma_short + (cur - sma_long) / sma_long) / 2 * 10
+        if value > 1.0:
+            value = 1.0
+        elif value < -1.0:
+            value = -1.0
+        out[i] = value
+    return out
@@ -1,12 +1,27 @@
+import numpy as np
 import pandas as pd
 
+from indicators.cache import cached_indicator
+from indicators.jit import ewm_mean
+
+
+def rsi_array(close: np.ndarray, length: int = 14) -> np.ndarray:
+    """RSI over a float64 array using Wilder's smoothing."""
+    delta = np.empty(len(close))
+    delta[:1] = np.nan
+    delta[1:] = close[1:] - close[:-1]
+    up = np.maximum(delta, 0.0)
+    down = -np.minimum(delta, 0.0)
+    ma_up = ewm_mean(up, 1.0 / length)
+    ma_down = ewm_mean(down, 1.0 / length)
+    rs = ma_up / np.where(ma_down == 0, 1e-10, ma_down)
+    return 100 - (100 / (1 + rs))
+
+
+@cached_indicator
 def rsi(close: pd.Series, length: int = 14) -> pd.Series:
     """Return RSI series using Wilder's smoothing."""
-    delta = close.diff()
-    up = delta.clip(lower=0)
-    down = -1 * delta.clip(upper=0)
-    ma_up = up.ewm(alpha=1/length, adjust=False).mean()
-    ma_down = down.ewm(alpha=1/length, adjust=False).mean()
-    rs = ma_up / (ma_down.replace(0, 1e-10))
-    rsi = 100 - (100 / (1 + rs))
-    return rsi
+    values = rsi_array(np.asarray(close, dtype=np.float64), length)
+    if isinstance(close, np.ndarray):
+        return values
+    return pd.Series(values, index=close.index, name=close.name)
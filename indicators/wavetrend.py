@@ -1,10 +1,22 @@
+import numpy as np
 import pandas as pd
 
+from indicators.cache import cached_indicator
+from indicators.jit import ewm_mean
+
+
+def wavetrend_arrays(hlc3: np.ndarray, channel_length: int = 10, average_length: int = 21):
+    """WaveTrend (wt1, wt2) over a float64 array."""
+    esa = ewm_mean(hlc3, 2.0 / (channel_length + 1))
+    de = ewm_mean(np.abs(hlc3 - esa), 2.0 / (channel_length + 1))
+    ci = (hlc3 - esa) / (0.015 * np.where(de == 0, 1e-10, de))
+    wt1 = ewm_mean(ci, 2.0 / (average_length + 1))
+    wt2 = ewm_mean(wt1, 2.0 / (4 + 1))
+    return wt1, wt2
+
+
+@cached_indicator
 def wavetrend(hlc3: pd.Series, channel_length: int = 10, average_length: int = 21) -> pd.DataFrame:
     """Simplified WaveTrend implementation returning wt1 and wt2."""
-    esa = hlc3.ewm(span=channel_length, adjust=False).mean()
-    de = (hlc3 - esa).abs().ewm(span=channel_length, adjust=False).mean()
-    ci = (hlc3 - esa) / (0.015 * de.replace(0, 1e-10))
-    wt1 = ci.ewm(span=average_length, adjust=False).mean()
-    wt2 = wt1.ewm(span=4, adjust=False).mean()
-    return pd.DataFrame({"wt1": wt1, "wt2": wt2})
+    wt1, wt2 = wavetrend_arrays(np.asarray(hlc3, dtype=np.float64), channel_length, average_length)
+    return pd.DataFrame({"wt1": wt1, "wt2": wt2}, index=getattr(hlc3, 'index', None))
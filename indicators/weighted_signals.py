@@ -1,8 +1,16 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 from .rsi import rsi
 from .wavetrend import wavetrend
+from .jit import momentum_signal
+
+def _hlc3(df: pd.DataFrame) -> np.ndarray:
+    """Typical price (high + low + close) / 3, or close when high/low are missing."""
+    if set(['high', 'low', 'close']).issubset(df.columns):
+        return (df['high'].to_numpy(dtype=np.float64) + df['low'].to_numpy(dtype=np.float64)
+                + df['close'].to_numpy(dtype=np.float64)) / 3.0
+    return df['close'].to_numpy(dtype=np.float64)
 
 class WeightedSignalGenerator:
     """
@@ -12,6 +20,14 @@ class WeightedSignalGenerator:
     - Buy/Sell signals: 20% weight
     """
     
+    # Strength buckets: sell edges include their threshold from below, buy edges from above
+    _SELL_EDGES = np.array([-0.7, -0.3, -0.1])
+    _BUY_EDGES = np.array([0.1, 0.3, 0.7])
+    _STRENGTH_LABELS = np.array([
+        "Very Strong Sell", "Strong Sell", "Weak Sell", "Neutral",
+        "Weak Buy", "Strong Buy", "Very Strong Buy"
+    ], dtype=object)
+    
     def __init__(self, 
                  rsi_weight: float = 0.4,
                  wavetrend_weight: float = 0.4, 
@@ -36,10 +52,14 @@ class WeightedSignalGenerator:
     def generate_rsi_signal(self, df: pd.DataFrame, 
                            rsi_length: int = 14,
                            oversold: float = 30,
-                           overbought: float = 70) -> pd.Series:
+                           overbought: float = 70,
+                           dtype=np.float32) -> pd.Series:
         """
         Generate RSI-based signals
         
+        Args:
+            dtype: Output dtype; float32 is ample for strengths in [-1, 1]
+        
         Returns:
             pd.Series: RSI signal strength (-1 to 1)
         """
@@ -50,81 +70,72 @@ class WeightedSignalGenerator:
         # Overbought (70) = -1 (strong sell)
         # Neutral (50) = 0
         
-        rsi_signal = np.where(
-            rsi_values <= oversold, 1.0,  # Strong buy
-            np.where(
-                rsi_values >= overbought, -1.0,  # Strong sell
-                np.where(
-                    rsi_values < 50, 
-                    (50 - rsi_values) / (50 - oversold),  # Buy signal strength
-                    -(rsi_values - 50) / (overbought - 50)  # Sell signal strength
-                )
+        # Piecewise-linear around 50, saturating at the thresholds via the clip
+        values = rsi_values.to_numpy(dtype=np.float64)
+        if overbought - 50 == 50 - oversold:
+            rsi_signal = np.subtract(50.0, values)
+            rsi_signal /= 50.0 - oversold
+        else:
+            rsi_signal = np.where(
+                values < 50,
+                (50.0 - values) / (50.0 - oversold),  # Buy signal strength
+                (50.0 - values) / (overbought - 50.0)  # Sell signal strength
             )
-        )
+        np.clip(rsi_signal, -1.0, 1.0, out=rsi_signal)
         
-        return pd.Series(rsi_signal, index=df.index)
+        return pd.Series(rsi_signal.astype(dtype, copy=False), index=df.index, copy=False)
     
     def generate_wavetrend_signal(self, df: pd.DataFrame,
                                  channel_length: int = 10,
-                                 average_length: int = 21) -> pd.Series:
+                                 average_length: int = 21,
+                                 hlc3: Optional[np.ndarray] = None,
+                                 dtype=np.float32) -> pd.Series:
         """
         Generate WaveTrend-based signals
         
+        Args:
+            hlc3: Precomputed typical price for df (computed here when omitted)
+            dtype: Output dtype; float32 is ample for strengths in [-1, 1]
+        
         Returns:
             pd.Series: WaveTrend signal strength (-1 to 1)
         """
-        # Calculate hlc3 for WaveTrend
-        if set(['high', 'low', 'close']).issubset(df.columns):
-            hlc3 = (df['high'] + df['low'] + df['close']) / 3.0
-        else:
-            hlc3 = df['close']
+        if hlc3 is None:
+            hlc3 = _hlc3(df)
         
         wt = wavetrend(hlc3, channel_length=channel_length, average_length=average_length)
         
         # Generate signals based on WaveTrend crossovers and levels
-        wt1 = wt['wt1']
-        wt2 = wt['wt2']
-        
-        # Signal based on crossovers and extreme levels
-        wt_signal = np.where(
-            (wt1 > wt2) & (wt1 < -50), 1.0,  # Strong buy: WT1 above WT2 and oversold
-            np.where(
-                (wt1 < wt2) & (wt1 > 50), -1.0,  # Strong sell: WT1 below WT2 and overbought
-                np.where(
-                    wt1 > wt2, 0.5,  # Weak buy: WT1 above WT2
-                    -0.5  # Weak sell: WT1 below WT2
-                )
-            )
-        )
+        wt1 = np.asarray(wt['wt1'], dtype=np.float64)
+        wt2 = np.asarray(wt['wt2'], dtype=np.float64)
+        
+        # Weak buy/sell from the crossover side, then overwrite the extreme levels
+        above = wt1 > wt2
+        wt_signal = np.where(above, 0.5, -0.5)
+        wt_signal[above & (wt1 < -50)] = 1.0  # Strong buy: WT1 above WT2 and oversold
+        wt_signal[(wt1 < wt2) & (wt1 > 50)] = -1.0  # Strong sell: WT1 below WT2 and overbought
         
-        return pd.Series(wt_signal, index=df.index)
+        return pd.Series(wt_signal.astype(dtype, copy=False), index=df.index, copy=False)
     
     def generate_buy_sell_signal(self, df: pd.DataFrame,
                                 price_col: str = 'close',
-                                lookback: int = 20) -> pd.Series:
+                                lookback: int = 20,
+                                dtype=np.float32) -> pd.Series:
         """
         Generate buy/sell signals based on price momentum
         
+        Args:
+            dtype: Output dtype; float32 is ample for strengths in [-1, 1]
+        
         Returns:
             pd.Series: Buy/sell signal strength (-1 to 1)
         """
-        price = df[price_col]
-        
-        # Calculate price momentum
-        sma_short = price.rolling(window=5, min_periods=1).mean()
-        sma_long = price.rolling(window=lookback, min_periods=1).mean()
+        price = df[price_col].to_numpy(dtype=np.float64)
         
-        # Price relative to moving averages
-        price_vs_short = (price - sma_short) / sma_short
-        price_vs_long = (price - sma_long) / sma_long
+        # Price relative to its 5-bar and lookback-bar means, normalized to -1..1 in one pass
+        signal = momentum_signal(price, 5, lookback)
         
-        # Combine momentum signals
-        momentum_signal = (price_vs_short + price_vs_long) / 2
-        
-        # Normalize to -1 to 1 range
-        momentum_signal = np.clip(momentum_signal * 10, -1, 1)
-        
-        return pd.Series(momentum_signal, index=df.index)
+        return pd.Series(signal.astype(dtype, copy=False), index=df.index, copy=False)
     
     def generate_weighted_signal(self, df: pd.DataFrame,
                                rsi_length: int = 14,
@@ -144,10 +155,11 @@ class WeightedSignalGenerator:
             - 'weighted_signal': Final weighted signal
             - 'final_signal': Boolean buy/sell signal
         """
-        # Generate individual signals
-        rsi_sig = self.generate_rsi_signal(df, rsi_length, rsi_oversold, rsi_overbought)
-        wt_sig = self.generate_wavetrend_signal(df, wt_channel_length, wt_average_length)
-        bs_sig = self.generate_buy_sell_signal(df, 'close', momentum_lookback)
+        # Generate individual signals; combined and thresholded in float64, stored as float32
+        rsi_sig = self.generate_rsi_signal(df, rsi_length, rsi_oversold, rsi_overbought, dtype=np.float64)
+        wt_sig = self.generate_wavetrend_signal(df, wt_channel_length, wt_average_length,
+                                                hlc3=_hlc3(df), dtype=np.float64)
+        bs_sig = self.generate_buy_sell_signal(df, 'close', momentum_lookback, dtype=np.float64)
         
         # Calculate weighted signal
         weighted_signal = (
@@ -162,10 +174,10 @@ class WeightedSignalGenerator:
         final_short = weighted_signal < -0.3
         
         return {
-            'rsi_signal': rsi_sig,
-            'wavetrend_signal': wt_sig,
-            'buy_sell_signal': bs_sig,
-            'weighted_signal': weighted_signal,
+            'rsi_signal': rsi_sig.astype(np.float32),
+            'wavetrend_signal': wt_sig.astype(np.float32),
+            'buy_sell_signal': bs_sig.astype(np.float32),
+            'weighted_signal': weighted_signal.astype(np.float32),
             'final_long': final_long,
             'final_short': final_short
         }
@@ -194,3 +206,18 @@ class WeightedSignalGenerator:
             return "Weak Sell"
         else:
             return "Neutral"
+    
+    def get_signal_strengths(self, weighted_signals) -> np.ndarray:
+        """
+        Vectorized get_signal_strength for a whole signal history
+        
+        Args:
+            weighted_signals: Array-like of signal values between -1 and 1
+            
+        Returns:
+            np.ndarray: Signal strength description per value (NaN is "Neutral")
+        """
+        values = np.asarray(weighted_signals, dtype=np.float64)
+        buckets = (np.searchsorted(self._SELL_EDGES, values, side='left')
+                   + np.searchsorted(self._BUY_EDGES, values, side='right'))
+        return self._STRENGTH_LABELS[np.where(np.isnan(values), 3, buckets)]
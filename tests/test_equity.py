@@ -0,0 +1,69 @@
+import unittest
+from collections import deque
+
+import numpy as np
+
+from utils.equity import EquityBuffer
+
+
+class EquityBufferTest(unittest.TestCase):
+    def assertMatches(self, buf, expected):
+        expected = list(expected)
+        self.assertEqual(len(buf), len(expected))
+        self.assertEqual(buf.to_numpy().tolist(), expected)
+        self.assertEqual(buf.view().tolist(), expected)
+
+    def test_extend_across_the_wrap_point(self):
+        buf = EquityBuffer([1.0, 2.0, 3.0], capacity=5)
+        buf.extend([4.0, 5.0, 6.0, 7.0])
+        self.assertMatches(buf, [3.0, 4.0, 5.0, 6.0, 7.0])
+
+    def test_extend_longer_than_capacity_keeps_newest(self):
+        buf = EquityBuffer([1.0], capacity=4)
+        buf.extend(np.arange(10.0))
+        self.assertMatches(buf, [6.0, 7.0, 8.0, 9.0])
+        buf.append(10.0)
+        self.assertMatches(buf, [7.0, 8.0, 9.0, 10.0])
+
+    def test_negative_indexes_after_wrap(self):
+        buf = EquityBuffer(np.arange(7.0), capacity=5)
+        buf.append(7.0)
+        self.assertEqual(buf[-1], 7.0)
+        self.assertEqual(buf[-5], 3.0)
+        self.assertEqual(buf[0], 3.0)
+        self.assertEqual(buf[4], 7.0)
+        with self.assertRaises(IndexError):
+            buf[-6]
+        with self.assertRaises(IndexError):
+            buf[5]
+
+    def test_view_is_zero_copy_until_wrapped(self):
+        buf = EquityBuffer([1.0, 2.0], capacity=3)
+        view = buf.view()
+        self.assertTrue(np.shares_memory(view, buf._buf))
+        self.assertFalse(view.flags.writeable)
+        buf.extend([3.0, 4.0])
+        wrapped = buf.view()
+        self.assertFalse(np.shares_memory(wrapped, buf._buf))
+        self.assertEqual(wrapped.tolist(), [2.0, 3.0, 4.0])
+
+    def test_matches_bounded_deque(self):
+        rng = np.random.default_rng(3)
+        buf, ref = EquityBuffer(capacity=6), deque(maxlen=6)
+        for _ in range(200):
+            if rng.random() < 0.5:
+                value = float(rng.normal())
+                buf.append(value)
+                ref.append(value)
+            else:
+                values = rng.normal(size=int(rng.integers(0, 9))).tolist()
+                buf.extend(values)
+                ref.extend(values)
+            self.assertMatches(buf, ref)
+            if ref:
+                self.assertEqual(buf[-1], ref[-1])
+                self.assertEqual(buf[0], ref[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
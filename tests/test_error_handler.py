@@ -0,0 +1,25 @@
+import unittest
+
+from utils.error_handler import APIError, ErrorHandler, errors_frame
+
+
+class ErrorsFrameTest(unittest.TestCase):
+    def test_empty_log_gives_empty_table(self):
+        df = errors_frame(ErrorHandler().get_recent_errors(20))
+        self.assertTrue(df.empty)
+        self.assertEqual(list(df.columns), ['timestamp', 'type', 'message', 'id'])
+
+    def test_newest_first_with_icons(self):
+        handler = ErrorHandler()
+        try:
+            raise APIError("boom")
+        except APIError as e:
+            handler.log_error(e)
+        handler.log_error(KeyError("k"))
+        df = errors_frame(handler.get_recent_errors(20))
+        self.assertEqual(df['type'].tolist(), ['❓ KeyError', '🔌 APIError'])
+        self.assertEqual(len(df['timestamp'].iloc[0]), 19)
+
+
+if __name__ == '__main__':
+    unittest.main()
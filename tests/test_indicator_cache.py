@@ -0,0 +1,42 @@
+import unittest
+
+import pandas as pd
+
+from indicators.cache import _series_key, frame_key
+
+
+class SeriesKeyTest(unittest.TestCase):
+    def test_interior_change_with_same_sum_changes_key(self):
+        a = pd.Series([1.0, 2.0, 3.0, 4.0])
+        b = pd.Series([1.0, 2.5, 2.5, 4.0])
+        self.assertNotEqual(_series_key(a), _series_key(b))
+
+    def test_equal_series_share_key(self):
+        self.assertEqual(_series_key(pd.Series([1.0, 2.0])), _series_key(pd.Series([1.0, 2.0])))
+
+
+class FrameKeyTest(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'timestamp': pd.date_range('2024-01-01', periods=4, freq='h'),
+            'open': [1.0, 2.0, 3.0, 4.0], 'high': [2.0, 3.0, 4.0, 5.0],
+            'low': [0.5, 1.5, 2.5, 3.5], 'close': [1.5, 2.5, 3.5, 4.5],
+            'volume': [10.0, 20.0, 30.0, 40.0],
+        })
+
+    def test_forming_bar_volume_changes_key(self):
+        revised = self.df.copy()
+        revised.loc[3, 'volume'] = 55.0
+        self.assertNotEqual(frame_key(self.df), frame_key(revised))
+
+    def test_revised_interior_bar_changes_key(self):
+        revised = self.df.copy()
+        revised.loc[1, 'close'] = 2.4
+        self.assertNotEqual(frame_key(self.df), frame_key(revised))
+
+    def test_copy_shares_key(self):
+        self.assertEqual(frame_key(self.df), frame_key(self.df.copy()))
+
+
+if __name__ == '__main__':
+    unittest.main()
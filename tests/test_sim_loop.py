@@ -0,0 +1,62 @@
+import unittest
+from datetime import datetime
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from backtester import enhanced_backtester
+from backtester.enhanced_backtester import EnhancedBacktester
+from utils.advanced_risk import AdvancedRiskManager
+
+
+def _visit_every_bar(needs_visit):
+    return np.arange(1, len(needs_visit) + 1, dtype=np.int64)
+
+
+def _never_skip(close, start, stop, lower, upper):
+    return start
+
+
+def _synthetic_bars(n=3000, seed=7):
+    """15-minute random walk over about a month, with long and short signals sprinkled through it."""
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.004, n)))
+    long_signal = np.zeros(n, dtype=bool)
+    long_signal[::37] = True
+    short_signal = np.zeros(n, dtype=bool)
+    short_signal[17::53] = True
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01', periods=n, freq='15min', tz='UTC'),
+        'open': close, 'high': close * 1.001, 'low': close * 0.999, 'close': close,
+        'volume': rng.uniform(1.0, 10.0, n),
+        'final_long': long_signal, 'final_short': short_signal,
+    })
+
+
+class SimulateTradingTest(unittest.TestCase):
+    def _run(self, df):
+        risk_manager = AdvancedRiskManager(initial_capital=10000.0, max_positions=3)
+        with mock.patch('utils.advanced_risk.datetime') as clock:
+            clock.now.return_value = datetime(2024, 1, 1)
+            return EnhancedBacktester()._simulate_trading(df, risk_manager, 1.0, 2.0, 3.0)
+
+    def test_skipping_bars_matches_visiting_every_bar(self):
+        df = _synthetic_bars()
+        fast = self._run(df)
+        with mock.patch.object(enhanced_backtester, 'next_visit_index', _visit_every_bar), \
+                mock.patch.object(enhanced_backtester, 'next_trigger_bar', _never_skip):
+            reference = self._run(df)
+
+        # The data has to exercise every path the skipping relies on
+        reasons = {t.get('reason') for t in reference['trades']}
+        self.assertTrue({'tp1', 'tp2', 'stop_loss'} <= reasons, reasons)
+        self.assertGreater(len(reference['daily_summaries']), 20)
+
+        self.assertEqual(fast['trades'], reference['trades'])
+        self.assertEqual(fast['daily_summaries'], reference['daily_summaries'])
+        self.assertEqual(fast['risk_summary'], reference['risk_summary'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,15 @@
+"""
+Plotly settings shared by the dashboard charts.
+Kept in an imported module so the same objects are reused across reruns.
+"""
+
+# Main price chart toolbar
+PLOTLY_CONFIG = {
+    'displaylogo': False,
+    'responsive': True,
+    'modeBarButtonsToRemove': ['select2d', 'lasso2d', 'pan2d', 'zoom2d', 'autoScale2d'],
+    'displayModeBar': True
+}
+
+# Indicator sparklines toolbar
+SPARKLINE_CONFIG = {'displaylogo': False, 'modeBarButtonsToRemove': ['select2d', 'lasso2d']}
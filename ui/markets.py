@@ -0,0 +1,42 @@
+"""
+Per-exchange market presets for the sidebar.
+Module-level constants so the pair lists and lookup sets are built once per process.
+"""
+
+from collections import namedtuple
+
+EXCHANGES = ("binance", "bybit", "mexc", "alpaca", "coinbase", "kraken")
+
+ExchangeMeta = namedtuple('ExchangeMeta', ['quote_currency', 'popular_pairs', 'popular_set', 'default_candidates'])
+
+# International crypto exchanges quote in USDT
+_USDT_POPULAR = (
+    "BTCUSDT", "ETHUSDT", "BNBUSDT", "ADAUSDT", "SOLUSDT",
+    "XRPUSDT", "DOTUSDT", "DOGEUSDT", "AVAXUSDT", "MATICUSDT",
+    "LINKUSDT", "UNIUSDT", "LTCUSDT", "ATOMUSDT", "FTMUSDT"
+)
+_USDT_POPULAR_SET = frozenset(_USDT_POPULAR)
+
+# US crypto exchanges use USD
+_USD_CRYPTO_POPULAR = (
+    "BTC-USD", "ETH-USD", "LTC-USD", "BCH-USD", "ETC-USD",
+    "XRP-USD", "ADA-USD", "DOT-USD", "LINK-USD", "UNI-USD"
+)
+_USD_CRYPTO_POPULAR_SET = frozenset(_USD_CRYPTO_POPULAR)
+
+# US stock exchanges use USD
+_STOCK_POPULAR = (
+    "BTCUSD", "ETHUSD", "AAPL", "MSFT", "GOOGL", "AMZN", "TSLA",
+    "NVDA", "META", "NFLX", "AMD", "INTC", "CRM", "ADBE", "PYPL"
+)
+_STOCK_POPULAR_SET = frozenset(_STOCK_POPULAR)
+
+DEFAULT_EXCHANGE_META = ExchangeMeta("USDT", _USDT_POPULAR, _USDT_POPULAR_SET, ("BTCUSDT", "BTC/USDT"))
+
+_USD_CRYPTO_META = ExchangeMeta("USD", _USD_CRYPTO_POPULAR, _USD_CRYPTO_POPULAR_SET, ("BTC-USD", "BTC/USD"))
+
+EXCHANGE_META = {
+    'alpaca': ExchangeMeta("USD", _STOCK_POPULAR, _STOCK_POPULAR_SET, ("BTCUSD", "BTC/USD")),
+    'coinbase': _USD_CRYPTO_META,
+    'kraken': _USD_CRYPTO_META,
+}
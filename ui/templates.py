@@ -0,0 +1,499 @@
+"""
+HTML templates for the Streamlit dashboard.
+Kept in an imported module so the markup is built once per process instead of on every rerun.
+"""
+
+import os
+import re
+from functools import lru_cache
+
+CSS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets', 'style.css')
+
+
+@lru_cache(maxsize=1)
+def load_css() -> str:
+    """Read the dashboard stylesheet once per process, stripped of comments and indentation."""
+    with open(CSS_PATH, 'r', encoding='utf-8') as f:
+        css = f.read()
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    return re.sub(r'\s*([{};,>])\s*', r'\1', css).strip()
+
+
+# Global stylesheet, emitted once per rerun as a single element
+APP_CSS = f"<style>{load_css()}</style>"
+
+SIDEBAR_HEADER_HTML = """
+    <div class="sidebar-header">
+        <h1>🚀 Trading Platform</h1>
+        <div class="subtitle">Multi-Exchange Trading Dashboard</div>
+    </div>
+    """
+
+BALANCE_REAL_TEMPLATE = """
+        <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
+                    border: 1px solid var(--border-color); margin: 1rem 0;">
+            <div style="text-align: center; margin-bottom: 1rem;">
+                <h4 style="margin: 0; color: var(--text-primary); display: flex; align-items: center; 
+                           justify-content: center; gap: 0.5rem;">
+                    💰 Real Account Balance
+                </h4>
+            </div>
+            <div style="text-align: center; margin-bottom: 1rem;">
+                <div style="font-size: 2rem; font-weight: 700; color: var(--accent-green);">
+                    ${cash:,.2f}
+                </div>
+                <div style="font-size: 0.9rem; color: var(--text-secondary);">Total Balance</div>
+            </div>
+            <div style="display: grid; gap: 0.5rem;">
+                <div style="display: flex; justify-content: space-between;">
+                    <span style="color: var(--text-secondary);">Available:</span>
+                    <span style="color: var(--accent-green); font-weight: 600;">${cash:,.2f}</span>
+                </div>
+                <div style="display: flex; justify-content: space-between;">
+                    <span style="color: var(--text-secondary);">In Orders:</span>
+                    <span style="color: var(--accent-blue); font-weight: 600;">${used:,.2f}</span>
+                </div>
+                <div style="display: flex; justify-content: space-between;">
+                    <span style="color: var(--text-secondary);">Total:</span>
+                    <span style="color: var(--text-primary); font-weight: 600;">${total:,.2f}</span>
+                </div>
+            </div>
+        </div>
+        """
+
+BALANCE_LOADING_HTML = """
+        <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
+                    border: 1px solid var(--border-color); margin: 1rem 0;">
+            <div style="text-align: center; margin-bottom: 1rem;">
+                <h4 style="margin: 0; color: var(--text-primary); display: flex; align-items: center; 
+                           justify-content: center; gap: 0.5rem;">
+                    💰 Real Account Balance
+                </h4>
+            </div>
+            <div style="text-align: center; margin-bottom: 1rem;">
+                <div style="font-size: 1.5rem; font-weight: 700; color: var(--text-secondary);">
+                    Loading...
+                </div>
+                <div style="font-size: 0.9rem; color: var(--text-secondary);">Connecting to exchange</div>
+            </div>
+            <div style="text-align: center;">
+                <div style="color: var(--text-secondary); font-size: 0.8rem;">
+                    Balance will appear automatically when connected
+                </div>
+            </div>
+        </div>
+        """
+
+BALANCE_PAPER_TEMPLATE = """
+        <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
+                    border: 1px solid var(--border-color); margin: 1rem 0;">
+            <div style="text-align: center; margin-bottom: 1rem;">
+                <h4 style="margin: 0; color: var(--text-primary); display: flex; align-items: center; 
+                           justify-content: center; gap: 0.5rem;">
+                    📊 Paper Account Balance
+                </h4>
+            </div>
+            <div style="text-align: center; margin-bottom: 1rem;">
+                <div style="font-size: 2rem; font-weight: 700; color: var(--accent-blue);">
+                    ${total:,.2f}
+                </div>
+                <div style="font-size: 0.9rem; color: var(--text-secondary);">Paper Trading Balance</div>
+            </div>
+            <div style="display: grid; gap: 0.5rem;">
+                <div style="display: flex; justify-content: space-between;">
+                    <span style="color: var(--text-secondary);">Available Cash:</span>
+                    <span style="color: var(--accent-blue); font-weight: 600;">${cash:,.2f}</span>
+                </div>
+                <div style="display: flex; justify-content: space-between;">
+                    <span style="color: var(--text-secondary);">Total Equity:</span>
+                    <span style="color: var(--text-primary); font-weight: 600;">${total:,.2f}</span>
+                </div>
+            </div>
+        </div>
+        """
+
+_BALANCE_TEMPLATES = {
+    'real': BALANCE_REAL_TEMPLATE,
+    'paper': BALANCE_PAPER_TEMPLATE,
+}
+
+
+@lru_cache(maxsize=64)
+def render_balance(kind: str, cash: float = 0.0, used: float = 0.0, total: float = 0.0) -> str:
+    """
+    Render a balance card. Callers should round values to cents so repeated
+    reruns with unchanged balances are served from the cache.
+
+    Args:
+        kind: 'real', 'paper' or 'loading'
+        cash: Available cash
+        used: Amount tied up in orders (real accounts only)
+        total: Total balance / equity
+    """
+    if kind == 'loading':
+        return BALANCE_LOADING_HTML
+    return _BALANCE_TEMPLATES[kind].format(cash=cash, used=used, total=total)
+
+POSITIONS_HEADER_TEMPLATE = """
+                <div style="background: var(--card-bg); padding: 1rem; border-radius: 8px; border: 1px solid var(--border-color); margin: 1rem 0;">
+                    <h4 style="margin: 0 0 1rem 0; color: var(--text-primary);">📈 Real Positions ({count})</h4>
+                </div>
+                """
+
+POSITION_CARD_TEMPLATE = """
+                    <div style="background: var(--secondary-bg); padding: 0.75rem; border-radius: 6px; margin: 0.5rem 0; border-left: 4px solid {color};">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <span style="color: var(--text-primary); font-weight: 600;">{symbol}</span>
+                            <span style="color: {color}; font-weight: 600;">${pnl:,.2f}</span>
+                        </div>
+                        <div style="color: var(--text-secondary); font-size: 0.9rem;">
+                            {side} • Size: {size}
+                        </div>
+                    </div>
+                    """
+
+NO_POSITIONS_HTML = """
+                <div style="background: var(--card-bg); padding: 1rem; border-radius: 8px; border: 1px solid var(--border-color); margin: 1rem 0; text-align: center;">
+                    <h4 style="margin: 0 0 0.5rem 0; color: var(--text-primary);">📈 Real Positions</h4>
+                    <p style="color: var(--text-secondary); margin: 0;">No open positions</p>
+                </div>
+                """
+
+ORDERS_HEADER_TEMPLATE = """
+                <div style="background: var(--card-bg); padding: 1rem; border-radius: 8px; border: 1px solid var(--border-color); margin: 1rem 0;">
+                    <h4 style="margin: 0 0 1rem 0; color: var(--text-primary);">📋 Real Orders ({count})</h4>
+                </div>
+                """
+
+ORDER_CARD_TEMPLATE = """
+                    <div style="background: var(--secondary-bg); padding: 0.75rem; border-radius: 6px; margin: 0.5rem 0;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <span style="color: var(--text-primary); font-weight: 600;">{symbol}</span>
+                            <span style="color: var(--text-secondary); font-size: 0.9rem;">{status}</span>
+                        </div>
+                        <div style="color: var(--text-secondary); font-size: 0.9rem;">
+                            {side} • Qty: {qty} • ID: {order_id}...
+                        </div>
+                    </div>
+                    """
+
+NO_ORDERS_HTML = """
+                <div style="background: var(--card-bg); padding: 1rem; border-radius: 8px; border: 1px solid var(--border-color); margin: 1rem 0; text-align: center;">
+                    <h4 style="margin: 0 0 0.5rem 0; color: var(--text-primary);">📋 Real Orders</h4>
+                    <p style="color: var(--text-secondary); margin: 0;">No open orders</p>
+                </div>
+                """
+
+
+def render_positions(positions: list, pnls, colors, limit: int = 5) -> str:
+    """
+    Header plus the first `limit` position cards as one HTML string.
+
+    Args:
+        positions: Position dicts from the executor
+        pnls: Unrealized PnL per shown position
+        colors: CSS colour per shown position
+        limit: Number of cards to render
+    """
+    parts = [POSITIONS_HEADER_TEMPLATE.format(count=len(positions))]
+    parts.extend(
+        POSITION_CARD_TEMPLATE.format(
+            symbol=pos.get('symbol', 'Unknown'),
+            side=pos.get('side', 'Unknown'),
+            size=pos.get('size', 0),
+            pnl=pnl,
+            color=color,
+        )
+        for pos, pnl, color in zip(positions[:limit], pnls, colors)
+    )
+    return "".join(parts)
+
+
+def render_orders(orders: list, limit: int = 5) -> str:
+    """Header plus the first `limit` open-order cards as one HTML string."""
+    parts = [ORDERS_HEADER_TEMPLATE.format(count=len(orders))]
+    parts.extend(
+        ORDER_CARD_TEMPLATE.format(
+            symbol=order.get('symbol', 'Unknown'),
+            status=order.get('orderStatus', 'Unknown'),
+            side=order.get('side', 'Unknown'),
+            qty=order.get('qty', 0),
+            order_id=order.get('orderId', 'Unknown')[:8],
+        )
+        for order in orders[:limit]
+    )
+    return "".join(parts)
+
+
+# Static panels and section headers for the main page
+
+ACCOUNT_VALIDATED_HTML = """
+            <div style="background: var(--accent-green); color: white; padding: 1rem; border-radius: 8px; margin: 1rem 0; text-align: center; font-weight: 600;">
+                ✅ ACCOUNT VALIDATED - Ready for Real Trading
+            </div>
+            """
+
+PAPER_MODE_BANNER_HTML = """
+            <div style="background: var(--accent-blue); color: white; padding: 1rem; border-radius: 8px; margin: 1rem 0; text-align: center; font-weight: 600;">
+                📝 PAPER TRADING MODE - Safe Practice Environment
+            </div>
+            """
+
+REAL_MODE_BANNER_HTML = """
+            <div style="background: var(--accent-green); color: white; padding: 1rem; border-radius: 8px; margin: 1rem 0; text-align: center; font-weight: 600;">
+                🚀 REAL TRADING MODE - Live Trading Enabled
+            </div>
+            """
+
+DASHBOARD_HEADER_HTML = """
+<div style="background: linear-gradient(135deg, var(--accent-blue), var(--accent-purple)); 
+            padding: 2rem; border-radius: var(--border-radius); margin-bottom: 2rem; 
+            text-align: center; color: white;">
+    <h1 style="margin: 0; font-size: 2.5rem; font-weight: 700; text-shadow: 0 2px 4px rgba(0,0,0,0.3);">
+        📊 Live Trading Dashboard
+    </h1>
+    <p style="margin: 0.5rem 0 0 0; font-size: 1.1rem; opacity: 0.9;">
+        Real-time market analysis and automated trading
+    </p>
+</div>
+"""
+
+MARKET_DATA_ERROR_TEMPLATE = """
+        <div style="background: var(--card-bg); padding: 1.5rem; border-radius: var(--border-radius); 
+                    border: 1px solid var(--border-color); margin: 1rem 0;">
+            <h3 style="color: var(--accent-red); margin-top: 0;">⚠️ Unable to Load Market Data</h3>
+            <p style="color: var(--text-secondary); margin-bottom: 1rem;">
+                Please check your internet connection and exchange settings. 
+                Make sure the selected trading pair is available on the chosen exchange.
+            </p>
+            <div style="background: var(--secondary-bg); padding: 1rem; border-radius: 8px; 
+                        border-left: 4px solid var(--accent-red);">
+                <strong>Error Details:</strong><br>
+                <code style="color: var(--text-primary);">{}</code>
+            </div>
+        </div>
+        """
+
+PRICE_CHART_HEADER_HTML = """
+<div class="card">
+    <h3 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; gap: 0.5rem;">
+        📊 Price Chart & Technical Analysis
+    </h3>
+"""
+
+INDICATORS_HEADER_HTML = """
+<div class="card">
+    <h3 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; gap: 0.5rem;">
+        📊 Technical Indicators
+    </h3>
+"""
+
+TRADING_STATUS_HEADER_HTML = """
+<div class="card">
+    <h3 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; gap: 0.5rem;">
+        💼 Trading Status & Positions
+    </h3>
+"""
+
+NO_OPEN_POSITION_HTML = """
+        <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
+                    border: 1px solid var(--border-color); text-align: center;">
+            <h4 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; justify-content: center; gap: 0.5rem;">
+                ⏳ No Open Position
+            </h4>
+            <p style="color: var(--text-secondary); margin: 0;">
+                Waiting for next trading signal...
+            </p>
+        </div>
+        """
+
+RECENT_TRADES_HEADER_HTML = """
+        <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
+                    border: 1px solid var(--border-color);">
+            <h4 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; gap: 0.5rem;">
+                📋 Recent Trades
+            </h4>
+        </div>
+        """
+
+NO_RECENT_TRADES_HTML = """
+        <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
+                    border: 1px solid var(--border-color); text-align: center;">
+            <h4 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; justify-content: center; gap: 0.5rem;">
+                📊 No Trades Yet
+            </h4>
+            <p style="color: var(--text-secondary); margin: 0;">
+                Start trading to see your trade history here.
+            </p>
+        </div>
+        """
+
+INDICATOR_TRENDS_HEADER_HTML = """
+<div class="card">
+    <h3 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; gap: 0.5rem;">
+        📈 Indicator Trends
+    </h3>
+"""
+
+ANALYSIS_TOOLS_HEADER_HTML = """
+<div class="card">
+    <h3 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; gap: 0.5rem;">
+        📊 Market Analysis & Tools
+    </h3>
+"""
+
+ACCOUNT_TAB_HTML = """
+    <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
+                border: 1px solid var(--border-color); text-align: center;">
+        <h4 style="margin: 0 0 1rem 0; color: var(--text-primary);">
+            📊 Account Information
+        </h4>
+        <p style="color: var(--text-secondary); margin: 0;">
+            Balance information is now displayed in the sidebar for easy access.
+        </p>
+    </div>
+    """
+
+REAL_TRADES_HEADER_HTML = """
+            <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
+                        border: 1px solid var(--border-color);">
+                <h4 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; gap: 0.5rem;">
+                    📋 Real Trading History
+                </h4>
+            </div>
+            """
+
+NO_REAL_TRADES_HTML = """
+            <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
+                        border: 1px solid var(--border-color); text-align: center;">
+                <h4 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; justify-content: center; gap: 0.5rem;">
+                    📊 No Real Trades Yet
+                </h4>
+                <p style="color: var(--text-secondary); margin: 0;">
+                    Start real trading to see your trade history here.
+                </p>
+            </div>
+            """
+
+SIM_TRADES_HEADER_HTML = """
+            <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
+                        border: 1px solid var(--border-color);">
+                <h4 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; gap: 0.5rem;">
+                    📋 Simulated Trade History
+                </h4>
+            </div>
+            """
+
+NO_SIM_TRADES_HTML = """
+            <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
+                        border: 1px solid var(--border-color); text-align: center;">
+                <h4 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; justify-content: center; gap: 0.5rem;">
+                    📊 No Trades Yet
+                </h4>
+                <p style="color: var(--text-secondary); margin: 0;">
+                    Start trading to see your trade history here.
+                </p>
+            </div>
+            """
+
+MARKET_DATA_HEADER_HTML = """
+        <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
+                    border: 1px solid var(--border-color);">
+            <h4 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; gap: 0.5rem;">
+                📈 Market Data
+            </h4>
+        </div>
+        """
+
+ARB_SCANNER_HEADER_HTML = """
+        <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
+                    border: 1px solid var(--border-color);">
+            <h4 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; gap: 0.5rem;">
+                🔍 Arbitrage Scanner
+            </h4>
+        </div>
+        """
+
+NO_ARB_OPPORTUNITIES_HTML = """
+                <div style="background: var(--card-bg); padding: 1rem; border-radius: 8px; 
+                            border: 1px solid var(--border-color); text-align: center;">
+                    <div style="color: var(--text-secondary);">
+                        🔍 No arbitrage opportunities found
+                    </div>
+                </div>
+                """
+
+ARB_DISABLED_HTML = """
+        <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
+                    border: 1px solid var(--border-color); text-align: center;">
+            <h4 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; justify-content: center; gap: 0.5rem;">
+                🔍 Arbitrage Scanner
+            </h4>
+            <p style="color: var(--text-secondary); margin: 0;">
+                Scanner is currently disabled. Enable it in the sidebar to start scanning for arbitrage opportunities.
+            </p>
+        </div>
+        """
+
+ORDER_MANAGEMENT_HEADER_HTML = """
+    <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
+                border: 1px solid var(--border-color);">
+        <h4 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; gap: 0.5rem;">
+            ⚙️ Order Management
+        </h4>
+    </div>
+    """
+
+NO_OPEN_ORDERS_HTML = """
+            <div style="background: var(--card-bg); padding: 1rem; border-radius: 8px; 
+                        border: 1px solid var(--border-color); text-align: center;">
+                <h4 style="margin: 0 0 1rem 0; color: var(--text-primary);">📋 No Open Orders</h4>
+                <p style="color: var(--text-secondary); margin: 0;">No orders to manage</p>
+            </div>
+            """
+
+ORDER_MANAGEMENT_PAPER_HTML = """
+            <div style="background: var(--card-bg); padding: 1rem; border-radius: 8px; 
+                        border: 1px solid var(--border-color); text-align: center;">
+                <h4 style="margin: 0 0 1rem 0; color: var(--text-primary);">📝 Paper Trading Mode</h4>
+                <p style="color: var(--text-secondary); margin: 0;">Order management not available in paper trading mode</p>
+            </div>
+            """
+
+ORDER_MANAGEMENT_LOCKED_HTML = """
+            <div style="background: var(--card-bg); padding: 1rem; border-radius: 8px; 
+                        border: 1px solid var(--border-color); text-align: center;">
+                <h4 style="margin: 0 0 1rem 0; color: var(--text-primary);">🔐 Real Trading Required</h4>
+                <p style="color: var(--text-secondary); margin: 0;">Enable real trading and fetch account data to manage orders</p>
+            </div>
+            """
+
+ERROR_LOG_HEADER_HTML = """
+    <div style="background: var(--secondary-bg); padding: 1.5rem; border-radius: var(--border-radius); 
+                border: 1px solid var(--border-color);">
+        <h4 style="margin: 0 0 1rem 0; color: var(--text-primary); display: flex; align-items: center; gap: 0.5rem;">
+            🚨 Error Log & Diagnostics
+        </h4>
+    </div>
+    """
+
+NO_ERRORS_HTML = """
+        <div style="background: var(--card-bg); padding: 1rem; border-radius: 8px; 
+                    border: 1px solid var(--border-color); text-align: center;">
+            <h4 style="margin: 0 0 1rem 0; color: var(--text-primary);">✅ No Errors</h4>
+            <p style="color: var(--text-secondary); margin: 0;">No errors have been logged recently</p>
+        </div>
+        """
+
+FOOTER_HTML = """
+<div style="background: var(--card-bg); padding: 1.5rem; border-radius: var(--border-radius); 
+            border: 1px solid var(--border-color); margin-top: 2rem; text-align: center;">
+    <div style="color: var(--text-secondary); font-size: 0.9rem;">
+        <p style="margin: 0; font-size: 0.8rem;">
+            Developed by <strong style="color: var(--accent-blue);">Mushfiqur Rahaman</strong> • 
+            Multi-Exchange Trading Platform v2.0
+        </p>
+    </div>
+</div>
+"""
@@ -0,0 +1,68 @@
+import numpy as np
+from typing import Iterable
+
+
+class EquityBuffer:
+    """
+    Fixed-capacity float64 ring buffer for the session equity curve.
+    Appends overwrite the oldest sample once full, so long-running sessions use constant memory.
+    """
+
+    def __init__(self, values: Iterable[float] = (), capacity: int = 100_000):
+        self._buf = np.empty(int(capacity), dtype=np.float64)
+        self._count = 0
+        self.extend(values)
+
+    def append(self, value: float):
+        self._buf[self._count % len(self._buf)] = value
+        self._count += 1
+
+    def extend(self, values: Iterable[float]):
+        arr = np.asarray(values, dtype=np.float64).ravel()
+        cap = len(self._buf)
+        if len(arr) >= cap:
+            # Only the newest `cap` samples survive; restart the ring from them
+            self._buf[:] = arr[-cap:]
+            self._count = cap
+            return
+        # At most two slice writes: up to the end of the ring, then wrapped to the front
+        start = self._count % cap
+        first = min(len(arr), cap - start)
+        self._buf[start:start + first] = arr[:first]
+        self._buf[:len(arr) - first] = arr[first:]
+        self._count += len(arr)
+
+    def __len__(self) -> int:
+        return min(self._count, len(self._buf))
+
+    def __getitem__(self, idx):
+        if isinstance(idx, (int, np.integer)):
+            n = len(self)
+            if not -n <= idx < n:
+                raise IndexError('equity index out of range')
+            start = self._count - n
+            return float(self._buf[(start + idx % n) % len(self._buf)])
+        return self.to_numpy()[idx]
+
+    def view(self) -> np.ndarray:
+        """
+        Read-only samples oldest to newest. Zero-copy until the ring wraps; only valid
+        until the next append, so take to_numpy() for anything kept across reruns.
+        """
+        if self._count > len(self._buf):
+            return self.to_numpy()
+        arr = self._buf[:self._count]
+        arr.flags.writeable = False
+        return arr
+
+    def to_numpy(self) -> np.ndarray:
+        """Samples oldest to newest as a new array."""
+        cap = len(self._buf)
+        if self._count <= cap:
+            return self._buf[:self._count].copy()
+        head = self._count % cap
+        return np.concatenate((self._buf[head:], self._buf[:head]))
+
+    def __array__(self, dtype=None, copy=None):
+        arr = self.to_numpy()
+        return arr if dtype is None else arr.astype(dtype, copy=False)
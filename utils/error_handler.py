@@ -4,10 +4,14 @@ Provides comprehensive error handling, logging, and user-friendly error messages
 """
 
 import time
+import threading
 import traceback
+from collections import deque
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+import pandas as pd
+
 class TradingError(Exception):
     """Custom exception for trading-related errors"""
     def __init__(self, message: str, error_type: str = "TRADING_ERROR", details: Dict[str, Any] = None):
@@ -50,31 +54,63 @@ class OrderError(TradingError):
             "side": side
         })
 
+# Display colour and icon per error family, matched against the exception class name
+_TYPE_STYLE = {
+    'API': ('var(--accent-red)', '🔌'),
+    'Validation': ('var(--accent-blue)', '⚠️'),
+    'Trading': ('var(--accent-green)', '📈'),
+}
+_DEFAULT_STYLE = ('var(--text-secondary)', '❓')
+_style_by_type: Dict[str, tuple] = {}
+
+def error_style(type_name: str) -> tuple:
+    """(colour, icon) for an exception class name; resolved once per class name."""
+    style = _style_by_type.get(type_name)
+    if style is None:
+        style = next((v for k, v in _TYPE_STYLE.items() if k in type_name), _DEFAULT_STYLE)
+        _style_by_type[type_name] = style
+    return style
+
+def errors_frame(errors: list) -> pd.DataFrame:
+    """Table of logged errors, newest first; an empty log gives an empty table with the same columns."""
+    rows = errors[::-1]
+    return pd.DataFrame({
+        'timestamp': [str(e['timestamp'])[:19] for e in rows],
+        # Icons were resolved when each error was logged
+        'type': [f"{e.get('style', _DEFAULT_STYLE)[1]} {e['type']}" for e in rows],
+        'message': [e['message'] for e in rows],
+        'id': [e['id'] for e in rows],
+    }, columns=['timestamp', 'type', 'message', 'id'])
+
 class ErrorHandler:
     """Centralized error handling and logging"""
     
     def __init__(self):
-        self.error_log = []
         self.max_log_size = 1000
+        # Shared by every Streamlit session in the process; the deque bounds it and the lock guards it
+        self.error_log = deque(maxlen=self.max_log_size)
+        self._lock = threading.Lock()
+        # Bumped on every change so readers can tell when their snapshot is stale
+        self.version = 0
     
     def log_error(self, error: Exception, context: Dict[str, Any] = None) -> str:
         """Log an error and return error ID"""
         error_id = f"ERR_{int(time.time() * 1000)}"
         
+        type_name = type(error).__name__
         error_entry = {
             "id": error_id,
             "timestamp": datetime.now().isoformat(),
-            "type": type(error).__name__,
+            "type": type_name,
+            "style": error_style(type_name),
             "message": str(error),
             "context": context or {},
             "traceback": traceback.format_exc()
         }
         
-        self.error_log.append(error_entry)
-        
-        # Keep log size manageable
-        if len(self.error_log) > self.max_log_size:
-            self.error_log = self.error_log[-self.max_log_size:]
+        with self._lock:
+            self.error_log.append(error_entry)
+            self.version += 1
         
         return error_id
     
@@ -159,11 +195,14 @@ class ErrorHandler:
     
     def get_recent_errors(self, limit: int = 10) -> list:
         """Get recent errors from log"""
-        return self.error_log[-limit:]
+        with self._lock:
+            return list(self.error_log)[-limit:]
     
     def clear_errors(self):
         """Clear error log"""
-        self.error_log = []
+        with self._lock:
+            self.error_log.clear()
+            self.version += 1
 
 # Global error handler instance
 error_handler = ErrorHandler()
@@ -1,7 +1,16 @@
 import os
 import csv
+import time
+import atexit
+import threading
 from datetime import datetime
 
+# Equity rows waiting to be appended, per file; flushed in batches by log_pnl_buffered
+_pnl_buffers = {}
+_pnl_last_flush = {}
+# Reentrant so callers already holding it can write; writes happen under it to keep rows in order
+_pnl_lock = threading.RLock()
+
 
 def _ensure_dir(path: str):
     os.makedirs(os.path.dirname(path), exist_ok=True)
@@ -26,13 +35,43 @@ def log_trade(file_path: str, record: dict):
         print(f"REAL_TRADE_LOGGED on {exchange}: {record}")
 
 
+def _write_pnl_rows(file_path: str, rows: list):
+    with _pnl_lock:
+        _ensure_dir(file_path)
+        exists = os.path.exists(file_path)
+        with open(file_path, 'a', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=['ts','equity'])
+            if not exists:
+                writer.writeheader()
+            writer.writerows(rows)
+
+
 def log_pnl(file_path: str, equity: float):
-    _ensure_dir(file_path)
-    exists = os.path.exists(file_path)
-    with open(file_path, 'a', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=['ts','equity'])
-        if not exists:
-            writer.writeheader()
-        writer.writerow({'ts': datetime.utcnow().isoformat(), 'equity': float(equity)})
+    _write_pnl_rows(file_path, [{'ts': datetime.utcnow().isoformat(), 'equity': float(equity)}])
+
+
+def log_pnl_buffered(file_path: str, equity: float, batch_size: int = 32, max_age: float = 60.0):
+    """
+    Queue an equity row and append the queue to the CSV once it holds `batch_size`
+    rows or the last write is older than `max_age` seconds.
+    """
+    now = time.monotonic()
+    with _pnl_lock:
+        buf = _pnl_buffers.setdefault(file_path, [])
+        buf.append({'ts': datetime.utcnow().isoformat(), 'equity': float(equity)})
+        last = _pnl_last_flush.setdefault(file_path, now)
+        if len(buf) < batch_size and now - last < max_age:
+            return
+        rows, _pnl_buffers[file_path] = buf, []
+        _pnl_last_flush[file_path] = now
+        _write_pnl_rows(file_path, rows)
 
 
+@atexit.register
+def flush_pnl():
+    """Write out any queued equity rows."""
+    with _pnl_lock:
+        for path, rows in _pnl_buffers.items():
+            if rows:
+                _write_pnl_rows(path, rows)
+        _pnl_buffers.clear()
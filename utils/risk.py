@@ -16,3 +16,7 @@ def apply_sl_tp(entry_price: float, price: float, stop_loss_pct: float, take_pro
     return False
 
 
+def should_exit_position(price: float, stop_price: float, tp_price: float, bars_in_trade: int,
+                         max_bars: int, wt_cross_down: bool) -> bool:
+    """Exit on stop-loss, take-profit, a WaveTrend cross down or when the trade has run max_bars bars."""
+    return price <= stop_price or price >= tp_price or wt_cross_down or bars_in_trade >= max_bars